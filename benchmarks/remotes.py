@@ -0,0 +1,176 @@
+"""Local stand-ins for the GitHub endpoints skillchef talks to.
+
+Git sources clone from bare repos over ``file://``; HTTP requests for
+api.github.com, codeload.github.com, raw.githubusercontent.com and gist hosts are
+rewritten to a threaded ``http.server`` that serves a directory laid out as
+``<host>/<path>``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import threading
+from email.utils import formatdate
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+from skillchef import remote
+
+UPSTREAM_HOSTS = frozenset(
+    {
+        "api.github.com",
+        "codeload.github.com",
+        "raw.githubusercontent.com",
+        "gist.github.com",
+        "gist.githubusercontent.com",
+    }
+)
+OWNER = "acme"
+REPO = "skills"
+REF = "main"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _redirect(request: httpx.Request, origin: httpx.URL) -> httpx.Request:
+    if request.url.host not in UPSTREAM_HOSTS:
+        return request
+    url = origin.copy_with(path=f"/{request.url.host}{request.url.path}")
+    headers = [(k, v) for k, v in request.headers.multi_items() if k.lower() != "host"]
+    return httpx.Request(request.method, url, headers=headers, content=request.content)
+
+
+class _RedirectTransport(httpx.BaseTransport):
+    def __init__(self, origin: httpx.URL) -> None:
+        self._origin = origin
+        self._inner = httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._inner.handle_request(_redirect(request, self._origin))
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class LocalRemotes:
+    """Upstream files for one benchmark run, served without touching the network."""
+
+    def __init__(self, root: Path) -> None:
+        self.http_root = root / "http"
+        self.git_root = root / "git"
+        self.work_tree = root / "git-work"
+        self.http_root.mkdir(parents=True)
+        self._server: ThreadingHTTPServer | None = None
+        self._client: httpx.Client | None = None
+        self._mtime = 1_700_000_000
+
+    def start(self) -> None:
+        handler = partial(_QuietHandler, directory=str(self.http_root))
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self._init_repo()
+        self._install()
+
+    def stop(self) -> None:
+        if self._client is not None:
+            self._client.close()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def _install(self) -> None:
+        assert self._server is not None
+        host, port = self._server.server_address[:2]
+        origin = httpx.URL(f"http://{host}:{port}/")
+        self._client = httpx.Client(
+            transport=_RedirectTransport(origin),
+            follow_redirects=True,
+            timeout=remote.REQUEST_TIMEOUT_SECONDS,
+        )
+        client = self._client
+        remote.http_client = lambda: client
+        remote._github_clone_url = self.clone_url
+
+    def clone_url(self, owner: str, repo: str) -> str:
+        return (self.git_root / owner / f"{repo}.git").as_uri()
+
+    def github_source(self, name: str) -> str:
+        return f"https://github.com/{OWNER}/{REPO}/tree/{REF}/skills/{name}"
+
+    def raw_source(self, name: str) -> str:
+        return f"https://raw.githubusercontent.com/{OWNER}/{REPO}/{REF}/skills/{name}/SKILL.md"
+
+    def gist_source(self, gist_id: str) -> str:
+        return f"https://gist.github.com/{OWNER}/{gist_id}"
+
+    def write_raw(self, name: str, text: str) -> None:
+        path = self.http_root / "raw.githubusercontent.com" / OWNER / REPO / REF / "skills"
+        self._write(path / name / "SKILL.md", text)
+
+    def write_gist(self, gist_id: str, text: str) -> None:
+        payload = {"id": gist_id, "files": {"SKILL.md": {"filename": "SKILL.md", "content": text}}}
+        self._write(self.http_root / "api.github.com" / "gists" / gist_id, json.dumps(payload))
+
+    def write_git(self, files: dict[str, str]) -> str:
+        """Commit ``files`` (paths relative to ``skills/``) to the repo and return the sha."""
+        for rel_path, text in files.items():
+            dest = self.work_tree / "skills" / rel_path
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_text(text)
+        self._git("add", "-A")
+        self._git("commit", "-q", "--allow-empty", "-m", "bench")
+        self._git("push", "-q", "origin", f"HEAD:{REF}")
+        sha = self._git("rev-parse", "HEAD").strip()
+        commit_path = self.http_root / "api.github.com" / "repos" / OWNER / REPO / "commits" / REF
+        self._write(commit_path, json.dumps({"sha": sha}))
+        tarball = self.http_root / "codeload.github.com" / OWNER / REPO / "tar.gz" / REF
+        tarball.parent.mkdir(parents=True, exist_ok=True)
+        self._git("archive", "--format=tar.gz", f"--prefix={REPO}-{sha}/", "-o", str(tarball), sha)
+        return sha
+
+    def last_modified(self) -> str:
+        """``Last-Modified`` value the server sends for files written in the current round."""
+        return formatdate(self._mtime, usegmt=True)
+
+    def next_round(self) -> None:
+        """Move upstream mtimes forward so conditional requests see the next round as new."""
+        self._mtime += 10
+
+    def _write(self, path: Path, text: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        os.utime(path, (self._mtime, self._mtime))
+
+    def _init_repo(self) -> None:
+        bare = self.git_root / OWNER / f"{REPO}.git"
+        bare.mkdir(parents=True)
+        self._git("init", "-q", "--bare", cwd=bare)
+        self._git("config", "uploadpack.allowFilter", "true", cwd=bare)
+        self.work_tree.mkdir()
+        self._git("init", "-q", "-b", REF)
+        self._git("remote", "add", "origin", bare.as_uri())
+
+    def _git(self, *args: str, cwd: Path | None = None) -> str:
+        env = {
+            **os.environ,
+            "GIT_AUTHOR_NAME": "bench",
+            "GIT_AUTHOR_EMAIL": "bench@example.com",
+            "GIT_COMMITTER_NAME": "bench",
+            "GIT_COMMITTER_EMAIL": "bench@example.com",
+        }
+        return subprocess.run(
+            ["git", *args],
+            cwd=cwd or self.work_tree,
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
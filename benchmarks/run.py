@@ -0,0 +1,330 @@
+"""Time skillchef's hot paths against synthetic stores and local remotes.
+
+    uv run python benchmarks/run.py --sizes 10,1000,10000
+    uv run python benchmarks/run.py --compare benchmarks/results/<old>.json
+
+Every run writes a JSON file keyed by the current commit so results can be
+compared across commits. Nothing here touches the network or ``~/.skillchef``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import tomli_w
+from remotes import LocalRemotes
+from rich.console import Console
+
+from skillchef import config, objects, remote, store, ui
+from skillchef.commands import list_cmd, serve_cmd, sync_cmd
+
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = BENCH_DIR / "results"
+DEFAULT_SIZES = (10, 1000)
+DEFAULT_REPEAT = 3
+# Git and gist sources are a slice of the store; the rest are raw HTTP files.
+MAX_GIT_SKILLS = 50
+MAX_GIST_SKILLS = 50
+# Share of skills carrying a local edit, so serve diffing has something to show.
+EDITED_EVERY = 10
+
+
+@dataclass
+class Result:
+    scenario: str
+    size: int
+    runs: list[float]
+
+    @property
+    def best(self) -> float:
+        return min(self.runs)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.runs)
+
+
+@dataclass(frozen=True)
+class Skill:
+    name: str
+    kind: str  # "git", "gist" or "raw"
+
+    @property
+    def source_key(self) -> str:
+        return self.name.replace("-", "")
+
+
+def skill_text(name: str, round_: int) -> str:
+    sections = "".join(
+        f"## Step {step}\n\nDo part {step} of {name}; revision {round_}.\n\n" for step in range(8)
+    )
+    return (
+        f"---\nname: {name}\ndescription: Synthetic benchmark skill {name}\n---\n\n"
+        f"# {name}\n\n{sections}"
+    )
+
+
+class Bench:
+    """One synthetic store of ``size`` skills plus the upstreams they were cooked from."""
+
+    def __init__(self, root: Path, size: int) -> None:
+        self.root = root
+        self.size = size
+        self.round = 0
+        self.remotes = LocalRemotes(root / "upstream")
+        git_count = max(1, min(size // 5, MAX_GIT_SKILLS))
+        gist_count = max(1, min(size // 5, MAX_GIST_SKILLS))
+        self.skills = [
+            Skill(
+                f"skill-{i:05d}",
+                "git" if i < git_count else "gist" if i < git_count + gist_count else "raw",
+            )
+            for i in range(size)
+        ]
+
+    def source(self, skill: Skill) -> str:
+        if skill.kind == "git":
+            return self.remotes.github_source(skill.name)
+        if skill.kind == "gist":
+            return self.remotes.gist_source(skill.source_key)
+        return self.remotes.raw_source(skill.name)
+
+    def publish(self) -> str:
+        """Write the current round of every skill upstream; return the git commit sha."""
+        git_files: dict[str, str] = {}
+        for skill in self.skills:
+            text = skill_text(skill.name, self.round)
+            if skill.kind == "git":
+                git_files[f"{skill.name}/SKILL.md"] = text
+            elif skill.kind == "gist":
+                self.remotes.write_gist(skill.source_key, text)
+            else:
+                self.remotes.write_raw(skill.name, text)
+        return self.remotes.write_git(git_files)
+
+    def change_upstream(self) -> None:
+        self.round += 1
+        self.remotes.next_round()
+        self.publish()
+
+    def populate(self) -> None:
+        """Lay the store out as ``cook`` would, without rewriting the index per skill."""
+        sha = self.publish()
+        staging = self.root / "staging"
+        root = config.ensure_store(scope="global")
+        for index, skill in enumerate(self.skills):
+            fetched = staging / skill.name
+            fetched.mkdir(parents=True)
+            (fetched / "SKILL.md").write_text(skill_text(skill.name, self.round))
+            sd = root / skill.name
+            sd.mkdir()
+            objects.link_tree(fetched, sd / "base", scope="global")
+            objects.clone_tree(sd / "base", sd / "live")
+            if index % EDITED_EVERY == 0:
+                live = sd / "live" / "SKILL.md"
+                live.write_text(live.read_text() + "\n## Local notes\n\nEdited locally.\n")
+            meta = self._meta(skill, sha, sd)
+            (sd / "meta.toml").write_bytes(tomli_w.dumps(meta).encode())
+        shutil.rmtree(staging)
+
+    def _meta(self, skill: Skill, sha: str, sd: Path) -> dict[str, object]:
+        source = self.source(skill)
+        kind = "github" if skill.kind in {"git", "gist"} else "http"
+        meta: dict[str, object] = {
+            "name": skill.name,
+            "remote_url": source,
+            "remote_type": kind,
+            "base_sha256": store.hash_dir(sd / "base"),
+            "last_sync": datetime.now(timezone.utc).isoformat(),
+            "platforms": [],
+            "enabled": True,
+            "active_flavor": store.DEFAULT_FLAVOR_NAME,
+            "source_etag": "",
+            "source_last_modified": "",
+        }
+        if skill.kind == "git":
+            meta.update(remote.source_metadata(source, kind) | {"source_commit_sha": sha})
+        else:
+            meta.update(remote.source_metadata(source, kind))
+            meta["source_last_modified"] = self.remotes.last_modified()
+        return meta
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _sync(report: Path) -> None:
+    try:
+        sync_cmd.run_batch(None, policy="auto-safe", report=str(report), scope="global")
+    except SystemExit as exc:
+        failed = [line for line in report.read_text().splitlines() if '"error"' in line]
+        raise RuntimeError(f"sync reported errors: {failed[:3]}") from exc
+
+
+def _hash_store() -> None:
+    root = config.store_dir(scope="global")
+    for sd in root.iterdir():
+        if sd.is_dir():
+            store.hash_dir(sd / "live")
+
+
+def _serve_diff() -> None:
+    root = config.store_dir(scope="global")
+    for sd in root.iterdir():
+        if sd.is_dir():
+            serve_cmd._diff_directories(sd / "base", sd / "live")
+
+
+def _cook(bench: Bench, skill: Skill) -> None:
+    fetched, kind = remote.fetch(bench.source(skill))
+    try:
+        store.cook(f"cooked-{skill.kind}", fetched, bench.source(skill), kind, [], scope="global")
+    finally:
+        shutil.rmtree(fetched.parent, ignore_errors=True)
+
+
+def run_size(size: int, repeat: int, workdir: Path) -> list[Result]:
+    home = workdir / f"home-{size}"
+    skillchef_home = home / ".skillchef"
+    config.SKILLCHEF_HOME = skillchef_home
+    config.CONFIG_PATH = skillchef_home / "config.toml"
+    config.STORE_DIR = skillchef_home / "store"
+    config.PLATFORMS = {name: home / f".{name}" / "skills" for name in config.PLATFORMS}
+    config.save({**config.DEFAULT_CONFIG, "platforms": ["codex"]}, scope="global")
+
+    bench = Bench(home, size)
+    bench.remotes.start()
+    try:
+        print(f"[{size}] building store", file=sys.stderr)
+        bench.populate()
+        return list(_scenarios(bench, repeat, home))
+    finally:
+        bench.remotes.stop()
+
+
+def _scenarios(bench: Bench, repeat: int, home: Path):
+    size = bench.size
+    root = config.store_dir(scope="global")
+    report = home / "sync-report.ndjson"
+    by_kind = {skill.kind: skill for skill in bench.skills}
+
+    def measure(name: str, fn: Callable[[], object], setup: Callable[[], object] | None = None):
+        print(f"[{size}] {name}", file=sys.stderr)
+        runs = []
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            runs.append(_timed(fn))
+        return Result(name, size, runs)
+
+    def drop_index() -> None:
+        (root / store.INDEX_FILENAME).unlink(missing_ok=True)
+
+    def drop_hash_cache() -> None:
+        store.flush_hash_cache()
+        config.hash_cache_path().unlink(missing_ok=True)
+
+    yield measure("list (cold index)", lambda: store.list_skills(scope="global"), drop_index)
+    yield measure("list", lambda: list_cmd.run(scope="global"))
+    yield measure("hash_dir (cold)", _hash_store, drop_hash_cache)
+    yield measure("hash_dir (warm)", _hash_store)
+    yield measure("serve diff", _serve_diff)
+    yield measure("sync (no change)", lambda: _sync(report))
+    yield measure("sync (all changed)", lambda: _sync(report), bench.change_upstream)
+    yield measure("cook (git)", lambda: _cook(bench, by_kind["git"]))
+    if "raw" in by_kind:
+        yield measure("cook (http)", lambda: _cook(bench, by_kind["raw"]))
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCH_DIR,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _print_results(results: list[Result], baseline: dict[tuple[str, int], float]) -> None:
+    header = f"{'scenario':<22}{'size':>7}{'best':>10}{'median':>10}"
+    if baseline:
+        header += f"{'before':>10}{'change':>9}"
+    print(header)
+    for result in results:
+        line = f"{result.scenario:<22}{result.size:>7}{result.best:>10.4f}{result.median:>10.4f}"
+        before = baseline.get((result.scenario, result.size))
+        if before:
+            line += f"{before:>10.4f}{(result.median - before) / before:>+9.1%}"
+        print(line)
+
+
+def _load_baseline(path: Path) -> dict[tuple[str, int], float]:
+    data = json.loads(path.read_text())
+    return {(entry["scenario"], entry["size"]): entry["median"] for entry in data["results"]}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated store sizes (default: %(default)s).",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--output", type=Path, help="Results file (default: results/<commit>.json)."
+    )
+    parser.add_argument("--compare", type=Path, help="Earlier results file to compare against.")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    baseline = _load_baseline(args.compare) if args.compare else {}
+    commit = _git_commit()
+
+    ui.console = Console(file=open(os.devnull, "w"))
+    workdir = Path(tempfile.mkdtemp(prefix="skillchef-bench-"))
+    os.environ["HOME"] = str(workdir)
+    results: list[Result] = []
+    try:
+        for size in sizes:
+            results.extend(run_size(size, args.repeat, workdir))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    output = args.output or RESULTS_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "commit": commit,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": [asdict(r) | {"best": r.best, "median": r.median} for r in results],
+    }
+    output.write_text(json.dumps(payload, indent=2) + "\n")
+    _print_results(results, baseline)
+    print(f"\nWrote {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
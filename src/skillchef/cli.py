@@ -1,22 +1,43 @@
 from __future__ import annotations
 
+import importlib
+import sys
+import time
 from pathlib import Path
+from types import ModuleType
 
 import click
 
-from skillchef import config, ui
-from skillchef.commands import (
-    cook_cmd,
-    flavor_cmd,
-    init_cmd,
-    inspect_cmd,
-    remove_cmd,
-    serve_cmd,
-    sync_cmd,
-)
-from skillchef.commands import (
-    list_cmd as list_command,
-)
+from skillchef import config, profiling
+
+# Command modules (and through them litellm, httpx, rich and questionary) are imported
+# only when their subcommand runs, so `--help` and light commands start quickly.
+_LAZY_MODULES = {
+    "cook_cmd": "skillchef.commands.cook_cmd",
+    "flavor_cmd": "skillchef.commands.flavor_cmd",
+    "gc_cmd": "skillchef.commands.gc_cmd",
+    "init_cmd": "skillchef.commands.init_cmd",
+    "inspect_cmd": "skillchef.commands.inspect_cmd",
+    "install_cmd": "skillchef.commands.install_cmd",
+    "list_command": "skillchef.commands.list_cmd",
+    "lock_cmd": "skillchef.commands.lock_cmd",
+    "remove_cmd": "skillchef.commands.remove_cmd",
+    "serve_cmd": "skillchef.commands.serve_cmd",
+    "sync_cmd": "skillchef.commands.sync_cmd",
+    "remote": "skillchef.remote",
+    "ui": "skillchef.ui",
+}
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _LAZY_MODULES:
+        return importlib.import_module(_LAZY_MODULES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _module(name: str) -> ModuleType:
+    return importlib.import_module(_LAZY_MODULES[name])
+
 
 SCOPE_CHOICES = ["auto", "global", "project"]
 
@@ -32,9 +53,23 @@ def with_scope_option(help_text: str = "Storage scope to use."):
 
 
 @click.group(invoke_without_command=True)
+@click.option("--profile", is_flag=True, help="Print a timing summary when the command ends.")
+@click.option(
+    "--trace",
+    "trace_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=f"Write a Chrome trace JSON file (also ${profiling.TRACE_ENV}).",
+)
 @click.pass_context
-def main(ctx: click.Context) -> None:
+def main(ctx: click.Context, profile: bool, trace_path: Path | None) -> None:
     """skillchef — cook, flavor & sync your agent skills."""
+    ctx.call_on_close(_close_http_client)
+    trace_path = trace_path or profiling.trace_path_from_env()
+    if profile or trace_path:
+        profiling.enable()
+        started = time.perf_counter()
+        ctx.call_on_close(lambda: _report_profile(profile, trace_path, started))
     if ctx.invoked_subcommand is not None:
         return
     if _is_first_run():
@@ -43,6 +78,19 @@ def main(ctx: click.Context) -> None:
     click.echo(ctx.get_help())
 
 
+def _close_http_client() -> None:
+    remote = sys.modules.get(_LAZY_MODULES["remote"])
+    if remote is not None:
+        remote.close_http_client()
+
+
+def _report_profile(show_summary: bool, trace_path: Path | None, started: float) -> None:
+    if trace_path is not None:
+        profiling.write_chrome_trace(trace_path)
+    if show_summary:
+        _module("ui").show_profile(profiling.summarize(), time.perf_counter() - started)
+
+
 def _is_first_run(cwd: Path | None = None) -> bool:
     workdir = cwd or Path.cwd()
     global_home_exists = config.SKILLCHEF_HOME.exists()
@@ -51,6 +99,8 @@ def _is_first_run(cwd: Path | None = None) -> bool:
 
 
 def _run_first_time_entrypoint() -> None:
+    ui = _module("ui")
+    init_cmd = _module("init_cmd")
     ui.banner()
     ui.console.print()
     ui.info("SkillChef has not been set up yet. Choose one option to get started:")
@@ -73,29 +123,143 @@ def _run_first_time_entrypoint() -> None:
 @with_scope_option("Where to save config.")
 def init(wizard: bool | None, scope: str) -> None:
     """First-time setup: platforms, editor, model."""
-    init_cmd.run(scope=scope, run_wizard=wizard)
+    _module("init_cmd").run(scope=scope, run_wizard=wizard)
 
 
 @main.command()
-@click.argument("source")
+@click.argument("source", required=False)
 @click.option(
     "--force-overwrite",
     is_flag=True,
     help="Overwrite an existing skill with the same name without prompting.",
 )
+@click.option(
+    "--from-file",
+    "manifest",
+    type=click.Path(dir_okay=False, exists=True, allow_dash=True),
+    default=None,
+    help="Cook every source in a skills.toml manifest or a list of sources (- for stdin), "
+    "without prompts.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=config.DEFAULT_SYNC_JOBS,
+    show_default=True,
+    help="With --from-file: number of sources to fetch concurrently.",
+)
 @with_scope_option()
-def cook(source: str, force_overwrite: bool, scope: str) -> None:
+def cook(
+    source: str | None, force_overwrite: bool, manifest: str | None, jobs: int, scope: str
+) -> None:
     """Import a skill from a remote source or local path."""
-    cook_cmd.run(source, force_overwrite=force_overwrite, scope=scope)
+    if (source is None) == (manifest is None):
+        raise click.UsageError("Pass either SOURCE or --from-file.")
+    if manifest is not None:
+        _module("cook_cmd").run_from_file(
+            manifest, force_overwrite=force_overwrite, scope=scope, jobs=jobs
+        )
+        return
+    _module("cook_cmd").run(source, force_overwrite=force_overwrite, scope=scope)
 
 
 @main.command()
 @click.argument("skill_name", required=False)
 @click.option("--no-ai", is_flag=True, help="Disable automatic AI merge proposals.")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=config.DEFAULT_SYNC_JOBS,
+    show_default=True,
+    help="Number of remotes to fetch concurrently.",
+)
+@click.option(
+    "--non-interactive",
+    is_flag=True,
+    help="Apply updates without prompting and write an NDJSON report.",
+)
+@click.option(
+    "--policy",
+    type=click.Choice(config.SYNC_POLICIES),
+    default=config.DEFAULT_SYNC_POLICY,
+    show_default=True,
+    help="With --non-interactive: auto-safe leaves conflicts pending, ai accepts AI merges, "
+    "skip only reports.",
+)
+@click.option(
+    "--report",
+    default="-",
+    show_default=True,
+    help="With --non-interactive: report file path, or - for stdout.",
+)
 @with_scope_option()
-def sync(skill_name: str | None, no_ai: bool, scope: str) -> None:
+def sync(
+    skill_name: str | None,
+    no_ai: bool,
+    jobs: int,
+    non_interactive: bool,
+    policy: str,
+    report: str,
+    scope: str,
+) -> None:
     """Check remotes for updates and merge."""
-    sync_cmd.run(skill_name, no_ai, scope=scope)
+    ctx = click.get_current_context()
+    batch_only = [
+        f"--{name}"
+        for name in ("policy", "report")
+        if ctx.get_parameter_source(name) is not click.core.ParameterSource.DEFAULT
+    ]
+    if batch_only and not non_interactive:
+        raise click.UsageError(f"{' and '.join(batch_only)} only apply with --non-interactive.")
+    if non_interactive:
+        _module("sync_cmd").run_batch(
+            skill_name, policy=policy, report=report, no_ai=no_ai, scope=scope, jobs=jobs
+        )
+        return
+    _module("sync_cmd").run(skill_name, no_ai, scope=scope, jobs=jobs)
+
+
+@main.command()
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=f"Lockfile to write (default: {config.LOCKFILE_NAME} for the scope).",
+)
+@with_scope_option()
+def lock(output: Path | None, scope: str) -> None:
+    """Record every skill's source, commit and content hash in a lockfile."""
+    _module("lock_cmd").run(output=output, scope=scope)
+
+
+@main.command()
+@click.option(
+    "--lockfile",
+    "lock_path",
+    type=click.Path(dir_okay=False, exists=True, path_type=Path),
+    default=None,
+    help=f"Lockfile to install from (default: {config.LOCKFILE_NAME} for the scope).",
+)
+@click.option(
+    "--frozen",
+    is_flag=True,
+    help="Fail instead of updating the lockfile when fetched content does not match it.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=config.DEFAULT_SYNC_JOBS,
+    show_default=True,
+    help="Number of remotes to fetch concurrently.",
+)
+@with_scope_option()
+def install(lock_path: Path | None, frozen: bool, jobs: int, scope: str) -> None:
+    """Install all skills from a lockfile at their pinned commits."""
+    _module("install_cmd").run(lock_path, frozen=frozen, scope=scope, jobs=jobs)
 
 
 @main.command()
@@ -107,14 +271,16 @@ def flavor(
     skill_name: str | None, flavor_name: str | None, use_flavor: str | None, scope: str
 ) -> None:
     """Add or edit a local flavor for a skill."""
-    flavor_cmd.run(skill_name, flavor_name=flavor_name, use_flavor=use_flavor, scope=scope)
+    _module("flavor_cmd").run(
+        skill_name, flavor_name=flavor_name, use_flavor=use_flavor, scope=scope
+    )
 
 
 @main.command(name="list")
 @with_scope_option()
 def list_cmd(scope: str) -> None:
     """List all managed skills."""
-    list_command.run(scope=scope)
+    _module("list_command").run(scope=scope)
 
 
 @main.command()
@@ -122,7 +288,7 @@ def list_cmd(scope: str) -> None:
 @with_scope_option()
 def inspect(skill_name: str | None, scope: str) -> None:
     """Inspect one managed skill (metadata + live SKILL.md), or choose interactively."""
-    inspect_cmd.run(skill_name, scope=scope)
+    _module("inspect_cmd").run(skill_name, scope=scope)
 
 
 @main.command()
@@ -130,7 +296,7 @@ def inspect(skill_name: str | None, scope: str) -> None:
 @with_scope_option()
 def serve(skill_name: str, scope: str) -> None:
     """Publish one managed skill to a remote destination."""
-    serve_cmd.run(skill_name, scope=scope)
+    _module("serve_cmd").run(skill_name, scope=scope)
 
 
 @main.command()
@@ -138,7 +304,14 @@ def serve(skill_name: str, scope: str) -> None:
 @with_scope_option()
 def remove(skill_name: str, scope: str) -> None:
     """Remove a managed skill."""
-    remove_cmd.run(skill_name, scope=scope)
+    _module("remove_cmd").run(skill_name, scope=scope)
+
+
+@main.command()
+@with_scope_option()
+def gc(scope: str) -> None:
+    """Delete stored file objects that no skill or backup uses any more."""
+    _module("gc_cmd").run(scope=scope)
 
 
 if __name__ == "__main__":
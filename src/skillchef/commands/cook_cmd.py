@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import shutil
+import sys
+import tempfile
+import tomllib
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -25,51 +30,231 @@ def run(source: str, force_overwrite: bool = False, scope: str = "auto") -> None
 
     failures: list[str] = []
 
-    for resolved_source in sources:
-        ui.info(f"Fetching from {resolved_source}...")
-        try:
-            fetched_dir, remote_type = remote.fetch(resolved_source)
-        except Exception as e:
-            ui.error(f"Failed to fetch: {e}")
-            raise SystemExit(1)
+    # Fetch every source up front so network and git latency overlap.
+    ui.info(f"Fetching {len(sources)} source{'s' if len(sources) != 1 else ''}...")
+    fetched = asyncio.run(remote.fetch_many(sources))
 
-        try:
-            fetched_skills = _resolve_fetched_skills(
-                fetched_dir,
-                source=resolved_source,
-                remote_type=remote_type,
-            )
-            for skill_dir, skill_source in fetched_skills:
+    try:
+        with remote.shared_commit_lookups():
+            for resolved_source, result in zip(sources, fetched):
+                if isinstance(result, Exception):
+                    ui.error(f"Failed to fetch: {result}")
+                    raise SystemExit(1)
+                fetched_dir, remote_type = result
                 try:
-                    default_name = _default_skill_name(skill_dir)
-                    while True:
-                        name = ui.ask("Skill name", default=default_name)
-                        try:
-                            name = store.validate_skill_name(name)
-                            break
-                        except ValueError as ve:
-                            ui.warn(str(ve))
-                    name = _resolve_existing_name(
-                        name, force_overwrite=force_overwrite, scope=scope
+                    fetched_skills = _resolve_fetched_skills(
+                        fetched_dir,
+                        source=resolved_source,
+                        remote_type=remote_type,
                     )
-                    store.cook(name, skill_dir, skill_source, remote_type, platforms, scope=scope)
-                    ui.success(f"Cooked [bold]{name}[/bold]!")
-                    for p in platforms:
-                        ui.info(f"Symlinked → {config.platform_skill_dir(p) / name}")
+                    for skill_dir, skill_source in fetched_skills:
+                        try:
+                            default_name = _default_skill_name(skill_dir)
+                            while True:
+                                name = ui.ask("Skill name", default=default_name)
+                                try:
+                                    name = store.validate_skill_name(name)
+                                    break
+                                except ValueError as ve:
+                                    ui.warn(str(ve))
+                            name = _resolve_existing_name(
+                                name, force_overwrite=force_overwrite, scope=scope
+                            )
+                            store.cook(
+                                name, skill_dir, skill_source, remote_type, platforms, scope=scope
+                            )
+                            ui.success(f"Cooked [bold]{name}[/bold]!")
+                            for p in platforms:
+                                ui.info(f"Symlinked → {config.platform_skill_dir(p) / name}")
+                        except Exception as e:
+                            failures.append(f"{skill_source}: {e}")
+                            ui.error(f"Failed to cook skill from {skill_source}: {e}")
                 except Exception as e:
-                    failures.append(f"{skill_source}: {e}")
-                    ui.error(f"Failed to cook skill from {skill_source}: {e}")
-        except Exception as e:
-            ui.error(f"Failed to cook skill: {e}")
-            raise SystemExit(1)
-        finally:
-            cleanup_fetched(fetched_dir)
+                    ui.error(f"Failed to cook skill: {e}")
+                    raise SystemExit(1)
+    finally:
+        for result in fetched:
+            if not isinstance(result, Exception):
+                cleanup_fetched(result[0])
 
     if failures:
         ui.error(f"Cook completed with {len(failures)} failure{'s' if len(failures) != 1 else ''}.")
         raise SystemExit(1)
 
 
+@dataclass(frozen=True)
+class ManifestEntry:
+    source: str
+    name: str = ""
+
+
+@dataclass(frozen=True)
+class BulkCook:
+    name: str
+    skill_dir: Path
+    source: str
+    remote_type: str
+
+
+def run_from_file(
+    manifest: str,
+    *,
+    force_overwrite: bool = False,
+    scope: str = "auto",
+    jobs: int = remote.DEFAULT_FETCH_CONCURRENCY,
+) -> None:
+    """Cook every source listed in ``manifest`` (``-`` for stdin) without prompting.
+
+    All sources are fetched concurrently and checked before anything is installed; if any
+    fails, nothing is cooked, and a failure while installing rolls back the whole batch.
+    """
+    ui.banner()
+    cfg = ensure_config(scope=scope)
+    try:
+        entries, platforms = _read_manifest(manifest)
+    except (OSError, ValueError) as e:
+        ui.error(f"Cannot read {manifest}: {e}")
+        raise SystemExit(1)
+    if platforms is None:
+        platforms = [str(p) for p in cfg.get("platforms", [])]
+
+    errors: list[str] = []
+    expanded: list[ManifestEntry] = []
+    for entry in entries:
+        try:
+            expanded.extend(_expand_local_entry(entry))
+        except ValueError as e:
+            errors.append(f"{entry.source}: {e}")
+
+    ui.info(f"Fetching {len(expanded)} source{'s' if len(expanded) != 1 else ''}...")
+    fetched = asyncio.run(remote.fetch_many([entry.source for entry in expanded], concurrency=jobs))
+    try:
+        plan = _plan_bulk_cook(
+            expanded, fetched, errors, force_overwrite=force_overwrite, scope=scope
+        )
+        if errors:
+            for error in errors:
+                ui.error(error)
+            ui.error("Nothing was cooked.")
+            raise SystemExit(1)
+        try:
+            with remote.shared_commit_lookups():
+                _cook_all(plan, platforms, scope=scope)
+        except Exception as e:
+            ui.error(f"Cook failed, rolled back all {len(plan)} skills: {e}")
+            raise SystemExit(1)
+    finally:
+        for result in fetched:
+            if not isinstance(result, Exception):
+                cleanup_fetched(result[0])
+
+    ui.success(f"Cooked {len(plan)} skill{'s' if len(plan) != 1 else ''}.")
+
+
+def _read_manifest(manifest: str) -> tuple[list[ManifestEntry], list[str] | None]:
+    """Parse a TOML manifest, or a plain list of sources one per line (``#`` comments).
+
+    TOML manifests hold ``[[skills]]`` tables with ``source`` and an optional ``name``,
+    and may set ``platforms`` for the whole batch.
+    """
+    text = sys.stdin.read() if manifest == "-" else Path(manifest).read_text()
+    if manifest != "-" and manifest.endswith(".toml"):
+        data = tomllib.loads(text)
+        entries: list[ManifestEntry] = []
+        for item in data.get("skills", []):
+            if isinstance(item, str):
+                entries.append(ManifestEntry(source=item))
+            elif isinstance(item, dict) and item.get("source"):
+                entries.append(ManifestEntry(str(item["source"]), str(item.get("name", ""))))
+            else:
+                raise ValueError(f"skills entries need a source: {item!r}")
+        platforms = data.get("platforms")
+        return entries, [str(p) for p in platforms] if platforms is not None else None
+
+    sources = [line.split("#", 1)[0].strip() for line in text.splitlines()]
+    return [ManifestEntry(source=source) for source in sources if source], None
+
+
+def _expand_local_entry(entry: ManifestEntry) -> list[ManifestEntry]:
+    if remote.classify(entry.source) != "local":
+        return [entry]
+    candidates = remote.local_skill_candidates(entry.source)
+    if not candidates:
+        raise ValueError("No SKILL.md files found in local source")
+    name = entry.name if len(candidates) == 1 else ""
+    return [ManifestEntry(str(candidate.parent), name) for candidate in candidates]
+
+
+def _plan_bulk_cook(
+    entries: list[ManifestEntry],
+    fetched: list[tuple[Path, str] | Exception],
+    errors: list[str],
+    *,
+    force_overwrite: bool,
+    scope: str,
+) -> list[BulkCook]:
+    plan: list[BulkCook] = []
+    for entry, result in zip(entries, fetched):
+        if isinstance(result, Exception):
+            errors.append(f"{entry.source}: {result}")
+            continue
+        fetched_dir, remote_type = result
+        candidates = remote.local_skill_candidates(str(fetched_dir))
+        if not candidates:
+            errors.append(f"{entry.source}: No SKILL.md files found in fetched source")
+            continue
+        for candidate in candidates:
+            skill_dir = candidate.parent
+            name = entry.name if entry.name and len(candidates) == 1 else ""
+            try:
+                name = store.validate_skill_name(name or _default_skill_name(skill_dir))
+            except ValueError as e:
+                errors.append(f"{entry.source}: {e}")
+                continue
+            skill_source = remote.derive_child_source(
+                entry.source, remote_type=remote_type, rel_path=skill_dir.relative_to(fetched_dir)
+            )
+            plan.append(BulkCook(name, skill_dir, skill_source, remote_type))
+
+    seen: set[str] = set()
+    for item in plan:
+        if item.name in seen:
+            errors.append(f"{item.source}: skill name '{item.name}' is used more than once")
+        seen.add(item.name)
+        if not force_overwrite and store.skill_dir(item.name, scope=scope).exists():
+            errors.append(
+                f"{item.source}: skill '{item.name}' already exists (use --force-overwrite)"
+            )
+    return plan
+
+
+def _cook_all(plan: list[BulkCook], platforms: list[str], scope: str = "auto") -> None:
+    home = config.ensure_store(scope=scope).parent
+    aside_root = Path(tempfile.mkdtemp(prefix="cook-", dir=home))
+    replaced: dict[str, Path] = {}
+    cooked: list[str] = []
+    try:
+        for item in plan:
+            existing = store.skill_dir(item.name, scope=scope)
+            if existing.exists():
+                replaced[item.name] = aside_root / item.name
+                shutil.move(str(existing), str(replaced[item.name]))
+            store.cook(
+                item.name, item.skill_dir, item.source, item.remote_type, platforms, scope=scope
+            )
+            cooked.append(item.name)
+            ui.success(f"Cooked [bold]{item.name}[/bold]")
+    except BaseException:
+        for name in cooked:
+            if name not in replaced:
+                store.remove(name, scope=scope)
+        for name, saved in replaced.items():
+            store.restore(name, saved, scope=scope)
+        raise
+    finally:
+        shutil.rmtree(aside_root, ignore_errors=True)
+
+
 def _resolve_sources_for_cook(source: str) -> list[str]:
     kind = remote.classify(source)
     if kind != "local":
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from skillchef import objects, ui
+
+
+def run(scope: str = "auto") -> None:
+    ui.banner()
+    result = objects.collect_garbage(scope=scope)
+    if not result.removed:
+        ui.info("No unreferenced objects to remove.")
+        return
+    plural = "s" if result.removed != 1 else ""
+    ui.success(
+        f"Removed {result.removed} unreferenced object{plural} "
+        f"({_format_size(result.freed_bytes)} freed)."
+    )
+
+
+def _format_size(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
@@ -38,11 +38,11 @@ def inspect_skill_from_meta_with_actions(meta: dict[str, Any], scope: str = "aut
 
 
 def _meta_for_name(skill_name: str, scope: str = "auto") -> dict[str, Any]:
-    for meta in store.list_skills(scope=scope):
-        if str(meta.get("name")) == skill_name:
-            return meta
-    ui.error(f"Skill '{skill_name}' not found.")
-    raise SystemExit(1)
+    try:
+        return store.load_meta(skill_name, scope=scope)
+    except KeyError:
+        ui.error(f"Skill '{skill_name}' not found.")
+        raise SystemExit(1)
 
 
 def _meta_from_prompt(scope: str = "auto") -> dict[str, Any] | None:
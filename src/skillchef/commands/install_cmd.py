@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from skillchef import config, lockfile, remote, store, ui
+
+from .common import cleanup_fetched, ensure_config
+
+
+def run(
+    lock_path: Path | None = None,
+    *,
+    frozen: bool = False,
+    scope: str = "auto",
+    jobs: int = config.DEFAULT_SYNC_JOBS,
+) -> None:
+    """Install every skill in the lockfile, fetching GitHub sources at their locked commit.
+
+    With ``frozen`` any skill whose content differs from its locked ``base_sha256`` fails
+    the install; otherwise it is installed anyway and the lockfile is rewritten.
+    """
+    ui.banner()
+    ensure_config(scope=scope)
+    path = lock_path or config.lockfile_path(scope=scope)
+    try:
+        locked = lockfile.read(path)
+    except (OSError, ValueError) as e:
+        ui.error(f"Cannot read lockfile {path}: {e}")
+        raise SystemExit(1)
+
+    failures: list[str] = []
+    pending: list[lockfile.LockedSkill] = []
+    for entry in locked:
+        if not store.skill_dir(entry.name, scope=scope).exists():
+            pending.append(entry)
+        elif store.load_meta(entry.name, scope=scope).get("base_sha256") == entry.base_sha256:
+            ui.info(f"{entry.name} is already installed.")
+        else:
+            failures.append(f"{entry.name}: already installed with different content")
+
+    if pending:
+        ui.info(f"Fetching {len(pending)} source{'s' if len(pending) != 1 else ''}...")
+    fetched = asyncio.run(
+        remote.fetch_many([entry.pinned_source for entry in pending], concurrency=jobs)
+    )
+
+    drifted = False
+    try:
+        for entry, result in zip(pending, fetched):
+            if isinstance(result, Exception):
+                failures.append(f"{entry.name}: {result}")
+                continue
+            fetched_dir, _remote_type = result
+            if store.hash_dir(fetched_dir) != entry.base_sha256:
+                if frozen:
+                    failures.append(f"{entry.name}: fetched content does not match the lockfile")
+                    continue
+                ui.warn(f"{entry.name}: fetched content differs from the lockfile.")
+                drifted = True
+            try:
+                _install_one(entry, fetched_dir, scope=scope)
+            except Exception as e:
+                failures.append(f"{entry.name}: {e}")
+                continue
+            ui.success(f"Installed [bold]{entry.name}[/bold]")
+    finally:
+        for result in fetched:
+            if not isinstance(result, Exception):
+                cleanup_fetched(result[0])
+
+    if drifted:
+        lockfile.write(path, lockfile.snapshot(scope=scope))
+        ui.info(f"Updated {path}")
+
+    if failures:
+        for failure in failures:
+            ui.error(failure)
+        ui.error(f"Install failed for {len(failures)} skill{'s' if len(failures) != 1 else ''}.")
+        raise SystemExit(1)
+
+
+def _install_one(entry: lockfile.LockedSkill, fetched_dir: Path, scope: str) -> None:
+    store.cook(
+        entry.name,
+        fetched_dir,
+        entry.remote_url,
+        entry.remote_type,
+        list(entry.platforms),
+        scope=scope,
+        commit_sha=entry.source_commit_sha,
+    )
+    if entry.active_flavor != store.DEFAULT_FLAVOR_NAME:
+        store.set_active_flavor(entry.name, entry.active_flavor, scope=scope)
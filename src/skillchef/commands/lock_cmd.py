@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from skillchef import config, lockfile, ui
+
+
+def run(output: Path | None = None, scope: str = "auto") -> None:
+    path = output or config.lockfile_path(scope=scope)
+    skills = lockfile.snapshot(scope=scope)
+    lockfile.write(path, skills)
+    unpinned = [s.name for s in skills if s.remote_type == "local"]
+    plural = "s" if len(skills) != 1 else ""
+    ui.success(f"Locked {len(skills)} skill{plural} in {path}")
+    if unpinned:
+        ui.warn(f"Local sources only reinstall where their path exists: {', '.join(unpinned)}")
@@ -1,15 +1,38 @@
 from __future__ import annotations
 
-from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+import json
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, wait
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from skillchef import config, merge, remote, store, ui
-from skillchef.llm import selected_key, semantic_merge
+from skillchef.llm import MergeCancelled, selected_key, semantic_merge
 
 from .common import cleanup_fetched, ensure_config, open_editor
 
+DEFAULT_SYNC_JOBS = config.DEFAULT_SYNC_JOBS
+DEFAULT_AI_MERGE_JOBS = 4
+MERGE_CLOSE_TIMEOUT_SECONDS = 5.0
+SYNC_POLICIES = config.SYNC_POLICIES
+DEFAULT_SYNC_POLICY = config.DEFAULT_SYNC_POLICY
+
+
+@dataclass
+class FetchOutcome:
+    meta: dict[str, Any]
+    fetched_dir: Path | None = None
+    error: Exception | None = None
+    up_to_date: bool = False
+    remote_sha256: str = ""
+    fetch_seconds: float = 0.0
+    commit_sha: str = ""
+
 
 @dataclass
 class SyncPlan:
@@ -21,18 +44,147 @@ class SyncPlan:
     flavor_text: str
     has_flavor: bool
     has_conflicts: bool
+    proposed_live: str | None = None
+    local_edits_merged: bool = False
+    merge_result: merge.ThreeWayMerge | None = None
+
+    @property
+    def needs_ai_merge(self) -> bool:
+        return self.current_live is not None and not self.local_edits_merged
+
+    @property
+    def merge_inputs(self) -> MergeInputs:
+        return (self.old_base, self.new_remote, self.flavor_text, self.current_live or "")
+
+
+class ProposalStream:
+    """AI merge text streamed in from a worker thread; ``cancel()`` stops the stream."""
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    def feed(self, delta: str) -> None:
+        if self._cancelled.is_set():
+            raise MergeCancelled()
+        if delta:
+            with self._lock:
+                self._parts.append(delta)
+
+    def text(self) -> str:
+        with self._lock:
+            return "".join(self._parts)
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+
+MergeInputs = tuple[str, str, str, str]
+
+
+class MergeScheduler:
+    """Runs AI merge proposals for a whole sync on one bounded pool.
+
+    Proposals are submitted as soon as a skill's plan is known, so they are usually
+    ready by the time the user gets to that skill.
+    """
+
+    def __init__(
+        self, *, scope: str, jobs: int = DEFAULT_AI_MERGE_JOBS, conflicts_only: bool = False
+    ) -> None:
+        self.scope = scope
+        self.conflicts_only = conflicts_only
+        self._executor = ThreadPoolExecutor(max_workers=max(1, jobs))
+        self._lock = threading.Lock()
+        self._pending: dict[str, tuple[MergeInputs, Future[str], ProposalStream]] = {}
+        self._closed = False
+
+    def submit(self, name: str, inputs: MergeInputs) -> None:
+        old_base, new_remote, flavor_text, current_live = inputs
+        stream = ProposalStream()
+        with self._lock:
+            if self._closed or name in self._pending:
+                return
+            future = self._executor.submit(
+                semantic_merge,
+                old_base,
+                new_remote,
+                flavor_text,
+                None,
+                current_live,
+                None,
+                self.scope,
+                on_token=stream.feed,
+            )
+            self._pending[name] = (inputs, future, stream)
+
+    def take(self, name: str, inputs: MergeInputs) -> tuple[Future[str], ProposalStream] | None:
+        """Hand over the proposal started for ``name``, if it was made from the same inputs."""
+        with self._lock:
+            job = self._pending.pop(name, None)
+        if job is None:
+            return None
+        started_with, future, stream = job
+        if started_with != inputs:
+            future.cancel()
+            stream.cancel()
+            return None
+        return future, stream
+
+    def speculate(self, outcome: FetchOutcome) -> None:
+        """Plan ``outcome`` off the UI thread and start its AI merge if it will need one."""
+        if outcome.error is not None or outcome.fetched_dir is None or outcome.up_to_date:
+            return
+        try:
+            plan = build_plan(str(outcome.meta["name"]), outcome.fetched_dir, scope=self.scope)
+        except Exception:
+            return
+        if plan.needs_ai_merge and (plan.has_conflicts or not self.conflicts_only):
+            self.submit(plan.name, plan.merge_inputs)
+
+    def close(self) -> None:
+        """Stop every proposal nobody took.
+
+        Queued ones never start and running ones stop at their next streamed piece;
+        close waits up to MERGE_CLOSE_TIMEOUT_SECONDS for those to wind down.
+        """
+        with self._lock:
+            self._closed = True
+            jobs = list(self._pending.values())
+            self._pending.clear()
+        for _inputs, future, stream in jobs:
+            future.cancel()
+            stream.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        running = [future for _inputs, future, _stream in jobs if not future.cancelled()]
+        wait(running, timeout=MERGE_CLOSE_TIMEOUT_SECONDS)
 
 
 class MergeStrategy:
-    def __init__(self, *, ai_available: bool, scope: str) -> None:
+    def __init__(
+        self, *, ai_available: bool, scope: str, scheduler: MergeScheduler | None = None
+    ) -> None:
         self.ai_available = ai_available
         self.scope = scope
+        self.scheduler = scheduler
 
     def start_ai_merge(
-        self, *, old_base: str, new_remote: str, flavor_text: str, current_live: str
-    ) -> tuple[Future[str] | None, ThreadPoolExecutor | None]:
+        self,
+        *,
+        name: str,
+        old_base: str,
+        new_remote: str,
+        flavor_text: str,
+        current_live: str,
+    ) -> tuple[Future[str] | None, ThreadPoolExecutor | None, ProposalStream | None]:
         if not self.ai_available:
-            return None, None
+            return None, None, None
+        if self.scheduler is not None:
+            job = self.scheduler.take(name, (old_base, new_remote, flavor_text, current_live))
+            if job is not None:
+                return job[0], None, job[1]
+        stream = ProposalStream()
         executor = ThreadPoolExecutor(max_workers=1)
         future = executor.submit(
             semantic_merge,
@@ -43,12 +195,14 @@ class MergeStrategy:
             current_live,
             None,
             self.scope,
+            on_token=stream.feed,
         )
-        return future, executor
+        return future, executor, stream
 
     def initial_semantic_check_proposal(
         self,
         *,
+        name: str,
         old_base: str,
         new_remote: str,
         flavor_text: str,
@@ -57,13 +211,14 @@ class MergeStrategy:
     ) -> str | None:
         if not self.ai_available:
             return None
-        ai_future, ai_executor = self.start_ai_merge(
+        ai_future, ai_executor, stream = self.start_ai_merge(
+            name=name,
             old_base=old_base,
             new_remote=new_remote,
             flavor_text=flavor_text,
             current_live=current_live,
         )
-        ai_result = _resolve_ai_future(ai_future)
+        ai_result = _resolve_ai_future(ai_future, stream=stream, current_live=current_live)
         if ai_executor:
             ai_executor.shutdown(wait=False)
         if not ai_result:
@@ -124,19 +279,27 @@ class ConflictResolver:
     def resolve_without_conflicts(self, plan: SyncPlan) -> None:
         if plan.current_live is None:
             return
-        proposed_live = merge.merge_skill_text(plan.new_remote, plan.flavor_text)
-        ui.info("No merge conflicts detected. Local `## Local Flavor` is preserved unchanged.")
+        proposed_live = plan.proposed_live or merge.merge_skill_text(
+            plan.new_remote, plan.flavor_text
+        )
+        if plan.local_edits_merged:
+            ui.info("Local edits merged cleanly with the update; no overlapping changes.")
+        else:
+            ui.info("No merge conflicts detected. Local `## Local Flavor` is preserved unchanged.")
         ui.show_diff(
             merge.diff_texts(plan.current_live, proposed_live, "current", "proposed update")
         )
 
-        ai_proposal = self.strategy.initial_semantic_check_proposal(
-            old_base=plan.old_base,
-            new_remote=plan.new_remote,
-            flavor_text=plan.flavor_text,
-            current_live=plan.current_live,
-            deterministic_proposal=proposed_live,
-        )
+        ai_proposal = None
+        if not plan.local_edits_merged:
+            ai_proposal = self.strategy.initial_semantic_check_proposal(
+                name=plan.name,
+                old_base=plan.old_base,
+                new_remote=plan.new_remote,
+                flavor_text=plan.flavor_text,
+                current_live=plan.current_live,
+                deterministic_proposal=proposed_live,
+            )
         if ai_proposal:
             ui.info("AI detected a potential semantic conflict and proposed an alternative merge:")
             ui.show_diff(merge.diff_texts(plan.current_live, ai_proposal, "current", "ai proposed"))
@@ -170,13 +333,20 @@ class ConflictResolver:
     def resolve_with_conflicts(self, plan: SyncPlan) -> None:
         if plan.current_live is None:
             return
-        ai_future, ai_executor = self.strategy.start_ai_merge(
+        marked_live = None
+        if plan.merge_result is not None:
+            count = len(plan.merge_result.conflicts)
+            ui.warn(f"{count} overlapping change{'s' if count != 1 else ''} need resolving.")
+            marked_live = merge.merge_skill_text(plan.merge_result.render(), plan.flavor_text)
+            ui.show_diff(merge.diff_texts(plan.current_live, marked_live, "current", "diff3 merge"))
+        ai_future, ai_executor, stream = self.strategy.start_ai_merge(
+            name=plan.name,
             old_base=plan.old_base,
             new_remote=plan.new_remote,
             flavor_text=plan.flavor_text,
             current_live=plan.current_live,
         )
-        proposal = _resolve_ai_future(ai_future)
+        proposal = _resolve_ai_future(ai_future, stream=stream, current_live=plan.current_live)
         if ai_executor:
             ai_executor.shutdown(wait=False)
 
@@ -221,7 +391,10 @@ class ConflictResolver:
 
             if action == "manual edit":
                 store.update_base(plan.name, plan.fetched_dir, scope=self.scope)
-                store.rebuild_live(plan.name, scope=self.scope)
+                if marked_live is not None:
+                    store.write_live_skill(plan.name, marked_live, scope=self.scope)
+                else:
+                    store.rebuild_live(plan.name, scope=self.scope)
                 open_editor(
                     store.skill_dir(plan.name, scope=self.scope) / "live" / "SKILL.md",
                     scope=self.scope,
@@ -230,25 +403,92 @@ class ConflictResolver:
                 return
 
 
+class BatchResolver:
+    """Applies updates without prompting, as chosen by ``sync --policy``.
+
+    ``auto-safe`` applies updates that need no judgement and leaves conflicts pending,
+    ``ai`` also accepts the AI merge for conflicts, and ``skip`` only reports.
+    """
+
+    def __init__(self, *, policy: str, strategy: MergeStrategy, scope: str) -> None:
+        self.policy = policy
+        self.strategy = strategy
+        self.scope = scope
+
+    def resolve(self, plan: SyncPlan) -> tuple[str, str]:
+        """Return ``(status, detail)`` for the report."""
+        if self.policy == "skip":
+            return ("conflict" if plan.has_conflicts else "update-available"), ""
+        if not plan.has_flavor:
+            store.update_base(plan.name, plan.fetched_dir, scope=self.scope)
+            store.rebuild_live(plan.name, scope=self.scope)
+            return "updated", ""
+        if not plan.has_conflicts:
+            proposed_live = plan.proposed_live or merge.merge_skill_text(
+                plan.new_remote, plan.flavor_text
+            )
+            store.update_base(plan.name, plan.fetched_dir, scope=self.scope)
+            store.write_live_skill(plan.name, proposed_live, scope=self.scope)
+            return ("merged" if plan.local_edits_merged else "updated"), ""
+        if self.policy != "ai" or plan.current_live is None:
+            return "conflict", ""
+
+        ai_future, ai_executor, _stream = self.strategy.start_ai_merge(
+            name=plan.name,
+            old_base=plan.old_base,
+            new_remote=plan.new_remote,
+            flavor_text=plan.flavor_text,
+            current_live=plan.current_live,
+        )
+        if ai_future is None:
+            return "conflict", "no LLM key configured"
+        try:
+            proposal = ai_future.result()
+        except Exception as e:
+            return "conflict", f"AI merge failed: {e}"
+        finally:
+            if ai_executor:
+                ai_executor.shutdown(wait=False)
+        if not proposal.strip():
+            return "conflict", "AI merge returned nothing"
+        store.update_base(plan.name, plan.fetched_dir, scope=self.scope)
+        store.write_live_skill(plan.name, proposal, scope=self.scope)
+        return "ai-merged", ""
+
+
 class SyncPlanner:
-    def __init__(self, *, meta: dict[str, Any], ai_available: bool, scope: str) -> None:
+    def __init__(
+        self,
+        *,
+        meta: dict[str, Any],
+        ai_available: bool,
+        scope: str,
+        scheduler: MergeScheduler | None = None,
+    ) -> None:
         self.meta = meta
         self.ai_available = ai_available
         self.scope = scope
         self.name = str(meta["name"])
-        self.strategy = MergeStrategy(ai_available=ai_available, scope=scope)
+        self.strategy = MergeStrategy(ai_available=ai_available, scope=scope, scheduler=scheduler)
         self.resolver = ConflictResolver(strategy=self.strategy, scope=scope)
 
-    def execute(self) -> None:
+    def execute(self, outcome: FetchOutcome | None = None) -> None:
+        if outcome is None:
+            outcome = fetch_remote(self.meta)
+
         ui.info(f"Syncing [bold]{self.name}[/bold]...")
-        try:
-            fetched_dir, _ = remote.fetch(str(self.meta["remote_url"]))
-        except Exception as e:
-            ui.warn(f"  Could not fetch {self.name}: {e}")
+        if outcome.error is not None:
+            ui.warn(f"  Could not fetch {self.name}: {outcome.error}")
+            return
+        if outcome.fetched_dir is None:
+            # The upstream commit or HTTP validators matched, so nothing was fetched.
+            ui.success(f"  {self.name}: up to date")
             return
 
+        fetched_dir = outcome.fetched_dir
         try:
-            if store.hash_dir(fetched_dir) == self.meta.get("base_sha256"):
+            if outcome.up_to_date:
+                record_unchanged_upstream(outcome, scope=self.scope)
                 ui.success(f"  {self.name}: up to date")
                 return
 
@@ -266,40 +506,69 @@ class SyncPlanner:
             cleanup_fetched(fetched_dir)
 
     def _build_plan(self, fetched_dir: Path) -> SyncPlan:
-        old_base = store.base_skill_text(self.name, scope=self.scope)
-        skill_path = fetched_dir / "SKILL.md"
-        new_remote = skill_path.read_text() if skill_path.exists() else ""
-        ui.show_diff(merge.diff_texts(old_base, new_remote, "base (current)", "remote (new)"))
-
-        has_flavor = store.has_flavor(self.name, scope=self.scope)
-        if not has_flavor:
-            return SyncPlan(
-                name=self.name,
-                fetched_dir=fetched_dir,
-                old_base=old_base,
-                new_remote=new_remote,
-                current_live=None,
-                flavor_text="",
-                has_flavor=False,
-                has_conflicts=False,
-            )
+        plan = build_plan(self.name, fetched_dir, scope=self.scope)
+        ui.show_diff(
+            merge.diff_texts(plan.old_base, plan.new_remote, "base (current)", "remote (new)")
+        )
+        return plan
 
-        current_live = store.live_skill_text(self.name, scope=self.scope)
-        flavor_text = _effective_flavor_text(self.name, current_live, scope=self.scope)
-        has_conflicts = merge.has_non_flavor_local_changes(old_base, current_live)
+
+def build_plan(name: str, fetched_dir: Path, scope: str = "auto") -> SyncPlan:
+    """Work out how a fetched update applies to the stored skill. Does not touch the UI."""
+    old_base = store.base_skill_text(name, scope=scope)
+    skill_path = fetched_dir / "SKILL.md"
+    new_remote = skill_path.read_text() if skill_path.exists() else ""
+
+    has_flavor = store.has_flavor(name, scope=scope)
+    if not has_flavor:
         return SyncPlan(
-            name=self.name,
+            name=name,
             fetched_dir=fetched_dir,
             old_base=old_base,
             new_remote=new_remote,
-            current_live=current_live,
-            flavor_text=flavor_text,
-            has_flavor=True,
-            has_conflicts=has_conflicts,
+            current_live=None,
+            flavor_text="",
+            has_flavor=False,
+            has_conflicts=False,
         )
 
-
-def run(skill_name: str | None, no_ai: bool, scope: str = "auto") -> None:
+    current_live = store.live_skill_text(name, scope=scope)
+    flavor_text = _effective_flavor_text(name, current_live, scope=scope)
+    plan = SyncPlan(
+        name=name,
+        fetched_dir=fetched_dir,
+        old_base=old_base,
+        new_remote=new_remote,
+        current_live=current_live,
+        flavor_text=flavor_text,
+        has_flavor=True,
+        has_conflicts=False,
+    )
+    if not merge.has_non_flavor_local_changes(old_base, current_live):
+        return plan
+
+    # Local edits outside the flavor section: merge them line by line and only
+    # treat overlapping hunks as conflicts.
+    live_body, _ = merge.split_local_flavor_section(current_live)
+    result = merge.three_way_merge(
+        _trim_trailing(old_base), _trim_trailing(live_body), _trim_trailing(new_remote)
+    )
+    if result.clean:
+        plan.proposed_live = merge.merge_skill_text(result.render(), flavor_text)
+        plan.local_edits_merged = True
+    else:
+        plan.has_conflicts = True
+        plan.merge_result = result
+    return plan
+
+
+def run(
+    skill_name: str | None,
+    no_ai: bool,
+    scope: str = "auto",
+    jobs: int = DEFAULT_SYNC_JOBS,
+    ai_jobs: int = DEFAULT_AI_MERGE_JOBS,
+) -> None:
     ui.banner()
     ensure_config(scope=scope)
 
@@ -320,14 +589,288 @@ def run(skill_name: str | None, no_ai: bool, scope: str = "auto") -> None:
             ui.error(f"Skill '{skill_name}' not found.")
             raise SystemExit(1)
 
-    for meta in skills:
-        _sync_one(meta, ai_available=ai_available, scope=scope)
+    if not ai_available:
+        with remote.shared_commit_lookups():
+            for outcome in _iter_fetch_outcomes(skills, jobs=jobs):
+                SyncPlanner(meta=outcome.meta, ai_available=False, scope=scope).execute(outcome)
+        return
+
+    scheduler = MergeScheduler(scope=scope, jobs=ai_jobs)
+    try:
+        with remote.shared_commit_lookups():
+            for outcome in _iter_fetch_outcomes(skills, jobs=jobs, on_fetched=scheduler.speculate):
+                SyncPlanner(
+                    meta=outcome.meta, ai_available=True, scope=scope, scheduler=scheduler
+                ).execute(outcome)
+    finally:
+        scheduler.close()
+
+
+def run_batch(
+    skill_name: str | None,
+    *,
+    policy: str = DEFAULT_SYNC_POLICY,
+    report: str = "-",
+    no_ai: bool = False,
+    scope: str = "auto",
+    jobs: int = DEFAULT_SYNC_JOBS,
+    ai_jobs: int = DEFAULT_AI_MERGE_JOBS,
+) -> None:
+    """Sync without prompts and write one NDJSON report line per skill, then a summary.
+
+    With ``report="-"`` the report goes to stdout and progress messages to stderr.
+    Exits with status 1 if any skill failed.
+    """
+    if report == "-":
+        ui.use_stderr()
+    ensure_config(scope=scope)
+    ai_available = policy == "ai" and not no_ai
+    if ai_available:
+        cfg = config.load(scope=scope)
+        ai_available = selected_key(cfg.get("llm_api_key_env", "")) is not None
+
+    skills = store.list_skills(scope=scope)
+    if skill_name:
+        skills = [s for s in skills if s["name"] == skill_name]
+        if not skills:
+            ui.error(f"Skill '{skill_name}' not found.")
+            raise SystemExit(1)
+
+    scheduler = (
+        MergeScheduler(scope=scope, jobs=ai_jobs, conflicts_only=True) if ai_available else None
+    )
+    strategy = MergeStrategy(ai_available=ai_available, scope=scope, scheduler=scheduler)
+    resolver = BatchResolver(policy=policy, strategy=strategy, scope=scope)
+    counts: dict[str, int] = {}
+    out: TextIO = sys.stdout if report == "-" else open(report, "w", encoding="utf-8")
+    try:
+        outcomes = _iter_fetch_outcomes(
+            skills, jobs=jobs, on_fetched=scheduler.speculate if scheduler else None
+        )
+        with remote.shared_commit_lookups():
+            for outcome in outcomes:
+                record = _batch_sync_one(outcome, resolver, scope=scope)
+                counts[record["status"]] = counts.get(record["status"], 0) + 1
+                ui.info(f"{record['name']}: {record['status']}")
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+        out.write(json.dumps({"summary": counts, "policy": policy}) + "\n")
+    finally:
+        if scheduler is not None:
+            scheduler.close()
+        if out is not sys.stdout:
+            out.close()
+    if counts.get("error"):
+        raise SystemExit(1)
+
+
+def _batch_sync_one(
+    outcome: FetchOutcome, resolver: BatchResolver, scope: str = "auto"
+) -> dict[str, Any]:
+    meta = outcome.meta
+    name = str(meta["name"])
+    record: dict[str, Any] = {
+        "name": name,
+        "status": "up-to-date",
+        "detail": "",
+        "fetch_seconds": round(outcome.fetch_seconds, 3),
+        "resolve_seconds": 0.0,
+        "base_sha256_before": str(meta.get("base_sha256", "")),
+        "base_sha256_after": str(meta.get("base_sha256", "")),
+        "remote_sha256": outcome.remote_sha256,
+        "commit_sha_before": str(meta.get("source_commit_sha", "")),
+        "commit_sha_after": str(meta.get("source_commit_sha", "")),
+    }
+    if outcome.error is not None:
+        record.update(status="error", detail=str(outcome.error))
+        return record
+    if outcome.fetched_dir is None or outcome.up_to_date:
+        if outcome.fetched_dir is not None:
+            try:
+                after = record_unchanged_upstream(outcome, scope=scope)
+                record["commit_sha_after"] = str(after.get("source_commit_sha", ""))
+            except Exception as e:
+                record.update(status="error", detail=str(e))
+            finally:
+                cleanup_fetched(outcome.fetched_dir)
+        return record
+
+    started = time.perf_counter()
+    try:
+        status, detail = resolver.resolve(build_plan(name, outcome.fetched_dir, scope=scope))
+    except Exception as e:
+        status, detail = "error", str(e)
+    finally:
+        cleanup_fetched(outcome.fetched_dir)
+    record.update(status=status, detail=detail)
+    record["resolve_seconds"] = round(time.perf_counter() - started, 3)
+    if status in {"updated", "merged", "ai-merged"}:
+        after = store.load_meta(name, scope=scope)
+        record["base_sha256_after"] = str(after.get("base_sha256", ""))
+        record["commit_sha_after"] = str(after.get("source_commit_sha", ""))
+    return record
 
 
 def _sync_one(meta: dict[str, Any], ai_available: bool = False, scope: str = "auto") -> None:
     SyncPlanner(meta=meta, ai_available=ai_available, scope=scope).execute()
 
 
+def fetch_remote(meta: dict[str, Any]) -> FetchOutcome:
+    """Fetch and hash one skill's remote without touching the UI.
+
+    Safe to call from worker threads; errors are captured on the outcome. When the
+    recorded upstream commit still matches, the fetch is skipped entirely. Blob sources
+    on the raw fast path skip that check: their conditional request is just as cheap.
+    """
+    url = str(meta["remote_url"])
+    commit_sha = "" if remote.uses_blob_fast_path(url) else _upstream_commit(meta)
+    if _commit_unchanged(meta, commit_sha):
+        return FetchOutcome(meta=meta, up_to_date=True)
+
+    validators = {
+        "source_etag": str(meta.get("source_etag", "")),
+        "source_last_modified": str(meta.get("source_last_modified", "")),
+    }
+    try:
+        fetched_dir, _ = remote.fetch(url, validators=validators)
+    except remote.NotModifiedError:
+        return FetchOutcome(meta=meta, up_to_date=True)
+    except Exception as e:
+        return FetchOutcome(meta=meta, error=e)
+    return _hashed_outcome(meta, fetched_dir, commit_sha)
+
+
+def fetch_remote_group(metas: list[dict[str, Any]]) -> list[FetchOutcome]:
+    """Fetch and hash skills that share one GitHub repository ref.
+
+    Skills that still need fetching are carved out of a single sparse clone.
+    Outcomes are returned in input order.
+    """
+    if len(metas) == 1:
+        return [fetch_remote(metas[0])]
+
+    outcomes: dict[int, FetchOutcome] = {}
+    pending: list[int] = []
+    # Every skill in the group tracks the same repo ref, so one lookup covers them all.
+    commit_sha = _upstream_commit(metas[0])
+    for index, meta in enumerate(metas):
+        if _commit_unchanged(meta, commit_sha):
+            outcomes[index] = FetchOutcome(meta=meta, up_to_date=True)
+        else:
+            pending.append(index)
+
+    if pending:
+        results: list[Path | Exception]
+        try:
+            results = list(remote.fetch_repo_paths([str(metas[i]["remote_url"]) for i in pending]))
+        except Exception as e:
+            results = [e] * len(pending)
+        for index, result in zip(pending, results):
+            if isinstance(result, Path):
+                outcomes[index] = _hashed_outcome(metas[index], result, commit_sha)
+            else:
+                outcomes[index] = FetchOutcome(meta=metas[index], error=result)
+    return [outcomes[index] for index in range(len(metas))]
+
+
+def _hashed_outcome(meta: dict[str, Any], fetched_dir: Path, commit_sha: str = "") -> FetchOutcome:
+    try:
+        remote_sha256 = store.hash_dir(fetched_dir)
+    except Exception as e:
+        cleanup_fetched(fetched_dir)
+        return FetchOutcome(meta=meta, error=e)
+    return FetchOutcome(
+        meta=meta,
+        fetched_dir=fetched_dir,
+        up_to_date=remote_sha256 == meta.get("base_sha256"),
+        remote_sha256=remote_sha256,
+        commit_sha=commit_sha,
+    )
+
+
+def record_unchanged_upstream(outcome: FetchOutcome, scope: str = "auto") -> dict[str, Any]:
+    """Store the commit and HTTP validators of a fetch whose content matched the base.
+
+    Without this a busy repo, or a server that rotates ETags, would keep failing the
+    cheap pre-checks and every later sync would download the content again.
+    """
+    assert outcome.fetched_dir is not None
+    return store.record_upstream(
+        str(outcome.meta["name"]),
+        outcome.fetched_dir,
+        commit_sha=outcome.commit_sha,
+        scope=scope,
+    )
+
+
+def _upstream_commit(meta: dict[str, Any]) -> str:
+    try:
+        return remote.current_commit_sha(str(meta["remote_url"]))
+    except Exception:
+        return ""
+
+
+def _commit_unchanged(meta: dict[str, Any], commit_sha: str) -> bool:
+    recorded = str(meta.get("source_commit_sha", "")).strip()
+    return bool(recorded) and commit_sha == recorded
+
+
+def _fetch_group_key(meta: dict[str, Any]) -> tuple[str, ...]:
+    repo_key = remote.github_repo_key(str(meta.get("remote_url", "")))
+    if repo_key:
+        return repo_key
+    return ("", "", str(meta["name"]))
+
+
+def _iter_fetch_outcomes(
+    skills: list[dict[str, Any]],
+    *,
+    jobs: int,
+    on_fetched: Callable[[FetchOutcome], None] | None = None,
+) -> Iterator[FetchOutcome]:
+    # Skills from the same repository ref share one fetch, and groups run
+    # concurrently. Outcomes are still yielded in store order so interactive
+    # resolution and output stay deterministic.
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    slots: list[tuple[tuple[str, ...], int]] = []
+    for meta in skills:
+        key = _fetch_group_key(meta)
+        members = groups.setdefault(key, [])
+        slots.append((key, len(members)))
+        members.append(meta)
+
+    def fetch_group(metas: list[dict[str, Any]]) -> list[FetchOutcome]:
+        started = time.perf_counter()
+        outcomes = fetch_remote_group(metas)
+        # Grouped skills share a single fetch, so they share its wall time too.
+        for outcome in outcomes:
+            outcome.fetch_seconds = time.perf_counter() - started
+        if on_fetched is not None:
+            for outcome in outcomes:
+                on_fetched(outcome)
+        return outcomes
+
+    executor = ThreadPoolExecutor(max_workers=max(1, jobs))
+    futures = {key: executor.submit(fetch_group, metas) for key, metas in groups.items()}
+    consumed = 0
+    try:
+        for key, position in slots:
+            outcome = futures[key].result()[position]
+            consumed += 1
+            yield outcome
+    finally:
+        for future in futures.values():
+            future.cancel()
+        executor.shutdown(wait=True)
+        for key, position in slots[consumed:]:
+            future = futures[key]
+            if future.cancelled():
+                continue
+            leftover = future.result()[position]
+            if leftover.fetched_dir is not None:
+                cleanup_fetched(leftover.fetched_dir)
+
+
 def _effective_flavor_text(name: str, current_live: str, scope: str = "auto") -> str:
     _, live_flavor = merge.split_local_flavor_section(current_live)
     if live_flavor is not None:
@@ -335,23 +878,58 @@ def _effective_flavor_text(name: str, current_live: str, scope: str = "auto") ->
     return store.flavor_path(name, scope=scope).read_text()
 
 
+def _trim_trailing(text: str) -> str:
+    return text.rstrip() + "\n"
+
+
 def _normalize_compare_text(text: str) -> str:
     return text.rstrip("\n")
 
 
-def _resolve_ai_future(future: Future[str] | None) -> str | None:
+def _resolve_ai_future(
+    future: Future[str] | None,
+    *,
+    stream: ProposalStream | None = None,
+    current_live: str = "",
+) -> str | None:
     if future is None:
         return None
     ui.info("Press Delete to skip AI proposal.")
+    shown = ""
     try:
-        with ui.spinner("Waiting for AI merge proposal..."):
+        with _waiting_for_proposal(stream) as show:
             while True:
                 try:
                     return future.result(timeout=0.2)
                 except TimeoutError:
+                    partial = stream.text() if stream is not None else ""
+                    if show is not None and partial != shown:
+                        shown = partial
+                        show(_partial_diff(current_live, partial))
                     if ui.poll_delete_key():
+                        if stream is not None:
+                            stream.cancel()
                         ui.info("  Skipping initial AI proposal.")
                         return None
     except Exception as e:
         ui.warn(f"  AI merge failed: {e}")
         return None
+
+
+@contextmanager
+def _waiting_for_proposal(
+    stream: ProposalStream | None,
+) -> Iterator[Callable[[list[str]], None] | None]:
+    if stream is None:
+        with ui.spinner("Waiting for AI merge proposal..."):
+            yield None
+        return
+    with ui.live_diff("Streaming AI merge proposal...") as show:
+        yield show
+
+
+def _partial_diff(current_live: str, partial: str) -> list[str]:
+    """Diff a partial proposal against the same number of leading lines of the current text."""
+    line_count = len(partial.splitlines())
+    current_head = "".join(current_live.splitlines(keepends=True)[:line_count])
+    return merge.diff_texts(current_head, partial, "current", "ai proposed (streaming)")
@@ -17,6 +17,12 @@ PLATFORMS: dict[str, Path] = {
     "claude-code": Path.home() / ".claude" / "skills",
 }
 
+LOCKFILE_NAME = "skillchef.lock"
+
+DEFAULT_SYNC_JOBS = 8
+SYNC_POLICIES = ("auto-safe", "ai", "skip")
+DEFAULT_SYNC_POLICY = "auto-safe"
+
 DEFAULT_CONFIG: dict[str, Any] = {
     "platforms": [],
     "editor": "",
@@ -96,6 +102,29 @@ def store_dir(
     return home / "store"
 
 
+def lockfile_path(
+    scope: str = "auto", cwd: Path | None = None, cfg: dict[str, Any] | None = None
+) -> Path:
+    """``skillchef.lock`` sits next to ``.skillchef/`` in projects so it can be committed."""
+    if resolve_scope(scope=scope, cwd=cwd, cfg=cfg) == "project":
+        return (cwd or Path.cwd()) / LOCKFILE_NAME
+    return SKILLCHEF_HOME / LOCKFILE_NAME
+
+
+def git_cache_dir() -> Path:
+    return SKILLCHEF_HOME / "cache" / "git"
+
+
+def llm_cache_dir(
+    scope: str = "auto", cwd: Path | None = None, cfg: dict[str, Any] | None = None
+) -> Path:
+    return scope_home(scope=scope, cwd=cwd, cfg=cfg) / "cache" / "llm"
+
+
+def hash_cache_path() -> Path:
+    return SKILLCHEF_HOME / "cache" / "hashes.json"
+
+
 def ensure_store(
     scope: str = "auto", cwd: Path | None = None, cfg: dict[str, Any] | None = None
 ) -> Path:
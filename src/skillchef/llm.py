@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import re
+import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable
 
-from litellm import completion
-
-from skillchef import config
+from skillchef import config, merge, profiling
 
 LLM_KEY_MAP = [
     ("ANTHROPIC_API_KEY", "Anthropic"),
@@ -26,6 +30,25 @@ DEFAULT_MODEL_BY_KEY = {
     "OLLAMA_API_BASE": "ollama/llama3.2",
 }
 
+MERGE_CACHE_ENV = "SKILLCHEF_LLM_CACHE"
+MERGE_CACHE_TTL_DAYS_ENV = "SKILLCHEF_LLM_CACHE_TTL_DAYS"
+MERGE_CACHE_MAX_MB_ENV = "SKILLCHEF_LLM_CACHE_MAX_MB"
+DEFAULT_MERGE_CACHE_TTL_DAYS = 30
+DEFAULT_MERGE_CACHE_MAX_MB = 50
+HUNK_MERGE_ENV = "SKILLCHEF_LLM_HUNK_MERGE"
+# Below this many characters across base, remote and live, the whole-document prompt is
+# cheap enough and gives the model more to go on.
+HUNK_MERGE_MIN_CHARS = 8000
+HUNK_CONTEXT_LINES = 5
+RESOLUTION_HEADER_RE = re.compile(r"(?m)^=== RESOLUTION (\d+) ===[ \t]*$\n?")
+
+TokenCallback = Callable[[str], None]
+
+
+class MergeCancelled(Exception):
+    """Raised from an ``on_token`` callback to stop a streaming merge."""
+
+
 MERGE_PROMPT = """You are merging an agent skill file.
 The upstream base changed, and the user has local customizations.
 
@@ -57,6 +80,44 @@ Rules:
 
 === MERGED RESULT ==="""
 
+HUNK_MERGE_PROMPT = """You are resolving merge conflicts in an agent skill file.
+The upstream base changed, and the user has local customizations. Only the conflicting
+regions are shown, each with a few lines of already-merged context around it.
+
+For each conflict, return the lines that should replace it (without the context lines).
+Reply with one block per conflict, in order, each starting with its header line exactly:
+=== RESOLUTION 1 ===
+<replacement lines>
+
+Rules:
+1) Keep upstream improvements from NEW REMOTE.
+2) Preserve the user's local intent from CURRENT LIVE and the local flavor text.
+3) If NEW REMOTE contradicts, weakens, or undermines the user's local intent, rewrite the remote instructions so the result stays compatible with it.
+4) Do not keep contradictory instructions side-by-side.
+5) Preserve valid Markdown structure.
+
+=== USER'S LOCAL FLAVOR TEXT ===
+{flavor}
+
+=== USER MERGE INSTRUCTION ===
+{instruction}
+
+{conflicts}
+=== RESOLUTIONS ==="""
+
+HUNK_PROMPT_SECTION = """=== CONFLICT {number} ===
+--- context before ---
+{before}
+--- old base ---
+{base}
+--- new remote ---
+{remote}
+--- current live ---
+{local}
+--- context after ---
+{after}
+"""
+
 WIZARD_CHAT_SYSTEM_PROMPT = """You are Chef Jeremy, an onboarding wizard-chef for SkillChef.
 You help users understand what is happening in the current onboarding step.
 
@@ -69,6 +130,13 @@ Style rules:
 """
 
 
+def completion(**kwargs: Any) -> Any:
+    # litellm takes seconds to import, so load it only when a model is actually called.
+    from litellm import completion as litellm_completion
+
+    return litellm_completion(**kwargs)
+
+
 def detect_keys() -> list[tuple[str, str]]:
     return [(k, v) for k, v in LLM_KEY_MAP if os.environ.get(k)]
 
@@ -108,6 +176,7 @@ def _resolve_model(configured_model: str, env_var: str | None, model_override: s
     return configured_model
 
 
+@profiling.traced("llm.semantic_merge")
 def semantic_merge(
     old_base: str,
     new_remote: str,
@@ -116,23 +185,37 @@ def semantic_merge(
     current_live: str | None = None,
     instruction: str | None = None,
     scope: str = "global",
+    on_token: TokenCallback | None = None,
 ) -> str:
-    cfg = config.load(scope=scope)
-    configured_model = cfg.get("model", "anthropic/claude-sonnet-4-5")
-    configured_env = cfg.get("llm_api_key_env", "")
-    key = selected_key(configured_env)
-    env_var = key[0] if key else None
-    model = _resolve_model(configured_model, env_var, model)
-
-    completion_kwargs: dict[str, str | int | list[dict[str, str]]] = {}
-    if key:
-        env_var, _provider = key
-        value = os.environ.get(env_var, "")
-        if value:
-            if env_var == "OLLAMA_API_BASE":
-                completion_kwargs["api_base"] = value
+    """Merge upstream changes into the user's skill with the configured LLM.
+
+    For large skills with local edits, only the conflicting hunks are sent and the
+    answers are spliced back in; anything else uses a whole-document prompt.
+    With ``on_token``, the merged text is streamed to it piece by piece as it arrives.
+    Hunk replies are not merged text, so they are streamed too but each piece only
+    reaches ``on_token`` as ``""``; raising MergeCancelled from it still stops the call.
+    """
+    if current_live and _use_hunk_merge(old_base, new_remote, current_live):
+        live_body, _ = merge.split_local_flavor_section(current_live)
+        result = merge.three_way_merge(old_base, live_body, new_remote)
+        if result.conflicts:
+            checkpoint = None if on_token is None else lambda _delta: on_token("")
+            try:
+                resolutions = hunk_merge(
+                    result,
+                    flavor,
+                    model=model,
+                    instruction=instruction,
+                    scope=scope,
+                    on_token=checkpoint,
+                )
+            except ValueError:
+                pass
             else:
-                completion_kwargs["api_key"] = value
+                merged = merge.merge_skill_text(result.render(resolutions), flavor).strip()
+                if on_token is not None:
+                    on_token(merged)
+                return merged
 
     prompt = MERGE_PROMPT.format(
         old_base=old_base,
@@ -141,26 +224,42 @@ def semantic_merge(
         flavor=flavor,
         instruction=instruction or "No extra instruction.",
     )
-    try:
-        resp = completion(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            **completion_kwargs,
-        )
-        content = resp.choices[0].message.content.strip()
-        _append_llm_log(
-            model=model,
-            prompt=prompt,
-            response=content,
+    return _merge_completion(prompt, model=model, scope=scope, on_token=on_token)
+
+
+def hunk_merge(
+    result: merge.ThreeWayMerge,
+    flavor: str,
+    model: str | None = None,
+    instruction: str | None = None,
+    scope: str = "global",
+    on_token: TokenCallback | None = None,
+) -> list[str]:
+    """Ask the LLM to resolve each conflict in ``result``; one replacement per conflict.
+
+    Raises ValueError when the reply does not contain exactly one block per conflict.
+    """
+    conflicts = result.conflicts
+    sections = [
+        HUNK_PROMPT_SECTION.format(
+            number=number,
+            before=before.rstrip("\n"),
+            base=conflict.base.rstrip("\n"),
+            remote=conflict.remote.rstrip("\n"),
+            local=conflict.local.rstrip("\n"),
+            after=after.rstrip("\n"),
         )
-        return content
-    except Exception as exc:
-        _append_llm_log(
-            model=model,
-            prompt=prompt,
-            response=f"[ERROR] {type(exc).__name__}: {exc}",
+        for number, (conflict, (before, after)) in enumerate(
+            zip(conflicts, result.conflict_context(HUNK_CONTEXT_LINES)), start=1
         )
-        raise
+    ]
+    prompt = HUNK_MERGE_PROMPT.format(
+        flavor=flavor,
+        instruction=instruction or "No extra instruction.",
+        conflicts="\n".join(sections),
+    )
+    content = _merge_completion(prompt, model=model, scope=scope, on_token=on_token)
+    return _parse_resolutions(content, len(conflicts))
 
 
 def wizard_chat(
@@ -220,6 +319,183 @@ def wizard_chat(
         raise
 
 
+def hunk_merge_enabled() -> bool:
+    value = os.environ.get(HUNK_MERGE_ENV, "1").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def _use_hunk_merge(old_base: str, new_remote: str, current_live: str) -> bool:
+    size = len(old_base) + len(new_remote) + len(current_live)
+    return hunk_merge_enabled() and size >= HUNK_MERGE_MIN_CHARS
+
+
+def _parse_resolutions(content: str, expected: int) -> list[str]:
+    parts = RESOLUTION_HEADER_RE.split(content)
+    numbers = [int(number) for number in parts[1::2]]
+    if numbers != list(range(1, expected + 1)):
+        raise ValueError(f"expected {expected} resolutions, got blocks {numbers}")
+    resolutions = []
+    for block in parts[2::2]:
+        block = block.strip("\n")
+        resolutions.append(block + "\n" if block else "")
+    return resolutions
+
+
+def _merge_completion(
+    prompt: str, *, model: str | None, scope: str, on_token: TokenCallback | None = None
+) -> str:
+    cfg = config.load(scope=scope)
+    configured_model = cfg.get("model", "anthropic/claude-sonnet-4-5")
+    configured_env = cfg.get("llm_api_key_env", "")
+    key = selected_key(configured_env)
+    env_var = key[0] if key else None
+    model = _resolve_model(configured_model, env_var, model)
+
+    completion_kwargs: dict[str, str | int | list[dict[str, str]]] = {}
+    if key:
+        env_var, _provider = key
+        value = os.environ.get(env_var, "")
+        if value:
+            if env_var == "OLLAMA_API_BASE":
+                completion_kwargs["api_base"] = value
+            else:
+                completion_kwargs["api_key"] = value
+
+    cache_key = _merge_cache_key(model, prompt)
+    cached = _read_merge_cache(cache_key, scope=scope)
+    if cached is not None:
+        if on_token is not None:
+            on_token(cached)
+        return cached
+    try:
+        with profiling.span("llm.completion", model=model, stream=on_token is not None):
+            if on_token is None:
+                resp = completion(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    **completion_kwargs,
+                )
+                content = resp.choices[0].message.content.strip()
+            else:
+                content = _stream_completion(
+                    on_token,
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    **completion_kwargs,
+                ).strip()
+        _append_llm_log(
+            model=model,
+            prompt=prompt,
+            response=content,
+        )
+        _write_merge_cache(cache_key, model=model, content=content, scope=scope)
+        return content
+    except Exception as exc:
+        _append_llm_log(
+            model=model,
+            prompt=prompt,
+            response=f"[ERROR] {type(exc).__name__}: {exc}",
+        )
+        raise
+
+
+def _stream_completion(on_token: TokenCallback, **kwargs: Any) -> str:
+    stream = completion(stream=True, **kwargs)
+    parts: list[str] = []
+    try:
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                on_token(delta)
+    except BaseException:
+        # Stop the underlying HTTP response too when the caller bails out mid-stream.
+        close = getattr(stream, "close", None)
+        if callable(close):
+            close()
+        raise
+    return "".join(parts)
+
+
+def merge_cache_enabled() -> bool:
+    value = os.environ.get(MERGE_CACHE_ENV, "1").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def _merge_cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()
+
+
+def _read_merge_cache(cache_key: str, *, scope: str) -> str | None:
+    if not merge_cache_enabled():
+        return None
+    path = config.llm_cache_dir(scope=scope) / f"{cache_key}.json"
+    try:
+        if (
+            time.time() - path.stat().st_mtime
+            > _env_number(MERGE_CACHE_TTL_DAYS_ENV, DEFAULT_MERGE_CACHE_TTL_DAYS) * 86400
+        ):
+            path.unlink(missing_ok=True)
+            return None
+        entry = json.loads(path.read_text())
+        # Eviction drops the oldest mtimes first; touching hits makes that LRU.
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    content = entry.get("response") if isinstance(entry, dict) else None
+    return content if isinstance(content, str) else None
+
+
+def _write_merge_cache(cache_key: str, *, model: str, content: str, scope: str) -> None:
+    if not merge_cache_enabled():
+        return
+    cache_dir = config.llm_cache_dir(scope=scope)
+    payload = {
+        "model": model,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "response": content,
+    }
+    tmp: Path | None = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=cache_dir, prefix=f"{cache_key}.", suffix=".tmp")
+        tmp = Path(name)
+        with os.fdopen(fd, "w") as handle:
+            handle.write(json.dumps(payload))
+        os.replace(tmp, cache_dir / f"{cache_key}.json")
+        _evict_merge_cache(cache_dir)
+    except OSError:
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+
+
+def _evict_merge_cache(cache_dir: Path) -> None:
+    entries = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            info = path.stat()
+        except OSError:
+            continue
+        entries.append((info.st_mtime, info.st_size, path))
+    limit = _env_number(MERGE_CACHE_MAX_MB_ENV, DEFAULT_MERGE_CACHE_MAX_MB) * 1024 * 1024
+    ttl = _env_number(MERGE_CACHE_TTL_DAYS_ENV, DEFAULT_MERGE_CACHE_TTL_DAYS) * 86400
+    now = time.time()
+    total = sum(size for _mtime, size, _path in entries)
+    for mtime, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= limit and now - mtime <= ttl:
+            continue
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name, "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else default
+    except ValueError:
+        return default
+
+
 def _append_llm_log(model: str, prompt: str, response: str | None) -> None:
     try:
         log_dir = Path(os.environ.get("SKILLCHEF_LLM_LOG_DIR", ".skillchef-logs"))
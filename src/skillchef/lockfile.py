@@ -0,0 +1,80 @@
+"""``skillchef.lock``: the pinned sources that reproduce a store on another machine."""
+
+from __future__ import annotations
+
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import tomli_w
+
+from skillchef import remote, store
+
+LOCKFILE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class LockedSkill:
+    name: str
+    remote_url: str
+    remote_type: str
+    source_commit_sha: str
+    base_sha256: str
+    active_flavor: str
+    platforms: tuple[str, ...]
+
+    @classmethod
+    def from_meta(cls, meta: dict[str, Any]) -> LockedSkill:
+        return cls(
+            name=str(meta["name"]),
+            remote_url=str(meta.get("remote_url", "")),
+            remote_type=str(meta.get("remote_type", "")),
+            source_commit_sha=str(meta.get("source_commit_sha", "")),
+            base_sha256=str(meta.get("base_sha256", "")),
+            active_flavor=str(meta.get("active_flavor") or store.DEFAULT_FLAVOR_NAME),
+            platforms=tuple(str(p) for p in meta.get("platforms", [])),
+        )
+
+    @property
+    def pinned_source(self) -> str:
+        """The source to fetch: GitHub repo sources at the locked commit, others as recorded."""
+        return remote.pinned_source(self.remote_url, self.source_commit_sha)
+
+
+def snapshot(scope: str = "auto") -> list[LockedSkill]:
+    return [LockedSkill.from_meta(meta) for meta in store.list_skills(scope=scope)]
+
+
+def write(path: Path, skills: list[LockedSkill]) -> None:
+    entries = [
+        {
+            "name": skill.name,
+            "remote_url": skill.remote_url,
+            "remote_type": skill.remote_type,
+            "source_commit_sha": skill.source_commit_sha,
+            "base_sha256": skill.base_sha256,
+            "active_flavor": skill.active_flavor,
+            "platforms": list(skill.platforms),
+        }
+        for skill in sorted(skills, key=lambda skill: skill.name)
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(tomli_w.dumps({"version": LOCKFILE_VERSION, "skills": entries}).encode())
+
+
+def read(path: Path) -> list[LockedSkill]:
+    """Load a lockfile. Raises OSError if it cannot be read and ValueError if it is malformed."""
+    try:
+        data = tomllib.loads(path.read_text())
+    except tomllib.TOMLDecodeError as exc:
+        raise ValueError(f"{path} is not valid TOML: {exc}") from exc
+    if data.get("version") != LOCKFILE_VERSION:
+        raise ValueError(f"{path} has unsupported lockfile version {data.get('version')!r}")
+
+    skills: list[LockedSkill] = []
+    for entry in data.get("skills", []):
+        if not isinstance(entry, dict) or not entry.get("name") or not entry.get("remote_url"):
+            raise ValueError(f"{path} has a skill entry without a name or remote_url")
+        skills.append(LockedSkill.from_meta(entry))
+    return skills
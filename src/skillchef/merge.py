@@ -1,19 +1,69 @@
 from __future__ import annotations
 
 import difflib
-import re
+from collections.abc import Hashable, Iterator, Sequence
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TypeVar
+
+from skillchef.skilldoc import Section, parse_skill, split_frontmatter
+
+T = TypeVar("T", bound=Hashable)
 
-FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?\n)---\s*\n", re.DOTALL)
 FLAVOR_HEADER = "\n\n## Local Flavor\n\n"
-FLAVOR_SECTION_RE = re.compile(r"(?m)^##\s+Local Flavor\s*$")
+FLAVOR_TITLE = "Local Flavor"
+CONFLICT_START = "<<<<<<< local"
+CONFLICT_BASE = "||||||| base"
+CONFLICT_SEP = "======="
+CONFLICT_END = ">>>>>>> remote"
+
+
+@dataclass(frozen=True)
+class MergeConflict:
+    base: str
+    local: str
+    remote: str
+
 
+@dataclass(frozen=True)
+class ThreeWayMerge:
+    chunks: tuple[str | MergeConflict, ...]
 
-def split_frontmatter(text: str) -> tuple[str, str]:
-    m = FRONTMATTER_RE.match(text)
-    if m:
-        return text[: m.end()], text[m.end() :]
-    return "", text
+    @property
+    def conflicts(self) -> list[MergeConflict]:
+        return [chunk for chunk in self.chunks if isinstance(chunk, MergeConflict)]
+
+    @property
+    def clean(self) -> bool:
+        return not self.conflicts
+
+    def conflict_context(self, lines: int) -> list[tuple[str, str]]:
+        """Up to ``lines`` merged lines before and after each conflict."""
+        contexts: list[tuple[str, str]] = []
+        for index, chunk in enumerate(self.chunks):
+            if not isinstance(chunk, MergeConflict):
+                continue
+            before = self.chunks[index - 1] if index > 0 else ""
+            after = self.chunks[index + 1] if index + 1 < len(self.chunks) else ""
+            before_lines = before.splitlines(keepends=True) if isinstance(before, str) else []
+            after_lines = after.splitlines(keepends=True) if isinstance(after, str) else []
+            contexts.append(
+                ("".join(before_lines[-lines:] if lines else []), "".join(after_lines[:lines]))
+            )
+        return contexts
+
+    def render(self, resolutions: list[str] | None = None) -> str:
+        """Join the merge, filling conflicts from ``resolutions`` or with diff3 markers."""
+        pending = list(resolutions) if resolutions is not None else None
+        parts: list[str] = []
+        for chunk in self.chunks:
+            if isinstance(chunk, str):
+                parts.append(chunk)
+            elif pending is not None:
+                parts.append(_ensure_newline(pending.pop(0)))
+            else:
+                parts.append(_conflict_markers(chunk))
+        return "".join(parts)
 
 
 def merge_skill(live_skill_path: Path, flavor_path: Path) -> None:
@@ -31,11 +81,13 @@ def merge_skill_text(base_text: str, flavor_text: str) -> str:
 
 
 def split_local_flavor_section(text: str) -> tuple[str, str | None]:
-    match = FLAVOR_SECTION_RE.search(text)
-    if not match:
+    doc = parse_skill(text)
+    index = doc.find(FLAVOR_TITLE, level=2)
+    if index is None:
         return text, None
-    base = text[: match.start()]
-    flavor = text[match.end() :]
+    front = doc.frontmatter.text if doc.frontmatter else ""
+    base = front + "".join(section.text for section in doc.sections[:index])
+    flavor = doc.sections[index].body + "".join(s.text for s in doc.sections[index + 1 :])
     return _ensure_newline(base.rstrip()), flavor.strip("\n")
 
 
@@ -45,14 +97,76 @@ def has_non_flavor_local_changes(old_base: str, current_live: str) -> bool:
 
 
 def diff_texts(old: str, new: str, label_old: str = "old", label_new: str = "new") -> list[str]:
-    return list(
-        difflib.unified_diff(
-            old.splitlines(keepends=True),
-            new.splitlines(keepends=True),
-            fromfile=label_old,
-            tofile=label_new,
-        )
+    """Unified diff of ``old`` and ``new``; unchanged sections are matched by digest."""
+    if old == new:
+        return []
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    groups = _grouped_opcodes(_section_opcodes(parse_skill(old).nodes, parse_skill(new).nodes))
+    if not groups:
+        return []
+    out = [f"--- {label_old}\n", f"+++ {label_new}\n"]
+    for group in groups:
+        first, last = group[0], group[-1]
+        old_range = _unified_range(first[1], last[2])
+        new_range = _unified_range(first[3], last[4])
+        out.append(f"@@ -{old_range} +{new_range} @@\n")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                out.extend(" " + line for line in old_lines[i1:i2])
+                continue
+            out.extend("-" + line for line in old_lines[i1:i2])
+            out.extend("+" + line for line in new_lines[j1:j2])
+    return out
+
+
+def three_way_merge(base: str, local: str, remote: str) -> ThreeWayMerge:
+    """diff3-style merge of the ``base -> local`` and ``base -> remote`` edits.
+
+    Edits that touch different lines are combined; overlapping ones become conflicts.
+    Sections that match on all three sides are paired up by digest and copied through,
+    so only changed sections are compared line by line.
+    """
+    chunks: list[str | MergeConflict] = []
+
+    def emit(text: str) -> None:
+        if not text:
+            return
+        if chunks and isinstance(chunks[-1], str):
+            chunks[-1] += text
+        else:
+            chunks.append(text)
+
+    base_nodes, local_nodes, remote_nodes = (
+        parse_skill(_ensure_newline(text)).nodes for text in (base, local, remote)
     )
+    for stable, *parts in _merge_regions(base_nodes, local_nodes, remote_nodes):
+        base_text, local_text, remote_text = ("".join(node.text for node in p) for p in parts)
+        if stable:
+            emit(base_text)
+            continue
+        resolved = _resolve_region(base_text, local_text, remote_text)
+        if resolved is not None:
+            emit(resolved)
+            continue
+        for line_stable, *line_parts in _merge_regions(
+            base_text.splitlines(keepends=True),
+            local_text.splitlines(keepends=True),
+            remote_text.splitlines(keepends=True),
+        ):
+            base_chunk, local_chunk, remote_chunk = ("".join(p) for p in line_parts)
+            resolved = (
+                base_chunk
+                if line_stable
+                else _resolve_region(base_chunk, local_chunk, remote_chunk)
+            )
+            if resolved is not None:
+                emit(resolved)
+            else:
+                chunks.append(
+                    MergeConflict(base=base_chunk, local=local_chunk, remote=remote_chunk)
+                )
+    return ThreeWayMerge(chunks=tuple(chunks))
 
 
 def three_way_summary(old_base: str, new_remote: str, flavor: str) -> str:
@@ -67,6 +181,153 @@ def three_way_summary(old_base: str, new_remote: str, flavor: str) -> str:
     return "".join(lines)
 
 
+def _merge_regions(
+    base: Sequence[T], local: Sequence[T], remote: Sequence[T]
+) -> Iterator[tuple[bool, Sequence[T], Sequence[T], Sequence[T]]]:
+    """Walk the three sequences as alternating changed and stable ``(stable, b, l, r)`` slices."""
+    base_pos = local_pos = remote_pos = 0
+    for base_start, base_end, local_start, local_end, remote_start, remote_end in _sync_regions(
+        base, local, remote
+    ):
+        if base_pos < base_start or local_pos < local_start or remote_pos < remote_start:
+            yield (
+                False,
+                base[base_pos:base_start],
+                local[local_pos:local_start],
+                remote[remote_pos:remote_start],
+            )
+        if base_start < base_end:
+            stable = base[base_start:base_end]
+            yield True, stable, stable, stable
+        base_pos, local_pos, remote_pos = base_end, local_end, remote_end
+
+
+def _resolve_region(base: str, local: str, remote: str) -> str | None:
+    if local == remote or remote == base:
+        return local
+    if local == base:
+        return remote
+    return None
+
+
+def _sync_regions(
+    base: Sequence[Hashable], local: Sequence[Hashable], remote: Sequence[Hashable]
+) -> list[tuple[int, int, int, int, int, int]]:
+    """Return ranges where base, local and remote all agree, ending with an empty sentinel."""
+    local_blocks = difflib.SequenceMatcher(None, base, local, autojunk=False).get_matching_blocks()
+    remote_blocks = difflib.SequenceMatcher(
+        None, base, remote, autojunk=False
+    ).get_matching_blocks()
+    regions: list[tuple[int, int, int, int, int, int]] = []
+    li = ri = 0
+    while li < len(local_blocks) and ri < len(remote_blocks):
+        local_base, local_match, local_len = local_blocks[li]
+        remote_base, remote_match, remote_len = remote_blocks[ri]
+        start = max(local_base, remote_base)
+        end = min(local_base + local_len, remote_base + remote_len)
+        if start < end:
+            local_start = local_match + start - local_base
+            remote_start = remote_match + start - remote_base
+            regions.append(
+                (
+                    start,
+                    end,
+                    local_start,
+                    local_start + end - start,
+                    remote_start,
+                    remote_start + end - start,
+                )
+            )
+        if local_base + local_len < remote_base + remote_len:
+            li += 1
+        else:
+            ri += 1
+    regions.append((len(base), len(base), len(local), len(local), len(remote), len(remote)))
+    return regions
+
+
+Opcode = tuple[str, int, int, int, int]
+
+
+def _section_opcodes(old: Sequence[Section], new: Sequence[Section]) -> list[Opcode]:
+    """Line-level opcodes that only run a line diff inside sections that changed."""
+    old_starts = _line_starts(old)
+    new_starts = _line_starts(new)
+    sections = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    opcodes: list[Opcode] = []
+    for tag, a1, a2, b1, b2 in sections.get_opcodes():
+        i1, i2 = old_starts[a1], old_starts[a2]
+        j1, j2 = new_starts[b1], new_starts[b2]
+        if tag == "equal":
+            spans: list[Opcode] = [("equal", i1, i2, j1, j2)]
+        else:
+            old_lines = "".join(node.text for node in old[a1:a2]).splitlines(True)
+            new_lines = "".join(node.text for node in new[b1:b2]).splitlines(True)
+            inner = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+            spans = [
+                (op, i1 + x1, i1 + x2, j1 + y1, j1 + y2)
+                for op, x1, x2, y1, y2 in inner.get_opcodes()
+            ]
+        for span in spans:
+            if opcodes and span[0] == "equal" and opcodes[-1][0] == "equal":
+                prev = opcodes[-1]
+                opcodes[-1] = ("equal", prev[1], span[2], prev[3], span[4])
+            else:
+                opcodes.append(span)
+    return opcodes
+
+
+def _grouped_opcodes(opcodes: list[Opcode], context: int = 3) -> list[list[Opcode]]:
+    """Hunks of ``opcodes`` with ``context`` lines around each change, as difflib groups them."""
+    if not opcodes:
+        opcodes = [("equal", 0, 1, 0, 1)]
+    opcodes = list(opcodes)
+    if opcodes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = opcodes[0]
+        opcodes[0] = (tag, max(i1, i2 - context), i2, max(j1, j2 - context), j2)
+    if opcodes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = opcodes[-1]
+        opcodes[-1] = (tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context))
+
+    groups: list[list[Opcode]] = []
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal" and i2 - i1 > context * 2:
+            group.append((tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)))
+            groups.append(group)
+            group = []
+            i1, j1 = max(i1, i2 - context), max(j1, j2 - context)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        groups.append(group)
+    return groups
+
+
+def _line_starts(nodes: Sequence[Section]) -> list[int]:
+    starts = [0]
+    for node in nodes:
+        starts.append(starts[-1] + len(node.text.splitlines()))
+    return starts
+
+
+def _unified_range(start: int, stop: int) -> str:
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    if not length:
+        start -= 1
+    return f"{start + 1},{length}"
+
+
+def _conflict_markers(conflict: MergeConflict) -> str:
+    return (
+        f"{CONFLICT_START}\n{_ensure_newline(conflict.local)}"
+        f"{CONFLICT_BASE}\n{_ensure_newline(conflict.base)}"
+        f"{CONFLICT_SEP}\n{_ensure_newline(conflict.remote)}"
+        f"{CONFLICT_END}\n"
+    )
+
+
 def _normalize_for_compare(text: str) -> str:
     return _ensure_newline(text).rstrip("\n")
 
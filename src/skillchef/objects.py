@@ -0,0 +1,128 @@
+"""Content-addressed file objects shared by the store's skill layers.
+
+Snapshot layers (``base/``, ``served/``) hardlink each file to a sha256-keyed
+object; ``live/`` is edited in place, so it gets reflinked copies instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from skillchef import config
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Linux FICLONE ioctl: share extents copy-on-write on btrfs, XFS and friends.
+FICLONE = 0x40049409
+HASH_CHUNK_SIZE = 1024 * 1024
+_EXECUTABLE_SUFFIX = "-x"
+_TEMP_PREFIX = ".tmp-"
+
+
+@dataclass(frozen=True)
+class GcResult:
+    removed: int
+    freed_bytes: int
+
+
+def objects_dir(scope: str = "auto") -> Path:
+    return config.scope_home(scope=scope) / "objects"
+
+
+def link_tree(source: Path, dest: Path, scope: str = "auto") -> None:
+    """Copy ``source`` to ``dest`` with every file hardlinked to its stored object."""
+    root = objects_dir(scope=scope)
+
+    def link_file(src: str, dst: str) -> None:
+        _link_or_copy(store_object(Path(src), root), Path(dst))
+
+    shutil.copytree(source, dest, copy_function=link_file)
+
+
+def clone_tree(source: Path, dest: Path) -> None:
+    """Copy ``source`` to ``dest`` as independent, editable files."""
+    shutil.copytree(source, dest, copy_function=clone_file)
+
+
+def store_object(path: Path, root: Path) -> Path:
+    """Add ``path`` to the object store under ``root`` and return the object path."""
+    digest = file_sha256(path)
+    executable = bool(path.stat().st_mode & stat.S_IXUSR)
+    obj = root / digest[:2] / (digest[2:] + (_EXECUTABLE_SUFFIX if executable else ""))
+    if obj.exists():
+        return obj
+
+    obj.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=obj.parent, prefix=_TEMP_PREFIX)
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        shutil.copyfile(path, tmp)
+        tmp.chmod(0o755 if executable else 0o644)
+        os.replace(tmp, obj)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return obj
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(HASH_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def clone_file(src: str | Path, dst: str | Path) -> None:
+    """Copy ``src`` to ``dst``, sharing extents copy-on-write where the filesystem can."""
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as source, open(dst, "wb") as dest:
+                fcntl.ioctl(dest.fileno(), FICLONE, source.fileno())
+        except OSError:
+            Path(dst).unlink(missing_ok=True)
+        else:
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
+
+def collect_garbage(scope: str = "auto") -> GcResult:
+    """Delete objects that no skill layer or backup links to any more."""
+    root = objects_dir(scope=scope)
+    if not root.exists():
+        return GcResult(removed=0, freed_bytes=0)
+
+    removed = 0
+    freed = 0
+    for fanout in sorted(root.iterdir()):
+        if not fanout.is_dir():
+            continue
+        for obj in sorted(fanout.iterdir()):
+            info = obj.lstat()
+            if obj.name.startswith(_TEMP_PREFIX) or info.st_nlink > 1:
+                continue
+            obj.unlink()
+            removed += 1
+            freed += info.st_size
+        if not any(fanout.iterdir()):
+            fanout.rmdir()
+    return GcResult(removed=removed, freed_bytes=freed)
+
+
+def _link_or_copy(obj: Path, dest: Path) -> None:
+    try:
+        os.link(obj, dest)
+    except OSError:
+        # Cross-device stores, link-count limits or filesystems without hardlinks.
+        shutil.copy2(obj, dest)
@@ -0,0 +1,148 @@
+"""Opt-in timing spans for finding where a slow command spends its time.
+
+Recording is off unless ``--profile``/``--trace`` or ``SKILLCHEF_TRACE`` turns it on,
+and a disabled span costs one flag check.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+TRACE_ENV = "SKILLCHEF_TRACE"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class Span:
+    name: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    args: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class SpanSummary:
+    name: str
+    count: int
+    total_seconds: float
+    max_seconds: float
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+
+_enabled = False
+_lock = threading.Lock()
+_spans: list[Span] = []
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    global _enabled
+    with _lock:
+        _spans.clear()
+    _enabled = False
+
+
+def trace_path_from_env() -> Path | None:
+    value = os.environ.get(TRACE_ENV, "").strip()
+    return Path(value) if value else None
+
+
+@contextmanager
+def span(name: str, **args: object) -> Iterator[None]:
+    """Time the enclosed block as ``name``; ``args`` show up in the Chrome trace."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        record = Span(
+            name=name,
+            start_ns=start,
+            duration_ns=time.perf_counter_ns() - start,
+            thread_id=threading.get_ident(),
+            args={key: str(value) for key, value in args.items()},
+        )
+        with _lock:
+            _spans.append(record)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator form of :func:`span`."""
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*a: Any, **kw: Any) -> Any:
+            with span(name):
+                return fn(*a, **kw)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def spans() -> list[Span]:
+    with _lock:
+        return list(_spans)
+
+
+def summarize() -> list[SpanSummary]:
+    """Per-name totals, slowest first."""
+    totals: dict[str, list[int]] = {}
+    for item in spans():
+        totals.setdefault(item.name, []).append(item.duration_ns)
+    rows = [
+        SpanSummary(
+            name=name,
+            count=len(durations),
+            total_seconds=sum(durations) / 1e9,
+            max_seconds=max(durations) / 1e9,
+        )
+        for name, durations in totals.items()
+    ]
+    return sorted(rows, key=lambda row: row.total_seconds, reverse=True)
+
+
+def write_chrome_trace(path: Path) -> None:
+    """Write recorded spans in the Chrome trace event format (chrome://tracing, Perfetto)."""
+    recorded = spans()
+    origin = min((item.start_ns for item in recorded), default=0)
+    pid = os.getpid()
+    events = [
+        {
+            "name": item.name,
+            "cat": item.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": (item.start_ns - origin) / 1000,
+            "dur": item.duration_ns / 1000,
+            "pid": pid,
+            "tid": item.thread_id,
+            "args": item.args,
+        }
+        for item in recorded
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
@@ -1,24 +1,55 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import io
 import json
 import logging
+import os
 import re
 import shutil
 import subprocess
+import tarfile
 import tempfile
+import threading
 import time
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any, cast
 from urllib.parse import urlparse
 
 import httpx
 
+from skillchef import config, profiling
+
 logger = logging.getLogger(__name__)
 
 REQUEST_TIMEOUT_SECONDS = 30.0
 REQUEST_MAX_ATTEMPTS = 3
 REQUEST_BACKOFF_SECONDS = 0.25
+REQUEST_MAX_CONNECTIONS = 20
+REQUEST_MAX_KEEPALIVE_CONNECTIONS = 10
+REQUEST_KEEPALIVE_EXPIRY_SECONDS = 30.0
+DEFAULT_FETCH_CONCURRENCY = 8
+HTTP_MAX_CONNECTIONS_ENV = "SKILLCHEF_HTTP_MAX_CONNECTIONS"
+HTTP_MAX_KEEPALIVE_ENV = "SKILLCHEF_HTTP_MAX_KEEPALIVE"
+
+GIT_CACHE_ENV = "SKILLCHEF_GIT_CACHE"
+GIT_CACHE_MAX_MB_ENV = "SKILLCHEF_GIT_CACHE_MAX_MB"
+DEFAULT_GIT_CACHE_MAX_MB = 1024
+GIT_CACHE_STAMP = "skillchef-last-used"
+VALIDATORS_FILENAME = "validators.json"
+
+GITHUB_FETCH_ENV = "SKILLCHEF_GITHUB_FETCH"
+GITHUB_FETCH_BACKENDS = ("auto", "git", "tarball")
+TARBALL_AUTO_MAX_MB_ENV = "SKILLCHEF_TARBALL_AUTO_MAX_MB"
+DEFAULT_TARBALL_AUTO_MAX_MB = 20
+TARBALL_CHUNK_SIZE = 64 * 1024
+CODELOAD_URL = "https://codeload.github.com/{owner}/{repo}/tar.gz/{ref}"
+RAW_BLOB_URL = "https://raw.githubusercontent.com/{owner}/{repo}/{ref}/{path}"
 
 GITHUB_BLOB_RE = re.compile(
     r"github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)/blob/(?P<ref>[^/]+)/(?P<path>.+)"
@@ -27,6 +58,7 @@ GITHUB_TREE_RE = re.compile(
     r"github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)/tree/(?P<ref>[^/]+)/(?P<path>.+)"
 )
 GITHUB_GIST_RE = re.compile(r"gist\.github\.com/(?:[^/]+/)?(?P<gist_id>[A-Za-z0-9]+)")
+COMMIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
 
 
 class RemoteError(RuntimeError):
@@ -45,6 +77,14 @@ class PublishError(RemoteError):
     """Raised when remote publishing fails."""
 
 
+class NotModifiedError(RemoteError):
+    """Raised when a conditional fetch finds the remote content unchanged."""
+
+
+class TarballTooLargeError(FetchError):
+    """Raised when an automatically chosen codeload tarball outgrows its size cap."""
+
+
 @dataclass(frozen=True)
 class PublishCredentials:
     gh_installed: bool
@@ -80,20 +120,87 @@ def classify(source: str) -> str:
     raise ValueError(f"Cannot classify source: {source}")
 
 
-def fetch(source: str) -> tuple[Path, str]:
+def fetch(source: str, *, validators: dict[str, str] | None = None) -> tuple[Path, str]:
     """Fetch skill content into a temp directory.
     Returns (temp_dir_path, remote_type).
     Caller is responsible for cleanup.
+
+    ``validators`` holds the ``source_etag``/``source_last_modified`` values from a
+    previous fetch; HTTP and gist sources raise NotModifiedError when they still match.
     """
     kind = classify(source)
     if kind == "local":
         return _fetch_local(source), kind
     if kind == "github":
-        return _fetch_github(source), kind
-    return _fetch_http(source), kind
+        return _fetch_github(source, validators=validators), kind
+    return _fetch_http(source, validators=validators), kind
+
+
+async def fetch_async(source: str, *, validators: dict[str, str] | None = None) -> tuple[Path, str]:
+    """Async counterpart of :func:`fetch`; runs it in a worker thread.
+
+    Git and HTTP calls block, so overlapping fetches each get their own thread while
+    sharing the pooled :func:`http_client`.
+    """
+    return await asyncio.to_thread(fetch, source, validators=validators)
+
+
+async def fetch_many(
+    sources: list[str],
+    *,
+    concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+    validators: list[dict[str, str] | None] | None = None,
+) -> list[tuple[Path, str] | Exception]:
+    """Fetch ``sources`` concurrently, at most ``concurrency`` at a time.
+
+    Returns one entry per source, in order: the :func:`fetch` result or the
+    exception it raised. Caller is responsible for cleanup.
+    """
+    if validators is not None and len(validators) != len(sources):
+        raise ValueError("validators must have one entry per source.")
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch_one(index: int) -> tuple[Path, str]:
+        async with semaphore:
+            return await fetch_async(
+                sources[index], validators=validators[index] if validators else None
+            )
+
+    results = await asyncio.gather(
+        *(fetch_one(index) for index in range(len(sources))), return_exceptions=True
+    )
+
+    outcomes: list[tuple[Path, str] | Exception] = []
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            _discard_fetched([item[0] for item in results if isinstance(item, tuple)])
+            raise result
+        outcomes.append(result)
+    return outcomes
+
+
+def fetched_validators(fetched_dir: Path) -> dict[str, str]:
+    """Return the HTTP cache validators recorded for a fetched directory, in meta form."""
+    validators = {"source_etag": "", "source_last_modified": ""}
+    if fetched_dir.name != "skill":
+        return validators
+    try:
+        recorded = json.loads((fetched_dir.parent / VALIDATORS_FILENAME).read_text())
+    except (OSError, ValueError):
+        return validators
+    if isinstance(recorded, dict):
+        for key in validators:
+            validators[key] = str(recorded.get(key, "")).strip()
+    return validators
 
 
-def source_metadata(source: str, remote_type: str | None = None) -> dict[str, str]:
+def source_metadata(
+    source: str, remote_type: str | None = None, *, commit_sha: str = ""
+) -> dict[str, str]:
+    """Provenance fields for ``meta.toml``.
+
+    Pass ``commit_sha`` when the commit is already known to skip the GitHub API lookup.
+    """
     kind = remote_type or classify(source)
     metadata = {
         "source_type": kind,
@@ -109,7 +216,7 @@ def source_metadata(source: str, remote_type: str | None = None) -> dict[str, st
         parsed = _parse_github_source(source)
         if parsed:
             owner, repo, ref, path = parsed
-            commit_sha = _resolve_github_commit(owner, repo, ref)
+            commit_sha = commit_sha or _memoized_commit(owner, repo, ref, _resolve_github_commit)
             metadata.update(
                 {
                     "source_repo": f"{owner}/{repo}",
@@ -141,6 +248,54 @@ def source_metadata(source: str, remote_type: str | None = None) -> dict[str, st
     return metadata
 
 
+def pinned_source(source: str, commit_sha: str) -> str:
+    """Return a GitHub blob/tree ``source`` with its ref replaced by ``commit_sha``.
+
+    Other sources, and an empty ``commit_sha``, come back unchanged.
+    """
+    if not commit_sha:
+        return source
+    for regex in (GITHUB_BLOB_RE, GITHUB_TREE_RE):
+        match = regex.search(source)
+        if match:
+            return source[: match.start("ref")] + commit_sha + source[match.end("ref") :]
+    return source
+
+
+def current_commit_sha(source: str) -> str:
+    """Resolve the upstream commit a GitHub repo source points at, without fetching content.
+
+    Returns an empty string for non-repo sources or when the ref cannot be resolved.
+    """
+    parsed = _parse_github_source(source)
+    if not parsed:
+        return ""
+    owner, repo, ref, _path = parsed
+    return _memoized_commit(owner, repo, ref, _lookup_commit)
+
+
+@contextmanager
+def shared_commit_lookups() -> Iterator[None]:
+    """Resolve each GitHub ``(owner, repo, ref)`` at most once while the block runs.
+
+    Bulk commands wrap their work in this so sync pre-checks and the metadata that
+    ``store.cook``/``store.update_base`` write share one lookup per repo ref instead of
+    one API request per skill. Nested blocks reuse the outer one.
+    """
+    global _commit_memo
+    with _commit_memo_lock:
+        outermost = _commit_memo is None
+        if outermost:
+            _commit_memo = {}
+    try:
+        yield
+    finally:
+        if outermost:
+            with _commit_memo_lock:
+                _commit_memo = None
+                _commit_key_locks.clear()
+
+
 def derive_child_source(source: str, *, remote_type: str, rel_path: Path) -> str:
     normalized_rel_path = Path(rel_path)
     if normalized_rel_path == Path("."):
@@ -175,7 +330,12 @@ def _fetch_local(source: str) -> Path:
     return tmp_skill
 
 
-def _fetch_github(source: str) -> Path:
+def _fetch_github(source: str, *, validators: dict[str, str] | None = None) -> Path:
+    if uses_blob_fast_path(source):
+        blob = _fetch_github_blob(source, validators=validators)
+        if blob is not None:
+            return blob
+
     parsed = _parse_github_source(source)
     if parsed:
         owner, repo, ref, path = parsed
@@ -183,7 +343,7 @@ def _fetch_github(source: str) -> Path:
 
     gist_id = _parse_gist_source(source)
     if gist_id:
-        return _fetch_gist(gist_id)
+        return _fetch_gist(gist_id, validators=validators)
 
     if not parsed:
         raise ValueError(
@@ -193,15 +353,128 @@ def _fetch_github(source: str) -> Path:
 
 
 def _fetch_github_path(owner: str, repo: str, ref: str, path: str) -> Path:
+    result = _fetch_github_paths(owner, repo, ref, [path])[0]
+    if isinstance(result, FetchError):
+        raise result
+    return result
+
+
+def uses_blob_fast_path(source: str) -> bool:
+    """Whether a GitHub ``/blob/`` source is fetched as one raw file rather than via git.
+
+    Only ``SKILLCHEF_GITHUB_FETCH=git`` turns the fast path off.
+    """
+    return GITHUB_BLOB_RE.search(source) is not None and _requested_backend() != "git"
+
+
+def _raw_blob_url(source: str) -> str:
+    match = GITHUB_BLOB_RE.search(source)
+    if match is None:
+        raise ValueError(f"Not a GitHub blob URL: {source}")
+    return RAW_BLOB_URL.format(**match.groupdict())
+
+
+@profiling.traced("remote.raw_blob")
+def _fetch_github_blob(source: str, *, validators: dict[str, str] | None) -> Path | None:
+    """Fetch a blob source as a raw file; ``None`` means use the git path instead."""
+    url = _raw_blob_url(source)
+    try:
+        response = http_client().get(url, headers=_conditional_headers(validators))
+    except httpx.HTTPError as exc:
+        logger.debug("Raw fetch of %s failed, using git: %s", url, exc)
+        return None
+    return _unpack_raw_blob(url, response)
+
+
+def _unpack_raw_blob(url: str, response: httpx.Response) -> Path | None:
+    if response.status_code not in (httpx.codes.OK, httpx.codes.NOT_MODIFIED):
+        # Private repos answer 404 here; git may still have credentials for them.
+        logger.debug("Raw fetch of %s returned %s, using git", url, response.status_code)
+        return None
+    return _unpack_http_response(url, response)
+
+
+def github_repo_key(source: str) -> tuple[str, str, str] | None:
+    """Return ``(owner, repo, ref)`` for GitHub tree (and git-fetched blob) sources.
+
+    Sources sharing a key can be fetched together with :func:`fetch_repo_paths`; blob
+    sources on the raw fast path return ``None`` since one request each is cheaper.
+    """
+    if uses_blob_fast_path(source):
+        return None
+    parsed = _parse_github_source(source)
+    if not parsed:
+        return None
+    owner, repo, ref, _path = parsed
+    return owner, repo, ref
+
+
+def fetch_repo_paths(sources: list[str]) -> list[Path | FetchError]:
+    """Fetch several GitHub sources from one repository ref using a single sparse clone.
+
+    Returns one entry per source, in order: the fetched skill directory, or the
+    error for a path that was missing upstream. Caller is responsible for cleanup.
+    """
+    parsed = [_parse_github_source(source) for source in sources]
+    keys = {item[:3] for item in parsed if item}
+    if len(keys) != 1 or not all(parsed):
+        raise ValueError("Sources must be GitHub blob/tree URLs sharing one repository ref.")
+    owner, repo, ref = keys.pop()
+    return _fetch_github_paths(owner, repo, ref, [item[3] for item in parsed if item])
+
+
+def _fetch_github_paths(
+    owner: str, repo: str, ref: str, paths: list[str]
+) -> list[Path | FetchError]:
+    choice = github_fetch_backend()
+    if choice != "git":
+        try:
+            return _fetch_github_paths_tarball(
+                owner, repo, ref, paths, max_bytes=_tarball_cap(choice)
+            )
+        except FetchError as exc:
+            if choice == "tarball":
+                raise
+            logger.debug("Codeload tarball for %s/%s failed, using git: %s", owner, repo, exc)
+
     if shutil.which("git") is None:
         raise FetchError("Git is required to fetch GitHub repository paths.")
 
-    tmp = Path(tempfile.mkdtemp(prefix="skillchef-"))
-    clone_dir = tmp / "repo"
-    skill_dir = tmp / "skill"
-    skill_dir.mkdir()
+    if git_cache_enabled():
+        try:
+            return _fetch_github_paths_from_mirror(owner, repo, ref, paths)
+        except FetchError as exc:
+            _warn_mirror_fallback(owner, repo, exc)
+    return _fetch_github_paths_sparse(owner, repo, ref, paths)
+
+
+def _warn_mirror_fallback(owner: str, repo: str, exc: FetchError) -> None:
+    logger.warning(
+        "Git mirror cache failed for %s/%s, falling back to a fresh clone: %s",
+        owner,
+        repo,
+        exc,
+    )
+
+
+def _fetch_github_paths_sparse(
+    owner: str, repo: str, ref: str, paths: list[str]
+) -> list[Path | FetchError]:
+    checkout_root = Path(tempfile.mkdtemp(prefix="skillchef-"))
+    clone_dir = checkout_root / "repo"
     try:
-        _run_fetch_command(
+        for cmd, cwd in _sparse_checkout_commands(owner, repo, ref, paths, clone_dir):
+            _run_fetch_command(cmd, cwd=cwd)
+        return _carve_checkout_paths(clone_dir, paths)
+    finally:
+        shutil.rmtree(checkout_root, ignore_errors=True)
+
+
+def _sparse_checkout_commands(
+    owner: str, repo: str, ref: str, paths: list[str], clone_dir: Path
+) -> list[tuple[list[str], Path | None]]:
+    return [
+        (
             [
                 "git",
                 "clone",
@@ -210,31 +483,373 @@ def _fetch_github_path(owner: str, repo: str, ref: str, path: str) -> Path:
                 "--no-checkout",
                 _github_clone_url(owner, repo),
                 str(clone_dir),
-            ]
+            ],
+            None,
+        ),
+        (["git", "sparse-checkout", "set", "--no-cone", *dict.fromkeys(paths)], clone_dir),
+        (["git", "fetch", "--depth", "1", "origin", ref], clone_dir),
+        (["git", "checkout", "FETCH_HEAD"], clone_dir),
+    ]
+
+
+def github_fetch_backend() -> str:
+    """Choose how to fetch GitHub repo paths: ``git``, ``tarball`` or ``auto``.
+
+    ``$SKILLCHEF_GITHUB_FETCH`` forces ``git`` or ``tarball``. Otherwise
+    hosts with git and the mirror cache use git, so later fetches only download new
+    objects, and hosts without git use the tarball. With the cache off the rest return
+    ``auto``: try the codeload tarball, which beats a throwaway clone, and switch to git
+    if it grows past ``$SKILLCHEF_TARBALL_AUTO_MAX_MB``.
+    """
+    choice = _requested_backend()
+    if choice != "auto":
+        return choice
+    if shutil.which("git") is None:
+        return "tarball"
+    if git_cache_enabled():
+        return "git"
+    return "auto"
+
+
+def _requested_backend() -> str:
+    choice = (os.environ.get(GITHUB_FETCH_ENV, "") or "auto").strip().lower()
+    if choice not in GITHUB_FETCH_BACKENDS:
+        raise ValueError(
+            f"Unknown GitHub fetch backend {choice!r}; use one of {GITHUB_FETCH_BACKENDS}"
         )
-        _run_fetch_command(["git", "sparse-checkout", "set", "--no-cone", path], cwd=clone_dir)
-        _run_fetch_command(["git", "fetch", "--depth", "1", "origin", ref], cwd=clone_dir)
-        _run_fetch_command(["git", "checkout", "FETCH_HEAD"], cwd=clone_dir)
+    return choice
+
+
+def _tarball_cap(choice: str) -> int | None:
+    if choice != "auto":
+        return None
+    return _env_int(TARBALL_AUTO_MAX_MB_ENV, DEFAULT_TARBALL_AUTO_MAX_MB) * 1024 * 1024
+
 
-        source_path = clone_dir / path
-        if not source_path.exists():
-            raise FetchError(f"Fetched GitHub path was not found after checkout: {path}")
+@profiling.traced("remote.tarball")
+def _fetch_github_paths_tarball(
+    owner: str, repo: str, ref: str, paths: list[str], *, max_bytes: int | None = None
+) -> list[Path | FetchError]:
+    """Fetch ``paths`` by streaming the codeload tarball and extracting only those paths."""
+    url = CODELOAD_URL.format(owner=owner, repo=repo, ref=ref)
+    checkout_root = Path(tempfile.mkdtemp(prefix="skillchef-"))
+    clone_dir = checkout_root / "repo"
+    try:
+        last_error: Exception | None = None
+        for attempt in range(1, REQUEST_MAX_ATTEMPTS + 1):
+            shutil.rmtree(clone_dir, ignore_errors=True)
+            clone_dir.mkdir()
+            try:
+                _stream_tarball_paths(url, clone_dir, paths, max_bytes=max_bytes)
+                return _carve_checkout_paths(clone_dir, paths)
+            except httpx.HTTPError as exc:
+                last_error = exc
+                if attempt == REQUEST_MAX_ATTEMPTS or not _retryable(exc):
+                    break
+                time.sleep(REQUEST_BACKOFF_SECONDS * (2 ** (attempt - 1)))
+        raise FetchError(f"Failed to fetch {url}: {last_error}") from last_error
+    finally:
+        shutil.rmtree(checkout_root, ignore_errors=True)
 
-        _copy_fetched_path(source_path, skill_dir)
-        return skill_dir
+
+def _stream_tarball_paths(url: str, dest: Path, paths: list[str], *, max_bytes: int | None) -> None:
+    wanted = [path.strip("/") for path in paths]
+    pending = set(wanted)
+    inside: set[str] = set()
+    with http_client().stream("GET", url) as response:
+        response.raise_for_status()
+        chunks = _capped_chunks(response.iter_bytes(TARBALL_CHUNK_SIZE), url, max_bytes)
+        stream = io.BufferedReader(_ChunkReader(chunks), buffer_size=TARBALL_CHUNK_SIZE)
+        try:
+            with tarfile.open(fileobj=stream, mode="r|gz") as archive:
+                for member in archive:
+                    rel = _tarball_member_path(member.name)
+                    if rel is None:
+                        continue
+                    matched = {
+                        path for path in pending if rel == path or rel.startswith(path + "/")
+                    }
+                    # git archive lists each directory's entries together, so once a
+                    # requested path is left behind it is complete.
+                    pending -= inside - matched
+                    inside = matched
+                    if not pending:
+                        break
+                    if matched:
+                        _extract_tarball_member(archive, member, dest / rel)
+        except (tarfile.TarError, EOFError, OSError, zlib.error) as exc:
+            raise FetchError(f"Could not read GitHub archive {url}: {exc}") from exc
+
+
+def _tarball_member_path(name: str) -> str | None:
+    # Every entry sits under a single "<repo>-<sha>/" directory.
+    parts = PurePosixPath(name).parts[1:]
+    if not parts or ".." in parts:
+        return None
+    return "/".join(parts)
+
+
+def _extract_tarball_member(
+    archive: tarfile.TarFile, member: tarfile.TarInfo, target: Path
+) -> None:
+    if member.isdir():
+        target.mkdir(parents=True, exist_ok=True)
+        return
+    if not member.isfile():
+        # Links and special files are not part of skills; skip rather than follow them.
+        return
+    source = archive.extractfile(member)
+    if source is None:
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with source, target.open("wb") as out:
+        shutil.copyfileobj(source, out)
+    if member.mode & 0o111:
+        target.chmod(0o755)
+
+
+def _capped_chunks(chunks: Iterator[bytes], url: str, max_bytes: int | None) -> Iterator[bytes]:
+    total = 0
+    for chunk in chunks:
+        total += len(chunk)
+        if max_bytes is not None and total > max_bytes:
+            raise TarballTooLargeError(f"{url} is larger than {max_bytes // (1024 * 1024)} MB")
+        yield chunk
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only file over an iterator of byte chunks, so tarfile can stream a response."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def _carve_checkout_paths(clone_dir: Path, paths: list[str]) -> list[Path | FetchError]:
+    results: list[Path | FetchError] = []
+    try:
+        for path in paths:
+            source_path = clone_dir / path
+            if not source_path.exists():
+                results.append(_missing_path_error(path))
+                continue
+            skill_dir = Path(tempfile.mkdtemp(prefix="skillchef-")) / "skill"
+            skill_dir.mkdir()
+            results.append(skill_dir)
+            _copy_fetched_path(source_path, skill_dir)
+        return results
+    except BaseException:
+        _discard_fetched(results)
+        raise
+
+
+def _missing_path_error(path: str) -> FetchError:
+    return FetchError(f"Fetched GitHub path was not found after checkout: {path}")
+
+
+def _discard_fetched(results: list[Path] | list[Path | FetchError]) -> None:
+    for result in results:
+        if isinstance(result, Path):
+            shutil.rmtree(result.parent, ignore_errors=True)
+
+
+def git_cache_enabled() -> bool:
+    value = os.environ.get(GIT_CACHE_ENV, "1").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+_mirror_locks: dict[Path, threading.Lock] = {}
+_mirror_locks_guard = threading.Lock()
+
+
+def _mirror_lock(mirror: Path) -> threading.Lock:
+    with _mirror_locks_guard:
+        return _mirror_locks.setdefault(mirror, threading.Lock())
+
+
+def _mirror_dir(owner: str, repo: str) -> Path:
+    if {owner, repo} & {"", ".", ".."}:
+        raise FetchError(f"Cannot cache GitHub repository {owner}/{repo}")
+    return config.git_cache_dir() / owner / repo
+
+
+def _fetch_github_paths_from_mirror(
+    owner: str, repo: str, ref: str, paths: list[str]
+) -> list[Path | FetchError]:
+    mirror = _mirror_dir(owner, repo)
+    results: list[Path | FetchError] = []
+    with _mirror_lock(mirror):
+        commit = _update_mirror(mirror, owner, repo, ref)
+        try:
+            for path in paths:
+                results.append(_export_mirror_path(mirror, commit, path))
+        except BaseException:
+            _discard_fetched(results)
+            raise
+        (mirror / GIT_CACHE_STAMP).touch()
+    _evict_git_cache(keep=mirror)
+    return results
+
+
+def _update_mirror(mirror: Path, owner: str, repo: str, ref: str) -> str:
+    if not (mirror / "HEAD").exists():
+        _prepare_mirror_dir(mirror)
+        _run_fetch_command(_mirror_clone_command(owner, repo, mirror))
+    elif COMMIT_SHA_RE.match(ref) and _mirror_has_commit(mirror, ref):
+        # Pinned commits never move, so there is nothing new to download.
+        return ref
+
+    _run_fetch_command(["git", "fetch", "origin", ref], cwd=mirror)
+    return _run_fetch_command(
+        ["git", "rev-parse", "--verify", "FETCH_HEAD^{commit}"], cwd=mirror
+    ).strip()
+
+
+def _prepare_mirror_dir(mirror: Path) -> None:
+    shutil.rmtree(mirror, ignore_errors=True)
+    mirror.parent.mkdir(parents=True, exist_ok=True)
+
+
+def _mirror_clone_command(owner: str, repo: str, mirror: Path) -> list[str]:
+    return [
+        "git",
+        "clone",
+        "--bare",
+        "--filter=blob:none",
+        _github_clone_url(owner, repo),
+        str(mirror),
+    ]
+
+
+def _mirror_has_commit(mirror: Path, commit: str) -> bool:
+    try:
+        _run_fetch_command(["git", "cat-file", "-e", f"{commit}^{{commit}}"], cwd=mirror)
     except FetchError:
+        return False
+    return True
+
+
+def _export_mirror_path(mirror: Path, commit: str, path: str) -> Path | FetchError:
+    try:
+        _run_fetch_command(["git", "cat-file", "-e", f"{commit}:{path}"], cwd=mirror)
+    except FetchError:
+        return _missing_path_error(path)
+
+    tmp = Path(tempfile.mkdtemp(prefix="skillchef-"))
+    try:
+        _run_fetch_command(_mirror_archive_command(tmp, commit, path), cwd=mirror)
+        return _unpack_mirror_archive(tmp, path)
+    except BaseException:
         shutil.rmtree(tmp, ignore_errors=True)
         raise
 
 
+def _mirror_archive_command(tmp: Path, commit: str, path: str) -> list[str]:
+    archive_path = tmp / "export.tar"
+    return ["git", "archive", "--format=tar", "-o", str(archive_path), commit, "--", path]
+
+
+def _unpack_mirror_archive(tmp: Path, path: str) -> Path:
+    archive_path = tmp / "export.tar"
+    export_root = tmp / "export"
+    skill_dir = tmp / "skill"
+    with tarfile.open(archive_path) as archive:
+        if hasattr(tarfile, "data_filter"):
+            archive.extractall(export_root, filter="data")
+        else:
+            archive.extractall(export_root)
+    skill_dir.mkdir()
+    _copy_fetched_path(export_root / path, skill_dir)
+    archive_path.unlink()
+    shutil.rmtree(export_root, ignore_errors=True)
+    return skill_dir
+
+
+def _git_cache_max_bytes() -> int:
+    raw = os.environ.get(GIT_CACHE_MAX_MB_ENV, "").strip()
+    try:
+        max_mb = int(raw) if raw else DEFAULT_GIT_CACHE_MAX_MB
+    except ValueError:
+        max_mb = DEFAULT_GIT_CACHE_MAX_MB
+    return max(0, max_mb) * 1024 * 1024
+
+
+def _mirror_last_used(mirror: Path) -> float:
+    stamp = mirror / GIT_CACHE_STAMP
+    try:
+        return stamp.stat().st_mtime
+    except OSError:
+        return mirror.stat().st_mtime
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for entry in path.rglob("*"):
+        try:
+            if entry.is_file() and not entry.is_symlink():
+                total += entry.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def _evict_git_cache(*, keep: Path | None = None) -> None:
+    root = config.git_cache_dir()
+    if not root.exists():
+        return
+    mirrors = [path for path in root.glob("*/*") if (path / "HEAD").exists()]
+    sizes = {mirror: _dir_size(mirror) for mirror in mirrors}
+    total = sum(sizes.values())
+    limit = _git_cache_max_bytes()
+    for mirror in sorted(mirrors, key=_mirror_last_used):
+        if total <= limit:
+            return
+        if mirror == keep:
+            continue
+        with _mirror_lock(mirror):
+            shutil.rmtree(mirror, ignore_errors=True)
+        total -= sizes[mirror]
+
+
 def _download_raw(url: str, dest: Path) -> None:
     content = _request_bytes_with_retry(url)
     dest.write_bytes(content)
 
 
-def _fetch_gist(gist_id: str) -> Path:
+def _fetch_gist(gist_id: str, *, validators: dict[str, str] | None = None) -> Path:
     api_url = f"https://api.github.com/gists/{gist_id}"
-    data = _request_json_with_retry(api_url, headers={"Accept": "application/vnd.github.v3+json"})
+    response = _request_with_retry(api_url, headers=_gist_headers(validators))
+    skill_dir, downloads = _unpack_gist_response(gist_id, api_url, response)
+    for raw_url, dest in downloads:
+        _download_raw(raw_url, dest)
+    return skill_dir
+
+
+def _gist_headers(validators: dict[str, str] | None) -> dict[str, str]:
+    return {"Accept": "application/vnd.github.v3+json", **_conditional_headers(validators)}
+
+
+def _unpack_gist_response(
+    gist_id: str, api_url: str, response: httpx.Response
+) -> tuple[Path, list[tuple[str, Path]]]:
+    """Write inline gist files; return the skill dir and the (raw_url, dest) left to download."""
+    if response.status_code == httpx.codes.NOT_MODIFIED:
+        raise NotModifiedError(f"GitHub gist has not changed: {gist_id}")
+    data = _response_json(response, api_url)
     if not isinstance(data, dict):
         raise FetchError(f"Unexpected GitHub gist response format for {api_url}")
 
@@ -246,6 +861,7 @@ def _fetch_gist(gist_id: str) -> Path:
     tmp = Path(tempfile.mkdtemp(prefix="skillchef-"))
     skill_dir = tmp / "skill"
     skill_dir.mkdir()
+    downloads: list[tuple[str, Path]] = []
 
     for raw_name, raw_file in files.items():
         if not isinstance(raw_file, dict):
@@ -266,21 +882,52 @@ def _fetch_gist(gist_id: str) -> Path:
         raw_url = str(file_payload.get("raw_url", "")).strip()
         if not raw_url:
             raise FetchError(f"GitHub gist file missing retrievable content for {api_url}")
-        _download_raw(raw_url, dest)
+        downloads.append((raw_url, dest))
 
-    return skill_dir
+    _write_validators(skill_dir, response)
+    return skill_dir, downloads
 
 
-def _fetch_http(source: str) -> Path:
+def _fetch_http(source: str, *, validators: dict[str, str] | None = None) -> Path:
+    response = _request_with_retry(source, headers=_conditional_headers(validators))
+    return _unpack_http_response(source, response)
+
+
+def _unpack_http_response(source: str, response: httpx.Response) -> Path:
+    if response.status_code == httpx.codes.NOT_MODIFIED:
+        raise NotModifiedError(f"Remote file has not changed: {source}")
+
     tmp = Path(tempfile.mkdtemp(prefix="skillchef-"))
     skill_dir = tmp / "skill"
     skill_dir.mkdir()
     parsed = urlparse(source)
     filename = Path(parsed.path).name or "SKILL.md"
-    _download_raw(source, skill_dir / filename)
+    (skill_dir / filename).write_bytes(response.content)
+    _write_validators(skill_dir, response)
     return skill_dir
 
 
+def _conditional_headers(validators: dict[str, str] | None) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if not validators:
+        return headers
+    etag = str(validators.get("source_etag", "")).strip()
+    last_modified = str(validators.get("source_last_modified", "")).strip()
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _write_validators(skill_dir: Path, response: httpx.Response) -> None:
+    validators = {
+        "source_etag": response.headers.get("ETag", ""),
+        "source_last_modified": response.headers.get("Last-Modified", ""),
+    }
+    (skill_dir.parent / VALIDATORS_FILENAME).write_text(json.dumps(validators))
+
+
 def local_skill_candidates(source: str) -> list[Path]:
     src = Path(source).resolve()
     if src.is_file():
@@ -317,6 +964,37 @@ def _parse_gist_source(source: str) -> str | None:
     return match.group("gist_id")
 
 
+_commit_memo: dict[tuple[str, str, str], str] | None = None
+_commit_memo_lock = threading.Lock()
+_commit_key_locks: dict[tuple[str, str, str], threading.Lock] = {}
+
+
+def _memoized_commit(
+    owner: str, repo: str, ref: str, resolve: Callable[[str, str, str], str]
+) -> str:
+    if COMMIT_SHA_RE.match(ref):
+        return ref
+    memo = _commit_memo
+    if memo is None:
+        return resolve(owner, repo, ref)
+    key = (owner, repo, ref)
+    with _commit_memo_lock:
+        key_lock = _commit_key_locks.setdefault(key, threading.Lock())
+    # Concurrent fetch groups asking for the same ref wait for the first lookup.
+    with key_lock:
+        if key in memo:
+            return memo[key]
+        sha = resolve(owner, repo, ref)
+        # A failed lookup returns "", which is left for the next source to retry.
+        if sha:
+            memo[key] = sha
+        return sha
+
+
+def _lookup_commit(owner: str, repo: str, ref: str) -> str:
+    return _ls_remote_commit(owner, repo, ref) or _resolve_github_commit(owner, repo, ref)
+
+
 def _resolve_github_commit(owner: str, repo: str, ref: str) -> str:
     api_url = f"https://api.github.com/repos/{owner}/{repo}/commits/{ref}"
     try:
@@ -340,8 +1018,33 @@ def _resolve_github_commit(owner: str, repo: str, ref: str) -> str:
         return ""
 
 
+def _ls_remote_commit(owner: str, repo: str, ref: str) -> str:
+    if COMMIT_SHA_RE.match(ref):
+        return ref
+    if shutil.which("git") is None:
+        return ""
+    try:
+        output = _run_fetch_command(["git", "ls-remote", _github_clone_url(owner, repo), ref])
+    except FetchError as exc:
+        logger.debug("git ls-remote failed for %s/%s@%s: %s", owner, repo, ref, exc)
+        return ""
+
+    refs: dict[str, str] = {}
+    for line in output.splitlines():
+        sha, _, name = line.strip().partition("\t")
+        if sha and name:
+            refs[name] = sha
+    for name in (f"refs/tags/{ref}^{{}}", f"refs/heads/{ref}", f"refs/tags/{ref}"):
+        if name in refs:
+            return refs[name]
+    return ""
+
+
 def _request_json_with_retry(url: str, *, headers: dict[str, str] | None = None) -> object:
-    response = _request_with_retry(url, headers=headers)
+    return _response_json(_request_with_retry(url, headers=headers), url)
+
+
+def _response_json(response: httpx.Response, url: str) -> object:
     try:
         return response.json()
     except ValueError as exc:
@@ -353,22 +1056,75 @@ def _request_bytes_with_retry(url: str, *, headers: dict[str, str] | None = None
     return response.content
 
 
+_shared_http_client: httpx.Client | None = None
+_shared_http_client_lock = threading.Lock()
+
+
+def http_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client, creating it on first use."""
+    global _shared_http_client
+    with _shared_http_client_lock:
+        if _shared_http_client is None or _shared_http_client.is_closed:
+            _shared_http_client = httpx.Client(**_http_client_options())
+        return _shared_http_client
+
+
+def _http_client_options() -> dict[str, Any]:
+    return {
+        "follow_redirects": True,
+        "timeout": REQUEST_TIMEOUT_SECONDS,
+        "http2": importlib.util.find_spec("h2") is not None,
+        "limits": httpx.Limits(
+            max_connections=_env_int(HTTP_MAX_CONNECTIONS_ENV, REQUEST_MAX_CONNECTIONS),
+            max_keepalive_connections=_env_int(
+                HTTP_MAX_KEEPALIVE_ENV, REQUEST_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=REQUEST_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    }
+
+
+def close_http_client() -> None:
+    global _shared_http_client
+    with _shared_http_client_lock:
+        if _shared_http_client is not None:
+            _shared_http_client.close()
+            _shared_http_client = None
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    try:
+        return max(1, int(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+@profiling.traced("remote.http")
 def _request_with_retry(url: str, *, headers: dict[str, str] | None = None) -> httpx.Response:
     last_error: Exception | None = None
     for attempt in range(1, REQUEST_MAX_ATTEMPTS + 1):
         try:
-            with httpx.Client(follow_redirects=True, timeout=REQUEST_TIMEOUT_SECONDS) as client:
-                response = client.get(url, headers=headers)
-                response.raise_for_status()
+            response = http_client().get(url, headers=headers)
+            if response.status_code == httpx.codes.NOT_MODIFIED:
                 return response
+            response.raise_for_status()
+            return response
         except httpx.HTTPError as exc:
             last_error = exc
-            if attempt == REQUEST_MAX_ATTEMPTS:
+            if attempt == REQUEST_MAX_ATTEMPTS or not _retryable(exc):
                 break
             time.sleep(REQUEST_BACKOFF_SECONDS * (2 ** (attempt - 1)))
     raise FetchError(f"Failed to fetch {url}: {last_error}") from last_error
 
 
+def _retryable(exc: httpx.HTTPError) -> bool:
+    """Retry transport errors and 5xx responses; a 4xx will not change on retry."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return True
+
+
 def detect_publish_credentials() -> PublishCredentials:
     gh_installed = shutil.which("gh") is not None
     git_installed = shutil.which("git") is not None
@@ -392,6 +1148,7 @@ def detect_publish_credentials() -> PublishCredentials:
     )
 
 
+@profiling.traced("remote.create_gist")
 def create_gist(files: list[Path], *, description: str, public: bool) -> str:
     if not files:
         raise PublishError("No files were provided for gist publishing.")
@@ -402,6 +1159,7 @@ def create_gist(files: list[Path], *, description: str, public: bool) -> str:
     return _run_publish_command(cmd)
 
 
+@profiling.traced("remote.update_gist")
 def update_gist(gist: str, files: list[Path], *, description: str) -> str:
     if len(files) != 1:
         raise PublishError("Updating a gist currently supports exactly one file.")
@@ -428,6 +1186,7 @@ def update_gist(gist: str, files: list[Path], *, description: str) -> str:
         shutil.rmtree(tmp_root, ignore_errors=True)
 
 
+@profiling.traced("remote.create_repo")
 def create_repo(source_dir: Path, *, repo_name: str, description: str, public: bool) -> str:
     if not source_dir.exists():
         raise PublishError(f"Skill directory does not exist: {source_dir}")
@@ -478,6 +1237,7 @@ def create_repo(source_dir: Path, *, repo_name: str, description: str, public: b
         shutil.rmtree(tmp_root, ignore_errors=True)
 
 
+@profiling.traced("remote.update_repo")
 def update_repo(repo: str, source_dir: Path, *, description: str) -> str:
     if not source_dir.exists():
         raise PublishError(f"Skill directory does not exist: {source_dir}")
@@ -543,13 +1303,14 @@ def _run_publish_command(cmd: list[str], cwd: Path | None = None) -> str:
 
 def _run_fetch_command(cmd: list[str], cwd: Path | None = None) -> str:
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=str(cwd) if cwd else None,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        with profiling.span("remote.command", cmd=_command_label(cmd)):
+            result = subprocess.run(
+                cmd,
+                cwd=str(cwd) if cwd else None,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
     except FileNotFoundError as exc:
         raise FetchError(f"Command not found: {cmd[0]}") from exc
     except subprocess.CalledProcessError as exc:
@@ -558,6 +1319,11 @@ def _run_fetch_command(cmd: list[str], cwd: Path | None = None) -> str:
     return result.stdout or ""
 
 
+def _command_label(cmd: list[str]) -> str:
+    # "git fetch", "gh api": enough to group spans without leaking URLs or tokens.
+    return " ".join(part for part in cmd[:2] if not part.startswith("-"))
+
+
 def _run_capture_command(cmd: list[str], cwd: Path | None = None) -> str:
     try:
         result = subprocess.run(
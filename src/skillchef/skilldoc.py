@@ -0,0 +1,140 @@
+"""Section tree for SKILL.md documents.
+
+A document is its frontmatter followed by one section per Markdown heading, in
+document order; ``level`` carries the nesting. Each section is keyed by a
+digest of its text, so merges and diffs can skip unchanged sections without
+looking inside them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?\n)---\s*\n", re.DOTALL)
+HEADING_RE = re.compile(r"^(#{1,6})[ \t]+(.*?)[ \t]*#*[ \t]*$")
+FENCE_RE = re.compile(r"^[ \t]{0,3}(`{3,}|~{3,})(.*)$")
+FENCE_CLOSE_RE = re.compile(r"^[ \t]{0,3}(`{3,}|~{3,})[ \t]*$")
+PARSE_CACHE_SIZE = 64
+
+
+@dataclass(frozen=True)
+class Section:
+    """One heading and the blocks under it, up to the next heading.
+
+    Sections compare and hash by digest only.
+    """
+
+    title: str = field(compare=False)
+    level: int = field(compare=False)
+    text: str = field(compare=False, repr=False)
+    digest: str
+
+    @property
+    def body(self) -> str:
+        """Section text without its heading line."""
+        if self.level == 0:
+            return self.text
+        _, _, rest = self.text.partition("\n")
+        return rest
+
+
+@dataclass(frozen=True)
+class SkillDocument:
+    frontmatter: Section | None
+    sections: tuple[Section, ...]
+
+    @property
+    def nodes(self) -> tuple[Section, ...]:
+        """Frontmatter (if any) followed by every section; joined they are the document."""
+        if self.frontmatter is None:
+            return self.sections
+        return (self.frontmatter, *self.sections)
+
+    def text(self) -> str:
+        return "".join(node.text for node in self.nodes)
+
+    def find(self, title: str, level: int | None = None) -> int | None:
+        """Index into ``sections`` of the first heading titled ``title``."""
+        for index, section in enumerate(self.sections):
+            if section.title == title and (level is None or section.level == level):
+                return index
+        return None
+
+
+def split_frontmatter(text: str) -> tuple[str, str]:
+    m = FRONTMATTER_RE.match(text)
+    if m:
+        return text[: m.end()], text[m.end() :]
+    return "", text
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_skill(text: str) -> SkillDocument:
+    """Parse ``text`` into sections. Results are cached, so repeat calls are cheap."""
+    front, body = split_frontmatter(text)
+    frontmatter = _section("", 0, front) if front else None
+
+    sections: list[Section] = []
+    title, level = "", 0
+    current: list[str] = []
+    lines = body.splitlines(keepends=True)
+    fenced = _fenced_lines(lines)
+    for index, line in enumerate(lines):
+        if index not in fenced and (heading := HEADING_RE.match(line.rstrip("\r\n"))):
+            if current:
+                sections.append(_section(title, level, "".join(current)))
+            title, level = heading.group(2), len(heading.group(1))
+            current = []
+        current.append(line)
+    if current:
+        sections.append(_section(title, level, "".join(current)))
+    return SkillDocument(frontmatter=frontmatter, sections=tuple(sections))
+
+
+def _fenced_lines(lines: list[str]) -> set[int]:
+    """Indices of the lines in closed code fences, fence lines included.
+
+    Openers follow CommonMark (a backtick fence's info string has no backticks), but a
+    fence still open at the end of the text fences nothing, so a stray one cannot hide
+    every heading after it.
+    """
+    fenced: set[int] = set()
+    # Shortest opener of each fence character known to have no closer below it.
+    unclosed: dict[str, int] = {}
+    index = 0
+    while index < len(lines):
+        opener = _fence_opener(lines[index])
+        if opener is None or len(opener) >= unclosed.get(opener[0], len(opener) + 1):
+            index += 1
+            continue
+        close = next(
+            (end for end in range(index + 1, len(lines)) if _closes_fence(lines[end], opener)),
+            None,
+        )
+        if close is None:
+            unclosed[opener[0]] = len(opener)
+            index += 1
+            continue
+        fenced.update(range(index, close + 1))
+        index = close + 1
+    return fenced
+
+
+def _fence_opener(line: str) -> str | None:
+    m = FENCE_RE.match(line.rstrip("\r\n"))
+    if m is None or (m.group(1)[0] == "`" and "`" in m.group(2)):
+        return None
+    return m.group(1)
+
+
+def _closes_fence(line: str, opener: str) -> bool:
+    m = FENCE_CLOSE_RE.match(line.rstrip("\r\n"))
+    return m is not None and m.group(1)[0] == opener[0] and len(m.group(1)) >= len(opener)
+
+
+def _section(title: str, level: int, text: str) -> Section:
+    digest = hashlib.sha256(text.encode()).hexdigest()
+    return Section(title=title, level=level, text=text, digest=digest)
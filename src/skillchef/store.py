@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
+import json
+import os
 import re
 import shutil
+import tempfile
+import threading
+import time
 import tomllib
 from datetime import datetime, timezone
 from pathlib import Path
@@ -10,10 +16,16 @@ from typing import Any
 
 import tomli_w
 
-from skillchef import config, remote
+from skillchef import config, objects, profiling, remote
 from skillchef.merge import merge_skill
 
 DEFAULT_FLAVOR_NAME = "default"
+INDEX_FILENAME = ".index.json"
+INDEX_VERSION = 1
+HASH_CACHE_SETTLE_NS = 2_000_000_000
+# save_meta runs from sync and cook worker threads; index updates are read-modify-write.
+_index_lock = threading.Lock()
+
 _FLAVOR_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
 
 
@@ -25,19 +37,34 @@ def list_skills(scope: str = "auto") -> list[dict[str, Any]]:
     root = config.store_dir(scope=scope)
     if not root.exists():
         return []
-    skills = []
+    indexed = _load_index(root)
+    entries: dict[str, dict[str, Any]] = {}
     for d in sorted(root.iterdir()):
-        meta_path = d / "meta.toml"
-        if d.is_dir() and meta_path.exists():
-            skills.append(load_meta(d.name, scope=scope))
-    return skills
+        if not d.is_dir():
+            continue
+        try:
+            stamp = _meta_stamp(d / "meta.toml")
+        except OSError:
+            continue
+        entry = indexed.get(d.name)
+        if entry is None or entry.get("stamp") != stamp:
+            # meta.toml changed outside save_meta (or is new); re-read just this one.
+            entry = {"stamp": stamp, "meta": tomllib.loads((d / "meta.toml").read_text())}
+        entries[d.name] = entry
+    if entries != indexed:
+        with _index_lock:
+            _write_index(root, entries)
+    return [_with_meta_defaults(entry["meta"]) for entry in entries.values()]
 
 
 def load_meta(name: str, scope: str = "auto") -> dict[str, Any]:
     meta_path = skill_dir(name, scope=scope) / "meta.toml"
     if not meta_path.exists():
         raise KeyError(f"Skill '{name}' not found in store.")
-    meta = tomllib.loads(meta_path.read_text())
+    return _with_meta_defaults(tomllib.loads(meta_path.read_text()))
+
+
+def _with_meta_defaults(meta: dict[str, Any]) -> dict[str, Any]:
     # Populate default metadata fields when absent.
     meta.setdefault("enabled", True)
     meta.setdefault("active_flavor", DEFAULT_FLAVOR_NAME)
@@ -50,9 +77,63 @@ def load_meta(name: str, scope: str = "auto") -> dict[str, Any]:
     return meta
 
 
+@profiling.traced("store.save_meta")
 def save_meta(name: str, meta: dict[str, Any], scope: str = "auto") -> None:
     meta_path = skill_dir(name, scope=scope) / "meta.toml"
     meta_path.write_bytes(tomli_w.dumps(meta).encode())
+    _update_index(
+        meta_path.parent.parent,
+        name,
+        {"stamp": _meta_stamp(meta_path), "meta": tomllib.loads(meta_path.read_text())},
+    )
+
+
+def _meta_stamp(meta_path: Path) -> list[int]:
+    info = meta_path.stat()
+    return [info.st_mtime_ns, info.st_size]
+
+
+def _load_index(root: Path) -> dict[str, dict[str, Any]]:
+    try:
+        data = json.loads((root / INDEX_FILENAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return {}
+    skills = data.get("skills")
+    return skills if isinstance(skills, dict) else {}
+
+
+def _write_index(root: Path, entries: dict[str, dict[str, Any]]) -> None:
+    try:
+        payload = json.dumps({"version": INDEX_VERSION, "skills": entries}, separators=(",", ":"))
+        _replace_file(root / INDEX_FILENAME, payload)
+    except (OSError, TypeError):
+        # The index is only a cache; list_skills rebuilds whatever is missing.
+        pass
+
+
+def _update_index(root: Path, name: str, entry: dict[str, Any] | None) -> None:
+    with _index_lock:
+        entries = _load_index(root)
+        if entry is None:
+            entries.pop(name, None)
+        else:
+            entries[name] = entry
+        _write_index(root, entries)
+
+
+def _replace_file(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` atomically, through a temp file no other writer shares."""
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    tmp = Path(name)
+    try:
+        with os.fdopen(fd, "w") as handle:
+            handle.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def cook(
@@ -62,8 +143,13 @@ def cook(
     remote_type: str,
     platforms: list[str],
     scope: str = "auto",
+    *,
+    commit_sha: str = "",
 ) -> Path:
-    """Install a fetched skill into the store."""
+    """Install a fetched skill into the store.
+
+    ``commit_sha`` records a GitHub commit that is already known instead of resolving the ref.
+    """
     sd = skill_dir(name, scope=scope)
     base_dir = sd / "base"
     live_dir = sd / "live"
@@ -72,8 +158,8 @@ def cook(
         shutil.rmtree(sd)
     sd.mkdir(parents=True)
 
-    shutil.copytree(fetched_dir, base_dir)
-    shutil.copytree(base_dir, live_dir)
+    objects.link_tree(fetched_dir, base_dir, scope=scope)
+    objects.clone_tree(base_dir, live_dir)
 
     meta = {
         "name": name,
@@ -85,7 +171,8 @@ def cook(
         "enabled": True,
         "active_flavor": DEFAULT_FLAVOR_NAME,
     }
-    meta.update(remote.source_metadata(remote_url, remote_type))
+    meta.update(remote.source_metadata(remote_url, remote_type, commit_sha=commit_sha))
+    meta.update(remote.fetched_validators(fetched_dir))
     save_meta(name, meta, scope=scope)
     _create_symlinks(name, platforms, scope=scope)
     return sd
@@ -94,7 +181,23 @@ def cook(
 def remove(name: str, scope: str = "auto") -> None:
     meta = load_meta(name, scope=scope)
     _remove_symlinks(name, meta.get("platforms", []), scope=scope)
-    shutil.rmtree(skill_dir(name, scope=scope))
+    sd = skill_dir(name, scope=scope)
+    shutil.rmtree(sd)
+    _update_index(sd.parent, name, None)
+
+
+def restore(name: str, saved_dir: Path, scope: str = "auto") -> None:
+    """Move a skill directory the caller set aside back into the store, replacing ``name``."""
+    sd = skill_dir(name, scope=scope)
+    if (sd / "meta.toml").exists():
+        remove(name, scope=scope)
+    elif sd.exists():
+        shutil.rmtree(sd)
+    shutil.move(str(saved_dir), str(sd))
+    meta = load_meta(name, scope=scope)
+    save_meta(name, meta, scope=scope)
+    if meta.get("enabled", True):
+        _create_symlinks(name, [str(p) for p in meta.get("platforms", [])], scope=scope)
 
 
 def update_base(name: str, fetched_dir: Path, scope: str = "auto") -> None:
@@ -102,20 +205,39 @@ def update_base(name: str, fetched_dir: Path, scope: str = "auto") -> None:
     base_dir = sd / "base"
     if base_dir.exists():
         shutil.rmtree(base_dir)
-    shutil.copytree(fetched_dir, base_dir)
+    objects.link_tree(fetched_dir, base_dir, scope=scope)
     meta = load_meta(name, scope=scope)
     meta.update(remote.source_metadata(meta.get("remote_url", ""), meta.get("remote_type", "")))
+    meta.update(remote.fetched_validators(fetched_dir))
     meta["base_sha256"] = hash_dir(base_dir)
     meta["last_sync"] = datetime.now(timezone.utc).isoformat()
     save_meta(name, meta, scope=scope)
 
 
+def record_upstream(
+    name: str, fetched_dir: Path, *, commit_sha: str = "", scope: str = "auto"
+) -> dict[str, Any]:
+    """Refresh the upstream commit and HTTP validators of a skill whose content is unchanged.
+
+    Returns the meta; nothing is written when the recorded fields already match.
+    """
+    meta = load_meta(name, scope=scope)
+    updated = dict(meta)
+    if commit_sha:
+        updated["source_commit_sha"] = commit_sha
+        updated["source_ref_resolved"] = commit_sha
+    updated.update(remote.fetched_validators(fetched_dir))
+    if updated != meta:
+        save_meta(name, updated, scope=scope)
+    return updated
+
+
 def rebuild_live(name: str, scope: str = "auto") -> None:
     sd = skill_dir(name, scope=scope)
     live_dir = sd / "live"
     if live_dir.exists():
         shutil.rmtree(live_dir)
-    shutil.copytree(sd / "base", live_dir)
+    objects.clone_tree(sd / "base", live_dir)
     active_flavor = flavor_path(name, scope=scope)
     if active_flavor.exists():
         merge_skill(live_dir / "SKILL.md", active_flavor)
@@ -135,7 +257,7 @@ def save_served_snapshot(name: str, source_dir: Path, scope: str = "auto") -> No
     snapshot_dir = served_snapshot_dir(name, scope=scope)
     if snapshot_dir.exists():
         shutil.rmtree(snapshot_dir)
-    shutil.copytree(source_dir, snapshot_dir)
+    objects.link_tree(source_dir, snapshot_dir, scope=scope)
 
 
 def served_snapshot_exists(name: str, scope: str = "auto") -> bool:
@@ -273,13 +395,91 @@ def live_skill_text(name: str, scope: str = "auto") -> str:
     return (skill_dir(name, scope=scope) / "live" / "SKILL.md").read_text()
 
 
+@profiling.traced("store.hash_dir")
 def hash_dir(path: Path) -> str:
+    started_ns = time.time_ns()
+    files = [f for f in sorted(path.rglob("*")) if f.is_file()]
+    fingerprint = hashlib.sha256()
+    newest_mtime_ns = 0
+    for f in files:
+        info = f.stat()
+        newest_mtime_ns = max(newest_mtime_ns, info.st_mtime_ns)
+        rel = f.relative_to(path).as_posix()
+        fingerprint.update(f"{rel}\0{info.st_size}\0{info.st_mtime_ns}\0{info.st_ino}\n".encode())
+
+    key = str(path.resolve())
+    with _hash_cache_lock:
+        cached = _loaded_hash_cache().get(key)
+    if isinstance(cached, dict) and cached.get("fingerprint") == fingerprint.hexdigest():
+        return str(cached["sha256"])
+
     h = hashlib.sha256()
-    for f in sorted(path.rglob("*")):
-        if f.is_file():
-            h.update(f.relative_to(path).as_posix().encode())
-            h.update(f.read_bytes())
-    return h.hexdigest()
+    for f in files:
+        h.update(f.relative_to(path).as_posix().encode())
+        with f.open("rb") as handle:
+            while chunk := handle.read(objects.HASH_CHUNK_SIZE):
+                h.update(chunk)
+    digest = h.hexdigest()
+
+    # A file written within the mtime granularity of this call could change without its
+    # stamp moving, so only remember directories whose files have all settled.
+    if newest_mtime_ns < started_ns - HASH_CACHE_SETTLE_NS:
+        with _hash_cache_lock:
+            _loaded_hash_cache()[key] = {"fingerprint": fingerprint.hexdigest(), "sha256": digest}
+            _hash_cache_changed.add(key)
+    return digest
+
+
+# hash_dir runs from sync worker threads. The cache file is read once per process and
+# written back by flush_hash_cache, at exit or when a caller needs it on disk sooner.
+_hash_cache_lock = threading.Lock()
+_hash_cache: dict[str, Any] = {}
+_hash_cache_path: Path | None = None
+_hash_cache_changed: set[str] = set()
+
+
+def _loaded_hash_cache() -> dict[str, Any]:
+    global _hash_cache, _hash_cache_path
+    path = config.hash_cache_path()
+    if path != _hash_cache_path:
+        _write_hash_cache()
+        _hash_cache, _hash_cache_path = _read_hash_cache(path), path
+    return _hash_cache
+
+
+def flush_hash_cache() -> None:
+    """Write digests remembered by :func:`hash_dir` to disk and drop the in-memory copy."""
+    global _hash_cache, _hash_cache_path
+    with _hash_cache_lock:
+        _write_hash_cache()
+        _hash_cache, _hash_cache_path = {}, None
+
+
+atexit.register(flush_hash_cache)
+
+
+def _read_hash_cache(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_hash_cache() -> None:
+    if _hash_cache_path is None or not _hash_cache_changed:
+        return
+    path = _hash_cache_path
+    # Merge with what other processes flushed since this one loaded the file.
+    merged = _read_hash_cache(path)
+    merged.update((key, _hash_cache[key]) for key in _hash_cache_changed)
+    _hash_cache_changed.clear()
+    live_entries = {key: value for key, value in merged.items() if Path(key).is_dir()}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _replace_file(path, json.dumps(live_entries, separators=(",", ":")))
+    except OSError:
+        pass
 
 
 def _create_symlinks(name: str, platforms: list[str], scope: str = "auto") -> None:
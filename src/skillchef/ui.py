@@ -3,18 +3,23 @@ from __future__ import annotations
 import os
 import select
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, Callable
 
 import questionary
 from questionary import Choice
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
+from rich.spinner import Spinner
 from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
 console = Console()
+LIVE_DIFF_LINES = 20
 
 
 def banner() -> None:
@@ -23,6 +28,12 @@ def banner() -> None:
     )
 
 
+def use_stderr() -> None:
+    """Send all further output to stderr, keeping stdout free for machine-readable data."""
+    global console
+    console = Console(stderr=True)
+
+
 def success(msg: str) -> None:
     console.print(f"[green]✓[/green] {msg}")
 
@@ -182,6 +193,10 @@ def show_diff(diff_lines: list[str]) -> None:
     if not diff_lines:
         info("No differences")
         return
+    console.print(Panel(_diff_text(diff_lines), title="diff", border_style="dim"))
+
+
+def _diff_text(diff_lines: list[str]) -> Text:
     text = Text()
     for line in diff_lines:
         line_str = line.rstrip("\n")
@@ -193,7 +208,7 @@ def show_diff(diff_lines: list[str]) -> None:
             text.append(line_str + "\n", style="cyan")
         else:
             text.append(line_str + "\n")
-    console.print(Panel(text, title="diff", border_style="dim"))
+    return text
 
 
 def skill_table(
@@ -269,6 +284,37 @@ def spinner(msg: str) -> Any:
     return console.status(f"[dim]{msg}[/dim]", spinner="dots")
 
 
+@contextmanager
+def live_diff(msg: str) -> Iterator[Callable[[list[str]], None]]:
+    """Spinner with a diff panel below it; yields a function that replaces the diff."""
+    status = Spinner("dots", text=Text(msg, style="dim"))
+    with Live(status, console=console, refresh_per_second=8, transient=True) as live:
+
+        def update(diff_lines: list[str]) -> None:
+            tail = diff_lines[-LIVE_DIFF_LINES:]
+            live.update(Group(status, Panel(_diff_text(tail), title="diff", border_style="dim")))
+
+        yield update
+
+
+def show_profile(rows: list[Any], wall_seconds: float) -> None:
+    table = Table(title=f"Profile ({wall_seconds:.2f}s wall)", border_style="dim")
+    table.add_column("Span")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Mean", justify="right")
+    table.add_column("Max", justify="right")
+    for row in rows:
+        table.add_row(
+            row.name,
+            str(row.count),
+            f"{row.total_seconds:.3f}s",
+            f"{row.mean_seconds:.3f}s",
+            f"{row.max_seconds:.3f}s",
+        )
+    Console(stderr=True).print(table)
+
+
 def show_skill_md(text: str, title: str = "SKILL.md") -> None:
     console.print(Syntax(text, "markdown", theme="monokai", line_numbers=False, word_wrap=True))
 
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from skillchef import cli
@@ -66,6 +71,17 @@ def test_cli_init_dispatches_wizard_option(monkeypatch) -> None:
         assert captured["run_wizard"] is expected_wizard
 
 
+def test_cli_closes_shared_http_client_on_exit(monkeypatch) -> None:
+    closed: list[bool] = []
+    monkeypatch.setattr(cli, "_is_first_run", lambda cwd=None: False)
+    monkeypatch.setattr(cli.remote, "close_http_client", lambda: closed.append(True))
+
+    result = CliRunner().invoke(cli.main, [])
+
+    assert result.exit_code == 0
+    assert closed == [True]
+
+
 def test_is_first_run_detects_global_or_project_home(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(cli.config, "SKILLCHEF_HOME", tmp_path / "global-home")
     workdir = tmp_path / "project"
@@ -106,6 +122,113 @@ def test_cli_cook_dispatches_to_command(monkeypatch) -> None:
         assert captured["scope"] == "auto"
 
 
+def test_cli_cook_from_file_dispatches_bulk_cook(monkeypatch, tmp_path: Path) -> None:
+    manifest = tmp_path / "skills.toml"
+    manifest.write_text("")
+    captured: dict[str, object] = {}
+    monkeypatch.setattr(
+        cli.cook_cmd,
+        "run_from_file",
+        lambda manifest, **kwargs: captured.update(kwargs, manifest=manifest),
+    )
+
+    result = CliRunner().invoke(cli.main, ["cook", "--from-file", str(manifest), "-j", "4"])
+
+    assert result.exit_code == 0
+    assert captured == {
+        "manifest": str(manifest),
+        "force_overwrite": False,
+        "scope": "auto",
+        "jobs": 4,
+    }
+    assert CliRunner().invoke(cli.main, ["cook"]).exit_code == 2
+    assert CliRunner().invoke(cli.main, ["cook", "x", "--from-file", str(manifest)]).exit_code == 2
+
+
+def test_cli_sync_dispatches_jobs_option(monkeypatch) -> None:
+    for args, expected_jobs in [
+        (["sync"], cli.sync_cmd.DEFAULT_SYNC_JOBS),
+        (["sync", "--jobs", "3"], 3),
+        (["sync", "-j", "1", "hello-chef"], 1),
+    ]:
+        captured: dict[str, object] = {}
+        monkeypatch.setattr(
+            cli.sync_cmd,
+            "run",
+            lambda skill_name, no_ai, scope="auto", jobs=1, payload=captured: (
+                payload.setdefault("skill_name", skill_name),
+                payload.setdefault("jobs", jobs),
+            ),
+        )
+
+        result = CliRunner().invoke(cli.main, args)
+
+        assert result.exit_code == 0
+        assert captured["jobs"] == expected_jobs
+
+    assert CliRunner().invoke(cli.main, ["sync", "--jobs", "0"]).exit_code != 0
+
+
+def test_cli_install_dispatches_frozen_and_lockfile(monkeypatch, tmp_path: Path) -> None:
+    lock_path = tmp_path / "skillchef.lock"
+    lock_path.write_text("version = 1\n")
+    captured: dict[str, object] = {}
+    monkeypatch.setattr(
+        cli.install_cmd,
+        "run",
+        lambda lock_path, **kwargs: captured.update(kwargs, lock_path=lock_path),
+    )
+
+    result = CliRunner().invoke(
+        cli.main, ["install", "--frozen", "--lockfile", str(lock_path), "-j", "2"]
+    )
+
+    assert result.exit_code == 0
+    assert captured == {"lock_path": lock_path, "frozen": True, "scope": "auto", "jobs": 2}
+
+
+def test_cli_sync_non_interactive_dispatches_to_batch(monkeypatch) -> None:
+    captured: dict[str, object] = {}
+    monkeypatch.setattr(
+        cli.sync_cmd,
+        "run_batch",
+        lambda skill_name, **kwargs: captured.update(kwargs, skill_name=skill_name),
+    )
+
+    result = CliRunner().invoke(
+        cli.main, ["sync", "--non-interactive", "--policy", "ai", "--report", "out.ndjson"]
+    )
+
+    assert result.exit_code == 0
+    assert captured["skill_name"] is None
+    assert captured["policy"] == "ai"
+    assert captured["report"] == "out.ndjson"
+    assert CliRunner().invoke(cli.main, ["sync", "--policy", "yolo"]).exit_code != 0
+    for args in (["--policy", "skip"], ["--report", "out.ndjson"]):
+        result = CliRunner().invoke(cli.main, ["sync", *args])
+        assert result.exit_code == 2
+        assert "only apply with --non-interactive" in result.output
+
+
+def test_cli_trace_option_writes_chrome_trace(monkeypatch, tmp_path: Path) -> None:
+    from skillchef import profiling
+
+    def fake_list(scope: str = "auto") -> None:
+        with profiling.span("demo.list"):
+            pass
+
+    monkeypatch.setattr(cli.list_command, "run", fake_list)
+    trace_path = tmp_path / "trace.json"
+    try:
+        result = CliRunner().invoke(cli.main, ["--trace", str(trace_path), "list"])
+    finally:
+        profiling.reset()
+
+    assert result.exit_code == 0
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["demo.list"]
+
+
 def test_cli_inspect_dispatches_to_command(monkeypatch) -> None:
     for args, expected_skill_name in [
         (["inspect", "hello-chef"], "hello-chef"),
@@ -182,3 +305,40 @@ def test_cli_flavor_dispatches_named_options(monkeypatch) -> None:
         assert captured["flavor_name"] == expected["flavor_name"]
         assert captured["use_flavor"] == expected["use_flavor"]
         assert captured["scope"] == "auto"
+
+
+STARTUP_BUDGET_SECONDS = 2.0
+_STARTUP_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from skillchef import cli
+try:
+    cli.main(sys.argv[1:], standalone_mode=False)
+finally:
+    elapsed = time.perf_counter() - started
+    print("STARTUP " + json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+@pytest.mark.parametrize(
+    ("args", "unused_modules"),
+    [
+        (["--help"], ["litellm", "httpx", "questionary"]),
+        (["list"], ["litellm"]),
+    ],
+)
+def test_cli_startup_defers_heavy_imports(
+    tmp_path: Path, args: list[str], unused_modules: list[str]
+) -> None:
+    env = {**os.environ, "HOME": str(tmp_path), "PYTHONPATH": str(Path(cli.__file__).parents[1])}
+    result = subprocess.run(
+        [sys.executable, "-c", _STARTUP_PROBE, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    report = json.loads(result.stdout.rsplit("STARTUP ", 1)[1])
+    assert [name for name in unused_modules if name in report["modules"]] == []
+    assert report["elapsed"] < STARTUP_BUDGET_SECONDS
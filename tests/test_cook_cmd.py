@@ -145,7 +145,11 @@ def test_run_reports_partial_failures_for_multi_skill_fetch(
     monkeypatch.setattr(cook_cmd.ui, "error", lambda msg: errors.append(msg))
     monkeypatch.setattr(cook_cmd, "ensure_config", lambda scope="auto": {"platforms": ["codex"]})
     monkeypatch.setattr(cook_cmd, "cleanup_fetched", lambda _path: None)
-    monkeypatch.setattr(cook_cmd.remote, "fetch", lambda _source: (fetched_root, "github"))
+
+    async def fake_fetch_many(sources: list[str]) -> list[tuple[Path, str]]:
+        return [(fetched_root, "github") for _source in sources]
+
+    monkeypatch.setattr(cook_cmd.remote, "fetch_many", fake_fetch_many)
     monkeypatch.setattr(
         cook_cmd,
         "_resolve_sources_for_cook",
@@ -166,3 +170,109 @@ def test_run_reports_partial_failures_for_multi_skill_fetch(
     assert cooked == [("alpha", "https://github.com/acme/repo/tree/main/skills/alpha")]
     assert any("https://github.com/acme/repo/tree/main/skills/beta: boom" in msg for msg in errors)
     assert any("Cook completed with 1 failure." in msg for msg in errors)
+
+
+def _fetched_skill(root: Path, name: str) -> Path:
+    skill = root / name / "skill"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text(f"---\nname: {name}\n---\n\n# {name}\n")
+    return skill
+
+
+@pytest.fixture()
+def bulk_ui(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    errors: list[str] = []
+    monkeypatch.setattr(cook_cmd.ui, "banner", lambda: None)
+    monkeypatch.setattr(cook_cmd.ui, "info", lambda _msg: None)
+    monkeypatch.setattr(cook_cmd.ui, "success", lambda _msg: None)
+    monkeypatch.setattr(cook_cmd.ui, "error", lambda msg: errors.append(msg))
+    monkeypatch.setattr(cook_cmd, "ensure_config", lambda scope="auto": {"platforms": ["codex"]})
+    return errors
+
+
+def test_run_from_file_cooks_every_manifest_source_without_prompts(
+    isolated_paths: dict[str, Path],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    bulk_ui: list[str],
+) -> None:
+    manifest = tmp_path / "skills.toml"
+    manifest.write_text(
+        'platforms = []\n\n[[skills]]\nsource = "https://example.com/alpha/SKILL.md"\n\n'
+        '[[skills]]\nsource = "https://example.com/beta/SKILL.md"\nname = "renamed"\n'
+    )
+    requested: list[tuple[list[str], int]] = []
+
+    async def fake_fetch_many(sources: list[str], *, concurrency: int) -> list[tuple[Path, str]]:
+        requested.append((sources, concurrency))
+        return [(_fetched_skill(tmp_path / "fetched", n), "http") for n in ("alpha", "beta")]
+
+    monkeypatch.setattr(cook_cmd.remote, "fetch_many", fake_fetch_many)
+    monkeypatch.setattr(
+        cook_cmd.ui, "ask", lambda *_a, **_k: pytest.fail("bulk cook must not prompt")
+    )
+
+    cook_cmd.run_from_file(str(manifest), jobs=5)
+
+    assert requested == [
+        (["https://example.com/alpha/SKILL.md", "https://example.com/beta/SKILL.md"], 5)
+    ]
+    assert sorted(s["name"] for s in store.list_skills()) == ["alpha", "renamed"]
+    assert store.load_meta("renamed")["remote_url"] == "https://example.com/beta/SKILL.md"
+    assert store.load_meta("alpha")["platforms"] == []
+    assert bulk_ui == []
+
+
+def test_run_from_file_installs_nothing_when_a_source_fails(
+    isolated_paths: dict[str, Path],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    bulk_ui: list[str],
+) -> None:
+    manifest = tmp_path / "skills.txt"
+    manifest.write_text("# catalog\nhttps://example.com/alpha/SKILL.md\nhttps://example.com/gone\n")
+
+    async def fake_fetch_many(sources: list[str], *, concurrency: int) -> list[object]:
+        return [(_fetched_skill(tmp_path / "fetched", "alpha"), "http"), RuntimeError("404")]
+
+    monkeypatch.setattr(cook_cmd.remote, "fetch_many", fake_fetch_many)
+
+    with pytest.raises(SystemExit):
+        cook_cmd.run_from_file(str(manifest))
+
+    assert store.list_skills() == []
+    assert "https://example.com/gone: 404" in bulk_ui
+    assert bulk_ui[-1] == "Nothing was cooked."
+
+
+def test_run_from_file_rolls_back_when_an_install_fails(
+    isolated_paths: dict[str, Path],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    bulk_ui: list[str],
+) -> None:
+    store.cook(
+        "alpha", _fetched_skill(tmp_path / "old", "alpha"), "https://old/SKILL.md", "http", []
+    )
+    manifest = tmp_path / "skills.txt"
+    manifest.write_text("https://example.com/alpha/SKILL.md\nhttps://example.com/beta/SKILL.md\n")
+
+    async def fake_fetch_many(sources: list[str], *, concurrency: int) -> list[tuple[Path, str]]:
+        return [(_fetched_skill(tmp_path / "fetched", n), "http") for n in ("alpha", "beta")]
+
+    real_cook = store.cook
+
+    def failing_cook(name: str, *args: object, **kwargs: object) -> Path:
+        if name == "beta":
+            raise OSError("disk full")
+        return real_cook(name, *args, **kwargs)
+
+    monkeypatch.setattr(cook_cmd.remote, "fetch_many", fake_fetch_many)
+    monkeypatch.setattr(cook_cmd.store, "cook", failing_cook)
+
+    with pytest.raises(SystemExit):
+        cook_cmd.run_from_file(str(manifest), force_overwrite=True)
+
+    assert [s["name"] for s in store.list_skills()] == ["alpha"]
+    assert store.load_meta("alpha")["remote_url"] == "https://old/SKILL.md"
+    assert any("rolled back" in msg for msg in bulk_ui)
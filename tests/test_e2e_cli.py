@@ -128,11 +128,10 @@ def test_e2e_cook_multiple_remote_skills_from_github_tree(
     _write_skill_dir(fetched_root / "alpha", name="alpha", body="base a")
     _write_skill_dir(fetched_root / "beta", name="beta", body="base b")
 
-    monkeypatch.setattr(
-        cook_cmd.remote,
-        "fetch",
-        lambda _source: (fetched_root, "github"),
-    )
+    async def fake_fetch_many(sources: list[str]) -> list[tuple[Path, str]]:
+        return [(fetched_root, "github") for _source in sources]
+
+    monkeypatch.setattr(cook_cmd.remote, "fetch_many", fake_fetch_many)
     monkeypatch.setattr(cook_cmd, "cleanup_fetched", lambda _path: None)
 
     def multi_choose(prompt: str, choices: list[str]) -> list[str]:
@@ -203,10 +202,10 @@ def test_e2e_init_with_optional_example_wizard(
 
     original_fetch = init_cmd.remote.fetch
 
-    def fake_fetch(source_url: str):
+    def fake_fetch(source_url: str, **kwargs):
         if source_url == init_cmd.README_EXAMPLE_SOURCE:
-            return original_fetch(str(source))
-        return original_fetch(source_url)
+            return original_fetch(str(source), **kwargs)
+        return original_fetch(source_url, **kwargs)
 
     monkeypatch.setattr(init_cmd.remote, "fetch", fake_fetch)
 
@@ -13,8 +13,15 @@ def _meta(name: str = "hello-chef") -> dict[str, str]:
     }
 
 
+def _load_meta(name: str, scope: str = "auto") -> dict[str, str]:
+    if name != "hello-chef":
+        raise KeyError(f"Skill '{name}' not found in store.")
+    return _meta(name)
+
+
 def test_run_selection_paths(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(inspect_cmd.ui, "banner", lambda: None)
+    monkeypatch.setattr(inspect_cmd.store, "load_meta", _load_meta)
     monkeypatch.setattr(inspect_cmd.store, "has_flavor", lambda _n, scope="auto": False)
     monkeypatch.setattr(
         inspect_cmd.store, "live_skill_text", lambda _n, scope="auto": "# hello-chef\n"
@@ -63,6 +70,7 @@ def test_run_interactive_preview_and_actions(monkeypatch: pytest.MonkeyPatch) ->
     monkeypatch.setattr(inspect_cmd.ui, "banner", lambda: None)
     monkeypatch.setattr(inspect_cmd.ui, "can_use_interactive_selector", lambda: True)
     monkeypatch.setattr(inspect_cmd.store, "list_skills", lambda scope="auto": [_meta()])
+    monkeypatch.setattr(inspect_cmd.store, "load_meta", _load_meta)
     monkeypatch.setattr(inspect_cmd.store, "has_flavor", lambda _n, scope="auto": False)
     monkeypatch.setattr(inspect_cmd.ui, "choose_optional", lambda _prompt, _choices: next(actions))
     monkeypatch.setattr(
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import tomllib
+from pathlib import Path
+
+import pytest
+
+from skillchef import config, lockfile, store
+from skillchef.commands import install_cmd, lock_cmd
+
+SHA = "c" * 40
+SOURCE = "https://github.com/acme/repo/tree/main/skills/hello"
+
+
+def _write_skill(path: Path, body: str) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "SKILL.md").write_text(f"---\nname: hello\n---\n\n# Hello\n\n{body}\n")
+    return path
+
+
+@pytest.fixture()
+def quiet_ui(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    errors: list[str] = []
+    for module in (install_cmd, lock_cmd):
+        monkeypatch.setattr(module.ui, "banner", lambda: None)
+        monkeypatch.setattr(module.ui, "info", lambda _msg: None)
+        monkeypatch.setattr(module.ui, "warn", lambda _msg: None)
+        monkeypatch.setattr(module.ui, "success", lambda _msg: None)
+        monkeypatch.setattr(module.ui, "error", lambda msg: errors.append(msg))
+    return errors
+
+
+def _lock_one_skill(
+    isolated_paths: dict[str, Path], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    config.save({"platforms": ["codex"]}, scope="global")
+    monkeypatch.setattr(store.remote, "_resolve_github_commit", lambda _o, _r, _ref: SHA)
+    store.cook("hello", _write_skill(tmp_path / "upstream", "v1"), SOURCE, "github", ["codex"])
+    store.set_active_flavor("hello", "team")
+    lock_cmd.run(scope="global")
+    store.remove("hello")
+    return isolated_paths["skillchef_home"] / config.LOCKFILE_NAME
+
+
+def test_lock_then_install_restores_skills_at_locked_commit(
+    isolated_paths: dict[str, Path],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    quiet_ui: list[str],
+) -> None:
+    lock_path = _lock_one_skill(isolated_paths, tmp_path, monkeypatch)
+    data = tomllib.loads(lock_path.read_text())
+    assert data["skills"] == [
+        {
+            "name": "hello",
+            "remote_url": SOURCE,
+            "remote_type": "github",
+            "source_commit_sha": SHA,
+            "base_sha256": data["skills"][0]["base_sha256"],
+            "active_flavor": "team",
+            "platforms": ["codex"],
+        }
+    ]
+
+    requested: list[list[str]] = []
+
+    async def fake_fetch_many(sources: list[str], *, concurrency: int) -> list[tuple[Path, str]]:
+        requested.append(sources)
+        return [(_write_skill(tmp_path / "fetched" / "skill", "v1"), "github")]
+
+    def fail_lookup(*_args: object) -> str:
+        raise AssertionError("install should record the locked commit without an API call")
+
+    monkeypatch.setattr(install_cmd.remote, "fetch_many", fake_fetch_many)
+    monkeypatch.setattr(store.remote, "_resolve_github_commit", fail_lookup)
+
+    install_cmd.run(frozen=True, scope="global", jobs=3)
+
+    assert requested == [[f"https://github.com/acme/repo/tree/{SHA}/skills/hello"]]
+    meta = store.load_meta("hello")
+    assert meta["remote_url"] == SOURCE
+    assert meta["source_commit_sha"] == SHA
+    assert meta["active_flavor"] == "team"
+    assert (isolated_paths["platform_codex"] / "hello").is_symlink()
+    assert quiet_ui == []
+
+    # A second run has nothing to fetch.
+    install_cmd.run(frozen=True, scope="global")
+    assert requested[-1] == []
+
+
+def test_install_frozen_rejects_content_that_drifted_from_the_lockfile(
+    isolated_paths: dict[str, Path],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    quiet_ui: list[str],
+) -> None:
+    lock_path = _lock_one_skill(isolated_paths, tmp_path, monkeypatch)
+    locked_hash = lockfile.read(lock_path)[0].base_sha256
+
+    async def fake_fetch_many(sources: list[str], *, concurrency: int) -> list[tuple[Path, str]]:
+        return [(_write_skill(tmp_path / "fetched" / "skill", "v2"), "github")]
+
+    monkeypatch.setattr(install_cmd.remote, "fetch_many", fake_fetch_many)
+
+    with pytest.raises(SystemExit):
+        install_cmd.run(frozen=True, scope="global")
+    assert not store.skill_dir("hello").exists()
+    assert any("does not match the lockfile" in msg for msg in quiet_ui)
+
+    quiet_ui.clear()
+    install_cmd.run(scope="global")
+    assert quiet_ui == []
+    assert store.load_meta("hello")["base_sha256"] != locked_hash
+    assert lockfile.read(lock_path)[0].base_sha256 == store.load_meta("hello")["base_sha256"]
+
+
+def test_read_rejects_unknown_lockfile_version(tmp_path: Path) -> None:
+    path = tmp_path / config.LOCKFILE_NAME
+    path.write_text("version = 99\n")
+    with pytest.raises(ValueError, match="unsupported lockfile version"):
+        lockfile.read(path)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -23,7 +25,7 @@ def test_default_model_for_key_uses_provider_defaults() -> None:
     assert llm.default_model_for_key("UNKNOWN") == "anthropic/claude-sonnet-4-5"
 
 
-def test_semantic_merge_uses_selected_api_key(monkeypatch) -> None:
+def test_semantic_merge_uses_selected_api_key(monkeypatch, isolated_paths) -> None:
     captured: dict[str, object] = {}
 
     def fake_completion(**kwargs):
@@ -47,7 +49,7 @@ def test_semantic_merge_uses_selected_api_key(monkeypatch) -> None:
     assert "temperature" not in captured
 
 
-def test_semantic_merge_uses_ollama_api_base(monkeypatch) -> None:
+def test_semantic_merge_uses_ollama_api_base(monkeypatch, isolated_paths) -> None:
     captured: dict[str, object] = {}
 
     def fake_completion(**kwargs):
@@ -70,7 +72,7 @@ def test_semantic_merge_uses_ollama_api_base(monkeypatch) -> None:
     assert captured["api_base"] == "http://localhost:11434"
 
 
-def test_semantic_merge_aligns_model_with_selected_key(monkeypatch) -> None:
+def test_semantic_merge_aligns_model_with_selected_key(monkeypatch, isolated_paths) -> None:
     captured: dict[str, object] = {}
 
     def fake_completion(**kwargs):
@@ -97,7 +99,7 @@ def test_semantic_merge_aligns_model_with_selected_key(monkeypatch) -> None:
     assert captured["model"] == "openai/gpt-5.2"
 
 
-def test_semantic_merge_appends_log_file(monkeypatch, tmp_path: Path) -> None:
+def test_semantic_merge_appends_log_file(monkeypatch, tmp_path: Path, isolated_paths) -> None:
     monkeypatch.setenv("OPENAI_API_KEY", "openai-token")
     monkeypatch.setenv("SKILLCHEF_LLM_LOG_DIR", str(tmp_path / "logs"))
     monkeypatch.setattr(
@@ -122,6 +124,116 @@ def test_semantic_merge_appends_log_file(monkeypatch, tmp_path: Path) -> None:
     assert "merged output" in log_text
 
 
+def test_semantic_merge_caches_responses_by_prompt_and_model(
+    monkeypatch, isolated_paths: dict[str, Path]
+) -> None:
+    calls: list[str] = []
+
+    def fake_completion(**kwargs):
+        calls.append(kwargs["model"])
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=f"merged {len(calls)}"))]
+        )
+
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-token")
+    monkeypatch.setattr(
+        llm.config,
+        "load",
+        lambda scope="global": {"model": "openai/gpt-5.2", "llm_api_key_env": "OPENAI_API_KEY"},
+    )
+    monkeypatch.setattr(llm, "completion", fake_completion)
+
+    assert llm.semantic_merge("old", "new", "flavor", current_live="live") == "merged 1"
+    assert llm.semantic_merge("old", "new", "flavor", current_live="live") == "merged 1"
+    assert llm.semantic_merge("old", "new", "flavor", instruction="shorter") == "merged 2"
+    assert llm.semantic_merge("old", "new", "flavor", model="openai/gpt-4o") == "merged 3"
+    assert len(calls) == 3
+
+    cache_dir = isolated_paths["skillchef_home"] / "cache" / "llm"
+    assert len(list(cache_dir.glob("*.json"))) == 3
+
+    monkeypatch.setenv(llm.MERGE_CACHE_TTL_DAYS_ENV, "0")
+    assert llm.semantic_merge("old", "new", "flavor", current_live="live") == "merged 4"
+
+    monkeypatch.setenv(llm.MERGE_CACHE_TTL_DAYS_ENV, "30")
+    monkeypatch.setenv(llm.MERGE_CACHE_MAX_MB_ENV, "0")
+    llm.semantic_merge("fresh", "new", "flavor")
+    assert list(cache_dir.glob("*.json")) == []
+
+    monkeypatch.setenv(llm.MERGE_CACHE_ENV, "0")
+    llm.semantic_merge("fresh", "new", "flavor")
+    llm.semantic_merge("fresh", "new", "flavor")
+    assert len(calls) == 7
+
+
+def test_merge_cache_evicts_least_recently_read_entries(
+    monkeypatch, isolated_paths: dict[str, Path]
+) -> None:
+    llm._write_merge_cache("a" * 64, model="m", content="first", scope="global")
+    llm._write_merge_cache("b" * 64, model="m", content="second", scope="global")
+    cache_dir = isolated_paths["skillchef_home"] / "cache" / "llm"
+    first, second = cache_dir / f"{'a' * 64}.json", cache_dir / f"{'b' * 64}.json"
+    os.utime(first, (time.time() - 60, time.time() - 60))
+
+    assert llm._read_merge_cache("a" * 64, scope="global") == "first"
+    monkeypatch.setenv(llm.MERGE_CACHE_MAX_MB_ENV, str(first.stat().st_size * 1.5 / 1024 / 1024))
+    llm._evict_merge_cache(cache_dir)
+
+    assert first.exists() and not second.exists()
+    assert list(cache_dir.glob("*.tmp")) == []
+
+
+def test_semantic_merge_sends_only_conflicting_hunks_for_large_skills(
+    monkeypatch, isolated_paths: dict[str, Path]
+) -> None:
+    prompts: list[str] = []
+    replies = ["=== RESOLUTION 1 ===\nStep two, both ways\n"]
+
+    def fake_completion(**kwargs):
+        prompts.append(kwargs["messages"][0]["content"])
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=replies.pop(0)))]
+        )
+
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-token")
+    monkeypatch.setattr(
+        llm.config,
+        "load",
+        lambda scope="global": {"model": "openai/gpt-5.2", "llm_api_key_env": "OPENAI_API_KEY"},
+    )
+    monkeypatch.setattr(llm, "completion", fake_completion)
+    reference = "".join(f"reference line {i}\n" for i in range(llm.HUNK_MERGE_MIN_CHARS // 20))
+    old_base = f"# Skill\n\nStep one\nStep two\n\n## Reference\n\n{reference}"
+    new_remote = old_base.replace("Step two", "Step two (remote)")
+    current_live = (
+        old_base.replace("Step two", "Step two (local)") + "\n## Local Flavor\n\nBe brief\n"
+    )
+
+    merged = llm.semantic_merge(old_base, new_remote, "Be brief", current_live=current_live)
+
+    assert merged == (
+        old_base.replace("Step two", "Step two, both ways").rstrip()
+        + "\n\n## Local Flavor\n\nBe brief"
+    )
+    assert "=== CONFLICT 1 ===" in prompts[0]
+    assert "Step two (local)" in prompts[0] and "Step two (remote)" in prompts[0]
+    assert "reference line 100" not in prompts[0]
+
+    replies.extend(["not the requested format", "whole document merge"])
+    result = llm.semantic_merge(
+        old_base, new_remote, "Be brief", current_live=current_live, instruction="retry"
+    )
+
+    assert result == "whole document merge"
+    assert "=== OLD BASE ===" in prompts[-1]
+
+    monkeypatch.setenv(llm.HUNK_MERGE_ENV, "0")
+    replies.append("whole document again")
+    llm.semantic_merge(old_base, new_remote, "Be brief", current_live=current_live, model="x/y")
+    assert "=== OLD BASE ===" in prompts[-1]
+    assert len(prompts) == 4
+
+
 def test_wizard_chat_uses_selected_key_and_context(monkeypatch) -> None:
     captured: dict[str, object] = {}
 
@@ -153,3 +265,101 @@ def test_wizard_chat_uses_selected_key_and_context(monkeypatch) -> None:
     assert messages[0]["role"] == "system"
     assert "Chef Jeremy" in messages[0]["content"]
     assert "Step 2/4 - Add local flavor" in messages[1]["content"]
+
+
+def test_semantic_merge_streams_tokens_and_stops_when_cancelled(
+    monkeypatch, isolated_paths: dict[str, Path]
+) -> None:
+    closed: list[bool] = []
+
+    class FakeStream:
+        def __iter__(self):
+            for piece in ["# Merged", "\n\nbody", "\n"]:
+                yield SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))]
+                )
+
+        def close(self) -> None:
+            closed.append(True)
+
+    def fake_completion(**kwargs):
+        assert kwargs["stream"] is True
+        return FakeStream()
+
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-token")
+    monkeypatch.setenv(llm.MERGE_CACHE_ENV, "0")
+    monkeypatch.setattr(
+        llm.config,
+        "load",
+        lambda scope="global": {"model": "openai/gpt-5.2", "llm_api_key_env": "OPENAI_API_KEY"},
+    )
+    monkeypatch.setattr(llm, "completion", fake_completion)
+
+    tokens: list[str] = []
+    assert llm.semantic_merge("old", "new", "flavor", on_token=tokens.append) == "# Merged\n\nbody"
+    assert tokens == ["# Merged", "\n\nbody", "\n"]
+    assert closed == []
+
+    def cancel_after_first(delta: str) -> None:
+        raise llm.MergeCancelled()
+
+    try:
+        llm.semantic_merge("old", "new", "flavor", on_token=cancel_after_first)
+    except llm.MergeCancelled:
+        pass
+    else:
+        raise AssertionError("expected MergeCancelled")
+    assert closed == [True]
+
+
+def test_hunk_merge_streams_so_cancellation_stops_it(
+    monkeypatch, isolated_paths: dict[str, Path]
+) -> None:
+    closed: list[bool] = []
+
+    class FakeStream:
+        def __iter__(self):
+            for piece in ["=== RESOLUTION 1 ===\n", "Step two, both ways\n"]:
+                yield SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))]
+                )
+
+        def close(self) -> None:
+            closed.append(True)
+
+    def fake_completion(**kwargs):
+        assert kwargs["stream"] is True
+        assert "=== CONFLICT 1 ===" in kwargs["messages"][0]["content"]
+        return FakeStream()
+
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-token")
+    monkeypatch.setenv(llm.MERGE_CACHE_ENV, "0")
+    monkeypatch.setattr(
+        llm.config,
+        "load",
+        lambda scope="global": {"model": "openai/gpt-5.2", "llm_api_key_env": "OPENAI_API_KEY"},
+    )
+    monkeypatch.setattr(llm, "completion", fake_completion)
+    reference = "".join(f"reference line {i}\n" for i in range(llm.HUNK_MERGE_MIN_CHARS // 20))
+    old_base = f"# Skill\n\nStep one\nStep two\n\n## Reference\n\n{reference}"
+    new_remote = old_base.replace("Step two", "Step two (remote)")
+    current_live = old_base.replace("Step two", "Step two (local)")
+
+    tokens: list[str] = []
+    merged = llm.semantic_merge(
+        old_base, new_remote, "", current_live=current_live, on_token=tokens.append
+    )
+
+    assert "Step two, both ways" in merged
+    assert tokens == ["", "", merged]
+
+    def cancel(_delta: str) -> None:
+        raise llm.MergeCancelled()
+
+    try:
+        llm.semantic_merge(old_base, new_remote, "", current_live=current_live, on_token=cancel)
+    except llm.MergeCancelled:
+        pass
+    else:
+        raise AssertionError("expected MergeCancelled")
+    assert closed == [True]
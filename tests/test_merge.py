@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from skillchef import merge
 
 
@@ -59,3 +61,85 @@ def test_has_non_flavor_local_changes_ignores_flavor_section_only() -> None:
     current_live = "# Skill\n\nBase\n\n## Local Flavor\n\nKeep this\n"
 
     assert not merge.has_non_flavor_local_changes(old_base, current_live)
+
+
+def test_three_way_merge_combines_non_overlapping_edits() -> None:
+    base = "# Skill\n\nStep one\nStep two\nStep three\n"
+    local = "# Skill\n\nStep one (local)\nStep two\nStep three\n"
+    remote = "# Skill\n\nStep one\nStep two\nStep three\nStep four\n"
+
+    result = merge.three_way_merge(base, local, remote)
+
+    assert result.clean
+    assert result.render() == "# Skill\n\nStep one (local)\nStep two\nStep three\nStep four\n"
+    assert merge.three_way_merge(base, remote, remote).render() == remote
+
+
+def test_three_way_merge_marks_overlapping_edits_and_splices_resolutions() -> None:
+    result = merge.three_way_merge("a\nold\nz\n", "a\nlocal\nz\n", "a\nremote\nz\n")
+
+    assert [(c.base, c.local, c.remote) for c in result.conflicts] == [
+        ("old\n", "local\n", "remote\n")
+    ]
+    assert result.render() == (
+        "a\n<<<<<<< local\nlocal\n||||||| base\nold\n=======\nremote\n>>>>>>> remote\nz\n"
+    )
+    assert result.render(["both"]) == "a\nboth\nz\n"
+
+
+def test_three_way_merge_merges_inside_a_section_edited_on_both_sides() -> None:
+    reference = "".join(f"reference line {i}\n" for i in range(200))
+    base = f"# Skill\n\n## Steps\n\none\ntwo\nthree\n\n## Reference\n\n{reference}"
+    local = base.replace("one\n", "one (local)\n")
+    remote = base.replace("three\n", "three (remote)\n") + "\n## Extra\n\nnew\n"
+
+    result = merge.three_way_merge(base, local, remote)
+
+    assert result.clean
+    assert result.render() == local.replace("three\n", "three (remote)\n") + "\n## Extra\n\nnew\n"
+
+
+def test_diff_texts_only_reports_changed_sections() -> None:
+    old = "# Skill\n\n## A\n\nalpha\n\n## B\n\nbeta\n"
+    new = "# Skill\n\n## A\n\nalpha\n\n## B\n\nbeta two\n"
+
+    assert merge.diff_texts(old, new, "old", "new") == [
+        "--- old\n",
+        "+++ new\n",
+        "@@ -6,4 +6,4 @@\n",
+        " \n",
+        " ## B\n",
+        " \n",
+        "-beta\n",
+        "+beta two\n",
+    ]
+    assert merge.diff_texts(old, old) == []
+
+
+def test_split_local_flavor_section_ignores_headings_in_code_fences() -> None:
+    text = "# Skill\n\n```md\n## Local Flavor\n```\n\n## Local Flavor\n\nKeep this\n"
+
+    base, flavor = merge.split_local_flavor_section(text)
+
+    assert base == "# Skill\n\n```md\n## Local Flavor\n```\n"
+    assert flavor == "Keep this"
+
+
+@pytest.mark.parametrize(
+    "base",
+    ["# T\n\nExample:\n\n```bash\nrun it\n", "# T\n\n```npm i`` is wrong\n"],
+)
+def test_split_local_flavor_section_survives_stray_fences(base: str) -> None:
+    live = merge.merge_skill_text(base, "mine")
+
+    assert merge.split_local_flavor_section(live)[1] == "mine"
+    assert not merge.has_non_flavor_local_changes(base, live)
+
+
+def test_three_way_merge_conflict_context_is_bounded() -> None:
+    base = "".join(f"line {i}\n" for i in range(10))
+    result = merge.three_way_merge(
+        base, base.replace("line 5", "local 5"), base.replace("line 5", "remote 5")
+    )
+
+    assert result.conflict_context(2) == [("line 3\nline 4\n", "line 6\nline 7\n")]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from skillchef import objects, store
+from skillchef.commands import gc_cmd
+
+
+def _write_tree(root: Path) -> Path:
+    (root / "scripts").mkdir(parents=True)
+    (root / "SKILL.md").write_text("---\nname: demo\n---\n\nBody\n")
+    (root / "scripts" / "run.sh").write_text("echo hi\n")
+    (root / "scripts" / "run.sh").chmod(0o755)
+    (root / "scripts" / "copy.sh").write_text("echo hi\n")
+    return root
+
+
+def test_link_tree_shares_objects_and_clone_tree_stays_independent(
+    isolated_paths: dict[str, Path], tmp_path: Path
+) -> None:
+    source = _write_tree(tmp_path / "source")
+    base = tmp_path / "base"
+    served = tmp_path / "served"
+    live = tmp_path / "live"
+
+    objects.link_tree(source, base)
+    objects.link_tree(source, served)
+    objects.clone_tree(base, live)
+
+    assert (base / "SKILL.md").stat().st_ino == (served / "SKILL.md").stat().st_ino
+    assert (base / "SKILL.md").stat().st_nlink == 3
+    run_sh = base / "scripts" / "run.sh"
+    copy_sh = base / "scripts" / "copy.sh"
+    assert os.access(run_sh, os.X_OK) and not os.access(copy_sh, os.X_OK)
+    assert run_sh.stat().st_ino != copy_sh.stat().st_ino
+
+    (live / "SKILL.md").write_text("edited\n")
+    assert (base / "SKILL.md").read_text() == (source / "SKILL.md").read_text()
+    assert os.access(live / "scripts" / "run.sh", os.X_OK)
+
+
+def test_collect_garbage_drops_only_unreferenced_objects(
+    isolated_paths: dict[str, Path], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = _write_tree(tmp_path / "source")
+    keep = tmp_path / "keep"
+    drop = tmp_path / "drop"
+    objects.link_tree(source, keep)
+    (source / "SKILL.md").write_text("only in drop\n")
+    objects.link_tree(source, drop)
+
+    messages: list[str] = []
+    monkeypatch.setattr(gc_cmd.ui, "banner", lambda: None)
+    monkeypatch.setattr(gc_cmd.ui, "info", lambda msg: messages.append(msg))
+    monkeypatch.setattr(gc_cmd.ui, "success", lambda msg: messages.append(msg))
+
+    gc_cmd.run()
+    assert messages == ["No unreferenced objects to remove."]
+
+    for path in sorted(drop.rglob("*"), reverse=True):
+        path.rmdir() if path.is_dir() else path.unlink()
+
+    result = objects.collect_garbage()
+
+    assert result == objects.GcResult(removed=1, freed_bytes=len("only in drop\n"))
+    for path in keep.rglob("*"):
+        if path.is_file():
+            assert path.stat().st_nlink == 2
+    assert objects.collect_garbage().removed == 0
+
+
+def test_store_layers_are_backed_by_objects_until_gc(
+    isolated_paths: dict[str, Path], tmp_path: Path
+) -> None:
+    source = _write_tree(tmp_path / "source")
+    skill_dir = store.cook("demo", source, str(source), "local", ["codex"])
+    store.record_served("demo", url="https://example.com/demo", kind="gist", visibility="public")
+
+    base_md = skill_dir / "base" / "SKILL.md"
+    assert base_md.stat().st_ino == (skill_dir / "served" / "SKILL.md").stat().st_ino
+    assert base_md.stat().st_nlink == 3
+    assert (skill_dir / "live" / "SKILL.md").stat().st_ino != base_md.stat().st_ino
+
+    store.remove("demo")
+    result = objects.collect_garbage()
+
+    assert result.removed == 3
+    assert not any(objects.objects_dir().iterdir())
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from skillchef import profiling
+
+
+@pytest.fixture(autouse=True)
+def clean_profiler() -> Iterator[None]:
+    profiling.reset()
+    yield
+    profiling.reset()
+
+
+def test_spans_are_only_recorded_when_enabled() -> None:
+    @profiling.traced("demo.sync")
+    def work(value: int) -> int:
+        return value * 2
+
+    assert work(2) == 4
+    assert profiling.spans() == []
+
+    profiling.enable()
+
+    with profiling.span("demo.outer", skill="hello"):
+        assert work(3) == 6
+        assert work(4) == 8
+
+    rows = {row.name: row for row in profiling.summarize()}
+    assert rows["demo.sync"].count == 2
+    assert rows["demo.outer"].count == 1
+    assert rows["demo.outer"].total_seconds >= rows["demo.sync"].total_seconds
+    outer = next(s for s in profiling.spans() if s.name == "demo.outer")
+    assert outer.args == {"skill": "hello"}
+
+
+def test_write_chrome_trace_emits_complete_events(tmp_path: Path) -> None:
+    profiling.enable()
+    with profiling.span("store.hash_dir"):
+        pass
+    with pytest.raises(RuntimeError):
+        with profiling.span("remote.http", url="https://example.com"):
+            raise RuntimeError("still recorded")
+
+    trace_path = tmp_path / "out" / "trace.json"
+    profiling.write_chrome_trace(trace_path)
+
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    assert [(e["name"], e["cat"], e["ph"]) for e in events] == [
+        ("store.hash_dir", "store", "X"),
+        ("remote.http", "remote", "X"),
+    ]
+    assert events[0]["ts"] == 0
+    assert events[1]["args"] == {"url": "https://example.com"}
+    assert all(e["dur"] >= 0 for e in events)
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
+import os
+import shutil
 import subprocess
+import tarfile
+import threading
+import time
 from pathlib import Path
 
 import httpx
@@ -56,16 +63,34 @@ def test_classify_missing_local_path_reports_specific_error(tmp_path: Path) -> N
         remote.classify(str(missing))
 
 
+class _FakeResponse:
+    def __init__(
+        self,
+        *,
+        status_code: int = 200,
+        content: bytes = b"",
+        payload: object = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = httpx.Headers(headers or {})
+        self._payload = payload
+
+    def json(self) -> object:
+        return self._payload
+
+
 def test_fetch_and_local_discovery_helpers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     src = tmp_path / "my-skill.md"
     src.write_text("content")
-    calls: list[tuple[str, Path]] = []
+    calls: list[tuple[str, dict[str, str] | None]] = []
 
-    def fake_download(url: str, dest: Path) -> None:
-        calls.append((url, dest))
-        dest.write_text("---\nname: http-skill\n---\n")
+    def fake_request(url: str, *, headers: dict[str, str] | None = None) -> _FakeResponse:
+        calls.append((url, headers))
+        return _FakeResponse(content=b"---\nname: http-skill\n---\n")
 
-    monkeypatch.setattr(remote, "_download_raw", fake_download)
+    monkeypatch.setattr(remote, "_request_with_retry", fake_request)
 
     fetched_local = remote._fetch_local(str(src))
     fetched_http = remote._fetch_http("https://example.com/path/SKILL.md")
@@ -90,6 +115,44 @@ def test_fetch_and_local_discovery_helpers(tmp_path: Path, monkeypatch: pytest.M
     assert len(remote.local_skill_candidates(str(root))) == 2
 
 
+def test_fetch_http_sends_and_records_conditional_validators(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sent: list[dict[str, str] | None] = []
+    responses = [
+        _FakeResponse(
+            content=b"v1\n",
+            headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        ),
+        _FakeResponse(status_code=304),
+    ]
+
+    def fake_request(url: str, *, headers: dict[str, str] | None = None) -> _FakeResponse:
+        sent.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(remote, "_request_with_retry", fake_request)
+
+    fetched, kind = remote.fetch("https://example.com/skills/SKILL.md")
+    validators = remote.fetched_validators(fetched)
+
+    assert kind == "http"
+    assert validators == {
+        "source_etag": '"abc"',
+        "source_last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    with pytest.raises(remote.NotModifiedError):
+        remote.fetch("https://example.com/skills/SKILL.md", validators=validators)
+    assert sent == [
+        {},
+        {"If-None-Match": '"abc"', "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    ]
+    assert remote.fetched_validators(Path("/nonexistent/skill")) == {
+        "source_etag": "",
+        "source_last_modified": "",
+    }
+
+
 def test_github_parsing_and_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
     blob = remote._parse_github_source(
         "https://github.com/acme/repo/blob/main/skills/demo/SKILL.md"
@@ -116,6 +179,36 @@ def test_github_parsing_and_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
     assert gist_meta["source_ref_resolved"] == "abcdef123456"
 
 
+def test_pinned_source_replaces_github_ref_and_skips_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sha = "a" * 40
+    assert (
+        remote.pinned_source("https://github.com/acme/repo/tree/main/skills/demo", sha)
+        == f"https://github.com/acme/repo/tree/{sha}/skills/demo"
+    )
+    assert (
+        remote.pinned_source("https://github.com/acme/repo/blob/v1/skills/demo/SKILL.md", sha)
+        == f"https://github.com/acme/repo/blob/{sha}/skills/demo/SKILL.md"
+    )
+    assert remote.pinned_source("https://example.com/SKILL.md", sha) == (
+        "https://example.com/SKILL.md"
+    )
+    assert remote.pinned_source("https://github.com/acme/repo/tree/main/x", "") == (
+        "https://github.com/acme/repo/tree/main/x"
+    )
+
+    def fail_lookup(*_args: object) -> str:
+        raise AssertionError("commit lookup should be skipped")
+
+    monkeypatch.setattr(remote, "_resolve_github_commit", fail_lookup)
+    meta = remote.source_metadata(
+        "https://github.com/acme/repo/tree/main/skills/demo", "github", commit_sha=sha
+    )
+    assert meta["source_ref_requested"] == "main"
+    assert meta["source_commit_sha"] == sha
+
+
 def test_derive_child_source_handles_supported_source_types(tmp_path: Path) -> None:
     local_root = tmp_path / "skills"
     local_root.mkdir()
@@ -162,25 +255,30 @@ def test_source_metadata_for_http_and_local(tmp_path: Path) -> None:
 
 def test_fetch_gist_downloads_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     calls: list[tuple[str, Path]] = []
+    sent: list[dict[str, str] | None] = []
+    payload = {
+        "files": {
+            "SKILL.md": {
+                "filename": "SKILL.md",
+                "content": "---\nname: gist-demo\n---\n",
+                "truncated": False,
+            },
+            "notes.txt": {
+                "filename": "notes.txt",
+                "content": "hello\n",
+                "truncated": False,
+            },
+        }
+    }
 
-    def fake_request_json(url: str, *, headers=None) -> object:
+    def fake_request(url: str, *, headers: dict[str, str] | None = None) -> _FakeResponse:
         assert url == "https://api.github.com/gists/abcdef123456"
-        return {
-            "files": {
-                "SKILL.md": {
-                    "filename": "SKILL.md",
-                    "content": "---\nname: gist-demo\n---\n",
-                    "truncated": False,
-                },
-                "notes.txt": {
-                    "filename": "notes.txt",
-                    "content": "hello\n",
-                    "truncated": False,
-                },
-            }
-        }
+        sent.append(headers)
+        if headers and headers.get("If-None-Match") == '"gist-etag"':
+            return _FakeResponse(status_code=304)
+        return _FakeResponse(payload=payload, headers={"ETag": '"gist-etag"'})
 
-    monkeypatch.setattr(remote, "_request_json_with_retry", fake_request_json)
+    monkeypatch.setattr(remote, "_request_with_retry", fake_request)
     monkeypatch.setattr(
         remote,
         "_download_raw",
@@ -192,11 +290,18 @@ def test_fetch_gist_downloads_files(tmp_path: Path, monkeypatch: pytest.MonkeyPa
     assert (fetched / "SKILL.md").read_text() == "---\nname: gist-demo\n---\n"
     assert (fetched / "notes.txt").read_text() == "hello\n"
     assert calls == []
+    assert sent[0] == {"Accept": "application/vnd.github.v3+json"}
+
+    validators = remote.fetched_validators(fetched)
+    assert validators["source_etag"] == '"gist-etag"'
+    with pytest.raises(remote.NotModifiedError):
+        remote._fetch_github("https://gist.github.com/acme/abcdef123456", validators=validators)
 
 
 def test_fetch_github_repo_paths_use_git_sparse_checkout(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
+    monkeypatch.setenv(remote.GIT_CACHE_ENV, "0")
     commands: list[tuple[list[str], Path | None]] = []
 
     monkeypatch.setattr(
@@ -232,10 +337,477 @@ def test_fetch_github_repo_paths_use_git_sparse_checkout(
     assert (fetched / "scripts" / "tool.py").read_text() == "print('ok')\n"
 
 
+def test_fetch_repo_paths_uses_one_sparse_clone_for_many_paths(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(remote.GIT_CACHE_ENV, "0")
+    commands: list[list[str]] = []
+    monkeypatch.setattr(remote.shutil, "which", lambda cmd: "/usr/bin/git")
+
+    def fake_run_fetch_command(cmd: list[str], cwd: Path | None = None) -> str:
+        commands.append(cmd)
+        if cmd[:2] == ["git", "clone"]:
+            Path(cmd[-1]).mkdir(parents=True, exist_ok=True)
+        if cmd[:3] == ["git", "checkout", "FETCH_HEAD"]:
+            assert cwd is not None
+            for name in ("alpha", "beta"):
+                (cwd / "skills" / name).mkdir(parents=True, exist_ok=True)
+                (cwd / "skills" / name / "SKILL.md").write_text(f"{name}\n")
+        return ""
+
+    monkeypatch.setattr(remote, "_run_fetch_command", fake_run_fetch_command)
+
+    results = remote.fetch_repo_paths(
+        [
+            "https://github.com/acme/repo/tree/main/skills/alpha",
+            "https://github.com/acme/repo/blob/main/skills/beta/SKILL.md",
+            "https://github.com/acme/repo/tree/main/skills/missing",
+            "https://github.com/acme/repo/tree/main/skills/alpha",
+        ]
+    )
+
+    assert [cmd[:2] for cmd in commands].count(["git", "clone"]) == 1
+    assert commands[1] == [
+        "git",
+        "sparse-checkout",
+        "set",
+        "--no-cone",
+        "skills/alpha",
+        "skills/beta/SKILL.md",
+        "skills/missing",
+    ]
+    alpha, beta, missing, alpha_again = results
+    assert isinstance(alpha, Path) and (alpha / "SKILL.md").read_text() == "alpha\n"
+    assert isinstance(beta, Path) and (beta / "SKILL.md").read_text() == "beta\n"
+    assert isinstance(missing, remote.FetchError)
+    assert isinstance(alpha_again, Path) and alpha_again != alpha
+    assert remote.github_repo_key("https://github.com/acme/repo/tree/main/x") == (
+        "acme",
+        "repo",
+        "main",
+    )
+    assert remote.github_repo_key("https://example.com/SKILL.md") is None
+    with pytest.raises(ValueError, match="sharing one repository ref"):
+        remote.fetch_repo_paths(
+            [
+                "https://github.com/acme/repo/tree/main/a",
+                "https://github.com/acme/repo/tree/dev/b",
+            ]
+        )
+
+
+def _git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-c", "user.name=chef", "-c", "user.email=chef@example.com", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def _make_upstream_repo(root: Path) -> Path:
+    root.mkdir(parents=True)
+    _git(root, "init", "-q", "-b", "main")
+    _git(root, "config", "uploadpack.allowFilter", "true")
+    for name in ("alpha", "beta"):
+        (root / "skills" / name).mkdir(parents=True)
+        (root / "skills" / name / "SKILL.md").write_text(f"{name} v1\n")
+    (root / "skills" / "alpha" / "scripts").mkdir()
+    (root / "skills" / "alpha" / "scripts" / "run.sh").write_text("echo v1\n")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "v1")
+    return root
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is required")
+def test_fetch_repo_paths_reuses_persistent_mirror_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_paths: dict[str, Path]
+) -> None:
+    upstream = _make_upstream_repo(tmp_path / "upstream")
+    monkeypatch.setattr(remote, "_github_clone_url", lambda _o, _r: upstream.as_uri())
+    commands: list[list[str]] = []
+    real_run_fetch_command = remote._run_fetch_command
+
+    def recording_run_fetch_command(cmd: list[str], cwd: Path | None = None) -> str:
+        commands.append(cmd)
+        return real_run_fetch_command(cmd, cwd=cwd)
+
+    monkeypatch.setattr(remote, "_run_fetch_command", recording_run_fetch_command)
+    sources = [
+        "https://github.com/acme/repo/tree/main/skills/alpha",
+        "https://github.com/acme/repo/blob/main/skills/beta/SKILL.md",
+        "https://github.com/acme/repo/tree/main/skills/missing",
+    ]
+
+    alpha, beta, missing = remote.fetch_repo_paths(sources)
+
+    mirror = isolated_paths["skillchef_home"] / "cache" / "git" / "acme" / "repo"
+    assert (mirror / "HEAD").exists()
+    assert isinstance(alpha, Path) and (alpha / "SKILL.md").read_text() == "alpha v1\n"
+    assert (alpha / "scripts" / "run.sh").read_text() == "echo v1\n"
+    assert isinstance(beta, Path) and [p.name for p in beta.iterdir()] == ["SKILL.md"]
+    assert isinstance(missing, remote.FetchError)
+
+    (upstream / "skills" / "alpha" / "SKILL.md").write_text("alpha v2\n")
+    _git(upstream, "commit", "-q", "-am", "v2")
+    commands.clear()
+
+    (alpha_v2,) = remote.fetch_repo_paths(sources[:1])
+
+    assert isinstance(alpha_v2, Path) and (alpha_v2 / "SKILL.md").read_text() == "alpha v2\n"
+    assert not any(cmd[:2] == ["git", "clone"] for cmd in commands)
+    assert ["git", "fetch", "origin", "main"] in commands
+
+    pinned = _git(upstream, "rev-parse", "HEAD")
+    commands.clear()
+    (alpha_pinned,) = remote.fetch_repo_paths(
+        [f"https://github.com/acme/repo/tree/{pinned}/skills/alpha"]
+    )
+    assert isinstance(alpha_pinned, Path)
+    assert not any(cmd[:2] == ["git", "fetch"] for cmd in commands)
+
+
+def _codeload_tarball(entries: list[tuple[str, bytes | None, int]]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, content, mode in entries:
+            info = tarfile.TarInfo(f"repo-abc123/{name}")
+            info.mode = mode
+            if content is None:
+                info.type = tarfile.DIRTYPE
+                archive.addfile(info)
+            elif name.endswith(".link"):
+                info.type = tarfile.SYMTYPE
+                info.linkname = "/etc/passwd"
+                archive.addfile(info)
+            else:
+                info.size = len(content)
+                archive.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def _serve_codeload(monkeypatch: pytest.MonkeyPatch, body: bytes, requested: list[str]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, content=body)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(remote, "http_client", lambda: client)
+
+
+def test_fetch_repo_paths_tarball_backend_extracts_only_requested_paths(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    body = _codeload_tarball(
+        [
+            ("README.md", b"root\n", 0o644),
+            ("skills", None, 0o755),
+            ("skills/alpha", None, 0o755),
+            ("skills/alpha/SKILL.md", b"---\nname: alpha\n---\n", 0o644),
+            ("skills/alpha/run.sh", b"echo hi\n", 0o755),
+            ("skills/alpha/escape.link", b"", 0o777),
+            ("skills/alpha-extra/SKILL.md", b"not me\n", 0o644),
+            ("skills/beta/SKILL.md", b"---\nname: beta\n---\n", 0o644),
+            ("zzz/huge.bin", b"x" * 1024, 0o644),
+        ]
+    )
+    requested: list[str] = []
+    _serve_codeload(monkeypatch, body, requested)
+    monkeypatch.setenv(remote.GITHUB_FETCH_ENV, "tarball")
+    monkeypatch.setattr(remote, "_run_fetch_command", lambda *_a, **_k: pytest.fail("git used"))
+
+    alpha, beta, missing = remote.fetch_repo_paths(
+        [
+            "https://github.com/acme/repo/tree/main/skills/alpha",
+            "https://github.com/acme/repo/blob/main/skills/beta/SKILL.md",
+            "https://github.com/acme/repo/tree/main/skills/gamma",
+        ]
+    )
+
+    assert requested == ["https://codeload.github.com/acme/repo/tar.gz/main"]
+    assert isinstance(alpha, Path) and isinstance(beta, Path)
+    assert sorted(p.name for p in alpha.iterdir()) == ["SKILL.md", "run.sh"]
+    assert (alpha / "run.sh").stat().st_mode & 0o111
+    assert (beta / "SKILL.md").read_text() == "---\nname: beta\n---\n"
+    assert isinstance(missing, remote.FetchError)
+    for fetched in (alpha, beta):
+        shutil.rmtree(fetched.parent)
+
+
+def test_auto_backend_falls_back_to_git_when_tarball_is_too_large(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    requested: list[str] = []
+    body = _codeload_tarball([("skills/alpha/SKILL.md", os.urandom(2 * 1024 * 1024), 0o644)])
+    _serve_codeload(monkeypatch, body, requested)
+    monkeypatch.setenv(remote.TARBALL_AUTO_MAX_MB_ENV, "1")
+    monkeypatch.setenv(remote.GIT_CACHE_ENV, "0")
+    monkeypatch.setattr(remote.shutil, "which", lambda cmd: f"/usr/bin/{cmd}")
+    sparse_calls: list[list[str]] = []
+
+    def fake_sparse(owner: str, repo: str, ref: str, paths: list[str]) -> list[Path]:
+        sparse_calls.append(paths)
+        return [tmp_path]
+
+    monkeypatch.setattr(remote, "_fetch_github_paths_sparse", fake_sparse)
+
+    assert remote.fetch_repo_paths(["https://github.com/acme/repo/tree/main/skills/alpha"]) == [
+        tmp_path
+    ]
+    assert requested and sparse_calls == [["skills/alpha"]]
+
+
+def test_auto_backend_fetches_tree_sources_from_codeload_without_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requested: list[str] = []
+    body = _codeload_tarball([("skills/alpha/SKILL.md", b"---\nname: alpha\n---\n", 0o644)])
+    _serve_codeload(monkeypatch, body, requested)
+    monkeypatch.setenv(remote.GIT_CACHE_ENV, "0")
+    monkeypatch.setattr(remote.shutil, "which", lambda cmd: f"/usr/bin/{cmd}")
+    monkeypatch.setattr(remote, "_run_fetch_command", lambda *_a, **_k: pytest.fail("git used"))
+
+    fetched, kind = remote.fetch("https://github.com/acme/repo/tree/main/skills/alpha")
+
+    assert kind == "github"
+    assert (fetched / "SKILL.md").read_text() == "---\nname: alpha\n---\n"
+    assert requested == ["https://codeload.github.com/acme/repo/tar.gz/main"]
+    shutil.rmtree(fetched.parent)
+
+
+@pytest.mark.parametrize(("status", "attempts"), [(404, 1), (503, 3)])
+def test_tarball_fetch_retries_only_server_errors(
+    monkeypatch: pytest.MonkeyPatch, status: int, attempts: int
+) -> None:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(status)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(remote, "http_client", lambda: client)
+    monkeypatch.setattr(remote, "REQUEST_BACKOFF_SECONDS", 0)
+
+    with pytest.raises(remote.FetchError, match=str(status)):
+        remote._fetch_github_paths_tarball("acme", "repo", "main", ["skills/alpha"])
+    assert len(requested) == attempts
+
+
+def test_github_fetch_backend_choice(
+    monkeypatch: pytest.MonkeyPatch, isolated_paths: dict[str, Path]
+) -> None:
+    monkeypatch.delenv(remote.GITHUB_FETCH_ENV, raising=False)
+    monkeypatch.setattr(remote.shutil, "which", lambda cmd: f"/usr/bin/{cmd}")
+    assert remote.github_fetch_backend() == "git"
+
+    monkeypatch.setenv(remote.GIT_CACHE_ENV, "0")
+    assert remote.github_fetch_backend() == "auto"
+    monkeypatch.setenv(remote.GITHUB_FETCH_ENV, "git")
+    assert remote.github_fetch_backend() == "git"
+
+    monkeypatch.delenv(remote.GITHUB_FETCH_ENV)
+    monkeypatch.setattr(remote.shutil, "which", lambda _cmd: None)
+    assert remote.github_fetch_backend() == "tarball"
+    monkeypatch.setenv(remote.GITHUB_FETCH_ENV, "svn")
+    with pytest.raises(ValueError, match="Unknown GitHub fetch backend"):
+        remote.github_fetch_backend()
+
+
+def test_github_blob_sources_use_one_conditional_raw_request(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    source = "https://github.com/acme/repo/blob/main/skills/demo/SKILL.md"
+    sent: list[tuple[str, str | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append((str(request.url), request.headers.get("If-None-Match")))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"---\nname: demo\n---\n", headers={"ETag": '"v1"'})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(remote, "http_client", lambda: client)
+    monkeypatch.setattr(remote, "_run_fetch_command", lambda *_a, **_k: pytest.fail("git used"))
+
+    fetched, kind = remote.fetch(source)
+    validators = remote.fetched_validators(fetched)
+
+    assert kind == "github"
+    assert (fetched / "SKILL.md").read_text() == "---\nname: demo\n---\n"
+    assert validators["source_etag"] == '"v1"'
+    with pytest.raises(remote.NotModifiedError):
+        remote.fetch(source, validators=validators)
+    raw = "https://raw.githubusercontent.com/acme/repo/main/skills/demo/SKILL.md"
+    assert sent == [(raw, None), (raw, '"v1"')]
+    assert remote.github_repo_key(source) is None
+    assert remote.github_repo_key(source.replace("/blob/", "/tree/")) == ("acme", "repo", "main")
+    shutil.rmtree(fetched.parent)
+
+
+def test_github_blob_falls_back_to_git_for_private_repos(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    client = httpx.Client(transport=httpx.MockTransport(lambda _request: httpx.Response(404)))
+    monkeypatch.setattr(remote, "http_client", lambda: client)
+    git_paths: list[str] = []
+
+    def fake_git_path(owner: str, repo: str, ref: str, path: str, **_kwargs: object) -> Path:
+        git_paths.append(path)
+        return tmp_path
+
+    monkeypatch.setattr(remote, "_fetch_github_path", fake_git_path)
+
+    fetched, _kind = remote.fetch("https://github.com/acme/private/blob/main/SKILL.md")
+
+    assert fetched == tmp_path
+    assert git_paths == ["SKILL.md"]
+    monkeypatch.setenv(remote.GITHUB_FETCH_ENV, "git")
+    assert not remote.uses_blob_fast_path("https://github.com/acme/private/blob/main/SKILL.md")
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is required")
+def test_git_cache_evicts_least_recently_used_mirrors(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_paths: dict[str, Path]
+) -> None:
+    upstream = _make_upstream_repo(tmp_path / "upstream")
+    monkeypatch.setattr(remote, "_github_clone_url", lambda _o, _r: upstream.as_uri())
+    monkeypatch.setenv(remote.GIT_CACHE_MAX_MB_ENV, "0")
+    cache_root = isolated_paths["skillchef_home"] / "cache" / "git"
+
+    remote.fetch_repo_paths(["https://github.com/acme/one/tree/main/skills/alpha"])
+    remote.fetch_repo_paths(["https://github.com/acme/two/tree/main/skills/alpha"])
+
+    assert not (cache_root / "acme" / "one").exists()
+    assert (cache_root / "acme" / "two" / "HEAD").exists()
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is required")
+@pytest.mark.parametrize("git_cache", ["1", "0"])
+def test_fetch_async_github_paths_match_sync_fetch(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    isolated_paths: dict[str, Path],
+    git_cache: str,
+) -> None:
+    upstream = _make_upstream_repo(tmp_path / "upstream")
+    monkeypatch.setattr(remote, "_github_clone_url", lambda _o, _r: upstream.as_uri())
+    monkeypatch.setenv(remote.GIT_CACHE_ENV, git_cache)
+
+    fetched_dir, kind = asyncio.run(
+        remote.fetch_async("https://github.com/acme/repo/tree/main/skills/alpha")
+    )
+
+    assert kind == "github"
+    assert (fetched_dir / "SKILL.md").read_text() == "alpha v1\n"
+    assert (fetched_dir / "scripts" / "run.sh").read_text() == "echo v1\n"
+    cache_root = isolated_paths["skillchef_home"] / "cache" / "git"
+    assert (cache_root / "acme" / "repo" / "HEAD").exists() == (git_cache == "1")
+    with pytest.raises(remote.FetchError, match="not found after checkout"):
+        asyncio.run(remote.fetch_async("https://github.com/acme/repo/tree/main/skills/missing"))
+
+
+def test_fetch_many_overlaps_requests_and_keeps_source_order(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    local = tmp_path / "local-skill"
+    local.mkdir()
+    (local / "SKILL.md").write_text("local\n")
+    in_flight = 0
+    peak = 0
+    seen_headers: dict[str, str] = {}
+
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        if request.url.path == "/missing/SKILL.md":
+            return httpx.Response(404)
+        if request.url.path == "/cached/SKILL.md":
+            seen_headers.update(request.headers)
+            return httpx.Response(304)
+        return httpx.Response(200, content=request.url.path.encode(), headers={"ETag": '"e"'})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(remote, "http_client", lambda: client)
+    monkeypatch.setattr(remote, "REQUEST_BACKOFF_SECONDS", 0)
+    sources = [
+        "https://example.com/a/SKILL.md",
+        "https://example.com/missing/SKILL.md",
+        str(local),
+        "https://example.com/cached/SKILL.md",
+        "https://example.com/b/SKILL.md",
+    ]
+    validators = [None, None, None, {"source_etag": '"old"', "source_last_modified": ""}, None]
+
+    results = asyncio.run(remote.fetch_many(sources, concurrency=2, validators=validators))
+
+    first, missing, local_result, cached, second = results
+    assert isinstance(first, tuple) and first[1] == "http"
+    assert (first[0] / "SKILL.md").read_text() == "/a/SKILL.md"
+    assert remote.fetched_validators(first[0])["source_etag"] == '"e"'
+    assert isinstance(missing, remote.FetchError)
+    assert isinstance(local_result, tuple) and local_result[1] == "local"
+    assert (local_result[0] / "SKILL.md").read_text() == "local\n"
+    assert isinstance(cached, remote.NotModifiedError)
+    assert seen_headers["if-none-match"] == '"old"'
+    assert isinstance(second, tuple) and (second[0] / "SKILL.md").read_text() == "/b/SKILL.md"
+    assert peak == 2
+    with pytest.raises(ValueError, match="one entry per source"):
+        asyncio.run(remote.fetch_many(sources, validators=[]))
+
+
+def test_current_commit_sha_prefers_ls_remote_and_falls_back_to_api(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    commands: list[list[str]] = []
+    api_calls: list[tuple[str, str, str]] = []
+    monkeypatch.setattr(remote.shutil, "which", lambda cmd: "/usr/bin/git")
+
+    def fake_run_fetch_command(cmd: list[str], cwd: Path | None = None) -> str:
+        commands.append(cmd)
+        if cmd[-1] == "v1":
+            return (
+                "1111111111111111111111111111111111111111\trefs/tags/v1\n"
+                "2222222222222222222222222222222222222222\trefs/tags/v1^{}\n"
+            )
+        if cmd[-1] == "main":
+            return "3333333333333333333333333333333333333333\trefs/heads/main\n"
+        return ""
+
+    monkeypatch.setattr(remote, "_run_fetch_command", fake_run_fetch_command)
+    monkeypatch.setattr(
+        remote,
+        "_resolve_github_commit",
+        lambda owner, repo, ref: api_calls.append((owner, repo, ref)) or "api-sha",
+    )
+
+    tree = "https://github.com/acme/repo/tree/{ref}/skills/demo"
+    pinned = "4444444444444444444444444444444444444444"
+
+    assert remote.current_commit_sha(tree.format(ref="main")) == "3" * 40
+    assert remote.current_commit_sha(tree.format(ref="v1")) == "2" * 40
+    assert remote.current_commit_sha(tree.format(ref=pinned)) == pinned
+    assert remote.current_commit_sha(tree.format(ref="missing")) == "api-sha"
+    assert remote.current_commit_sha("https://example.com/SKILL.md") == ""
+    assert commands[0] == ["git", "ls-remote", "https://github.com/acme/repo.git", "main"]
+    assert len(commands) == 3
+    assert api_calls == [("acme", "repo", "missing")]
+
+
 def test_request_with_retry_retries_then_succeeds(monkeypatch: pytest.MonkeyPatch) -> None:
     calls = {"count": 0}
 
     class DummyResponse:
+        status_code = 200
         content = b"ok"
 
         def raise_for_status(self) -> None:
@@ -245,6 +817,8 @@ def test_request_with_retry_retries_then_succeeds(monkeypatch: pytest.MonkeyPatc
             return {"ok": True}
 
     class DummyClient:
+        is_closed = False
+
         def __init__(self, *args, **kwargs) -> None:
             pass
 
@@ -260,13 +834,75 @@ def test_request_with_retry_retries_then_succeeds(monkeypatch: pytest.MonkeyPatc
                 raise httpx.ReadTimeout("timeout")
             return DummyResponse()
 
-    monkeypatch.setattr(remote.httpx, "Client", DummyClient)
+    created: list[dict[str, object]] = []
+
+    def make_client(*_args, **kwargs) -> DummyClient:
+        created.append(kwargs)
+        return DummyClient()
+
+    monkeypatch.setattr(remote, "_shared_http_client", None)
+    monkeypatch.setattr(remote.httpx, "Client", make_client)
     monkeypatch.setattr(remote.time, "sleep", lambda _n: None)
 
     data = remote._request_bytes_with_retry("https://example.com/SKILL.md")
+    again = remote._request_bytes_with_retry("https://example.com/other.md")
 
-    assert data == b"ok"
-    assert calls["count"] == 3
+    assert data == b"ok" and again == b"ok"
+    assert calls["count"] == 4
+    assert len(created) == 1
+    assert created[0]["follow_redirects"] is True
+
+
+def test_http_client_is_shared_and_closed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(remote, "_shared_http_client", None)
+    monkeypatch.setenv(remote.HTTP_MAX_CONNECTIONS_ENV, "4")
+
+    client = remote.http_client()
+
+    assert remote.http_client() is client
+    assert client._transport._pool._max_connections == 4  # type: ignore[attr-defined]
+    remote.close_http_client()
+    assert client.is_closed
+    assert remote.http_client() is not client
+    remote.close_http_client()
+
+
+def test_shared_commit_lookups_resolve_each_repo_ref_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    lookups: list[tuple[str, str, str]] = []
+
+    def fake_lookup(owner: str, repo: str, ref: str) -> str:
+        lookups.append((owner, repo, ref))
+        return f"{ref[0]}" * 40
+
+    monkeypatch.setattr(remote, "_lookup_commit", fake_lookup)
+    monkeypatch.setattr(remote, "_resolve_github_commit", fake_lookup)
+    tree = "https://github.com/acme/repo/tree/{ref}/skills/{name}"
+
+    with remote.shared_commit_lookups():
+        with remote.shared_commit_lookups():
+            assert remote.current_commit_sha(tree.format(ref="main", name="a")) == "m" * 40
+        assert remote.current_commit_sha(tree.format(ref="main", name="b")) == "m" * 40
+        meta = remote.source_metadata(tree.format(ref="main", name="c"), "github")
+        assert meta["source_commit_sha"] == "m" * 40
+        remote.source_metadata(tree.format(ref="dev", name="a"), "github")
+        remote.source_metadata(tree.format(ref="d" * 40, name="a"), "github")
+
+    assert lookups == [("acme", "repo", "main"), ("acme", "repo", "dev")]
+    remote.current_commit_sha(tree.format(ref="main", name="a"))
+    assert len(lookups) == 3
+
+
+def test_shared_commit_lookups_retry_failed_lookups(monkeypatch: pytest.MonkeyPatch) -> None:
+    results = ["", "a" * 40]
+    monkeypatch.setattr(remote, "_lookup_commit", lambda *_args: results.pop(0))
+    tree = "https://github.com/acme/repo/tree/main/skills/{name}"
+
+    with remote.shared_commit_lookups():
+        assert remote.current_commit_sha(tree.format(name="a")) == ""
+        assert remote.current_commit_sha(tree.format(name="b")) == "a" * 40
+        assert remote.current_commit_sha(tree.format(name="c")) == "a" * 40
 
 
 def test_resolve_github_commit_logs_warning_on_lookup_failure(
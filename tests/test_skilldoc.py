@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from skillchef import skilldoc
+
+
+def test_parse_skill_splits_sections_outside_code_fences() -> None:
+    text = (
+        "---\nname: demo\n---\n"
+        "Intro\n"
+        "# Title\n\nBody\n"
+        "```bash\n# not a heading\n```\n"
+        "## Usage ##\n\nRun it\n"
+    )
+
+    doc = skilldoc.parse_skill(text)
+
+    assert doc.frontmatter is not None and doc.frontmatter.text == "---\nname: demo\n---\n"
+    assert [(s.title, s.level) for s in doc.sections] == [("", 0), ("Title", 1), ("Usage", 2)]
+    assert "# not a heading" in doc.sections[1].text
+    assert doc.sections[2].body == "\nRun it\n"
+    assert doc.text() == text
+    assert doc.find("Usage", level=2) == 2 and doc.find("Usage", level=1) is None
+    assert skilldoc.parse_skill(text) is doc
+
+
+def test_parse_skill_ignores_fences_that_never_close() -> None:
+    inline = skilldoc.parse_skill("# T\n\n```npm i`` is wrong\n\n## Next\n\nbody\n")
+    unclosed = skilldoc.parse_skill("# T\n\n```bash\nrun it\n\n## Next\n\nbody\n")
+    closed = skilldoc.parse_skill("# T\n\n````\n```\n## Hidden\n````\n\n## Next\n")
+
+    for doc in (inline, unclosed, closed):
+        assert [s.title for s in doc.sections] == ["T", "Next"]
+
+
+def test_sections_compare_by_digest() -> None:
+    first = skilldoc.parse_skill("# A\n\nsame\n\n# B\n\none\n").sections
+    second = skilldoc.parse_skill("# A\n\nsame\n\n# B\n\ntwo\n").sections
+
+    assert first[0] == second[0]
+    assert first[1] != second[1]
+    assert len({first[0], second[0]}) == 1
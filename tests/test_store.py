@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -44,6 +48,29 @@ def test_cook_layout_and_remove_cleanup(isolated_paths: dict[str, Path], tmp_pat
     assert not link.exists()
 
 
+def test_cook_and_update_base_record_http_validators(
+    isolated_paths: dict[str, Path], tmp_path: Path
+) -> None:
+    fetched_root = tmp_path / "download"
+    fetched = _make_fetched_skill(fetched_root, body="Original")
+    skill_copy = fetched_root / "skill"
+    fetched.rename(skill_copy)
+    (fetched_root / store.remote.VALIDATORS_FILENAME).write_text(
+        '{"source_etag": "\\"v1\\"", "source_last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"}'
+    )
+
+    store.cook("hello-chef", skill_copy, "https://example.com/hello", "http", ["codex"])
+    meta = store.load_meta("hello-chef")
+    assert meta["source_etag"] == '"v1"'
+    assert meta["source_last_modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    (fetched_root / store.remote.VALIDATORS_FILENAME).unlink()
+    store.update_base("hello-chef", skill_copy)
+    meta = store.load_meta("hello-chef")
+    assert meta["source_etag"] == ""
+    assert meta["source_last_modified"] == ""
+
+
 def test_rebuild_live_and_update_base_refreshes_metadata(
     isolated_paths: dict[str, Path], tmp_path: Path, monkeypatch
 ) -> None:
@@ -216,3 +243,136 @@ def test_record_served_persists_snapshot_and_metadata(
     assert snapshot_dir.exists()
     assert (snapshot_dir / "SKILL.md").read_text() == "served body\n"
     assert (snapshot_dir / "scripts" / "tool.py").read_text() == "print('served')\n"
+
+
+def test_list_skills_maintains_index_and_heals_drift(
+    isolated_paths: dict[str, Path], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for name in ("beta", "alpha"):
+        store.cook(name, _make_fetched_skill(tmp_path, name=name), name, "local", ["codex"])
+    index_path = isolated_paths["store_dir"] / store.INDEX_FILENAME
+    assert index_path.exists()
+
+    parsed: list[str] = []
+    real_loads = store.tomllib.loads
+    monkeypatch.setattr(
+        store.tomllib, "loads", lambda text: parsed.append(text) or real_loads(text)
+    )
+
+    assert [meta["name"] for meta in store.list_skills()] == ["alpha", "beta"]
+    assert parsed == []
+
+    meta_path = store.skill_dir("alpha") / "meta.toml"
+    meta_path.write_text(meta_path.read_text().replace('remote_url = "alpha"', 'remote_url = "x"'))
+    store.remove("beta")
+    (isolated_paths["store_dir"] / "stray").mkdir()
+    parsed.clear()
+
+    skills = store.list_skills()
+
+    assert [meta["remote_url"] for meta in skills] == ["x"]
+    assert skills[0]["enabled"] is True
+    assert len(parsed) == 1
+
+    index_path.write_text("not json")
+    parsed.clear()
+    assert [meta["name"] for meta in store.list_skills()] == ["alpha"]
+    assert len(parsed) == 1
+
+
+def test_concurrent_save_meta_keeps_every_index_entry(
+    isolated_paths: dict[str, Path], tmp_path: Path
+) -> None:
+    names = [f"skill-{i}" for i in range(16)]
+    for name in names:
+        store.cook(name, _make_fetched_skill(tmp_path, name=name), name, "local", [])
+    index_path = isolated_paths["store_dir"] / store.INDEX_FILENAME
+    index_path.unlink()
+
+    def touch(name: str) -> None:
+        meta = store.load_meta(name)
+        meta["last_sync"] = "later"
+        store.save_meta(name, meta)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(touch, names))
+
+    indexed = json.loads(index_path.read_text())["skills"]
+    assert sorted(indexed) == sorted(names)
+    assert all(entry["meta"]["last_sync"] == "later" for entry in indexed.values())
+    assert not list(isolated_paths["store_dir"].glob("*.tmp"))
+
+
+def test_hash_dir_reuses_cached_digest_until_a_file_changes(
+    isolated_paths: dict[str, Path], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    skill = _make_fetched_skill(tmp_path)
+    (skill / "assets").mkdir()
+    (skill / "assets" / "big.bin").write_bytes(bytes(range(256)) * 20_000)
+
+    def legacy_hash(path: Path) -> str:
+        h = hashlib.sha256()
+        for f in sorted(path.rglob("*")):
+            if f.is_file():
+                h.update(f.relative_to(path).as_posix().encode())
+                h.update(f.read_bytes())
+        return h.hexdigest()
+
+    def age_files() -> None:
+        for f in skill.rglob("*"):
+            os.utime(f, ns=(1_000_000_000, 1_000_000_000))
+
+    age_files()
+    expected = legacy_hash(skill)
+    assert store.hash_dir(skill) == expected
+
+    opened: list[Path] = []
+    real_open = Path.open
+
+    def recording_open(self: Path, *args, **kwargs):
+        if skill in self.parents:
+            opened.append(self)
+        return real_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", recording_open)
+    assert store.hash_dir(skill) == expected
+    assert opened == []
+
+    (skill / "SKILL.md").write_text("changed, but same length?\n")
+    age_files()
+    assert store.hash_dir(skill) == legacy_hash(skill) != expected
+    assert opened
+
+    opened.clear()
+    (skill / "scripts" / "tool.py").write_text("print('new')\n")
+    assert store.hash_dir(skill) == legacy_hash(skill)
+    opened.clear()
+    assert store.hash_dir(skill) == legacy_hash(skill)
+    assert opened, "recently written files are not cached"
+
+
+def test_hash_dir_cache_is_shared_across_threads_and_flushed_once(
+    isolated_paths: dict[str, Path], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    skills = [_make_fetched_skill(tmp_path, name=f"skill-{i}") for i in range(16)]
+    for skill in skills:
+        for f in skill.rglob("*"):
+            os.utime(f, ns=(1_000_000_000, 1_000_000_000))
+    store.flush_hash_cache()
+    writes: list[Path] = []
+    real_replace = store._replace_file
+    monkeypatch.setattr(
+        store, "_replace_file", lambda path, text: writes.append(path) or real_replace(path, text)
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        digests = list(pool.map(store.hash_dir, skills))
+    assert writes == []
+
+    store.flush_hash_cache()
+
+    cache_path = isolated_paths["skillchef_home"] / "cache" / "hashes.json"
+    assert writes == [cache_path]
+    cached = json.loads(cache_path.read_text())
+    assert [cached[str(skill.resolve())]["sha256"] for skill in skills] == digests
+    assert not list(cache_path.parent.glob("*.tmp"))
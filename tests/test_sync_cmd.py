@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import json
 from concurrent.futures import Future, TimeoutError
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
 
+from skillchef import store
 from skillchef.commands import sync_cmd
 
 
@@ -53,6 +56,46 @@ def test_resolve_ai_future_outcomes(monkeypatch: pytest.MonkeyPatch) -> None:
     assert any("Skipping initial AI proposal" in msg for msg in infos)
 
 
+def test_resolve_ai_future_previews_streamed_text_and_cancels(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    previews: list[list[str]] = []
+
+    @contextmanager
+    def fake_live_diff(_msg: str):
+        yield previews.append
+
+    class SlowFuture:
+        def result(self, timeout=None):
+            raise TimeoutError
+
+    stream = sync_cmd.ProposalStream()
+    stream.feed("# Skill\n")
+    stream.feed("new line\n")
+    polls = {"count": 0}
+
+    def fake_poll_delete_key() -> bool:
+        polls["count"] += 1
+        return polls["count"] > 1
+
+    monkeypatch.setattr(sync_cmd.ui, "live_diff", fake_live_diff)
+    monkeypatch.setattr(sync_cmd.ui, "info", lambda _msg: None)
+    monkeypatch.setattr(sync_cmd.ui, "poll_delete_key", fake_poll_delete_key)
+
+    result = sync_cmd._resolve_ai_future(
+        SlowFuture(),  # type: ignore[arg-type]
+        stream=stream,
+        current_live="# Skill\nold line\nmore\n",
+    )
+
+    assert result is None
+    assert len(previews) == 1
+    assert "-old line\n" in previews[0] and "+new line\n" in previews[0]
+    assert "-more\n" not in previews[0]
+    with pytest.raises(sync_cmd.MergeCancelled):
+        stream.feed("late\n")
+
+
 def test_sync_one_core_paths(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -67,7 +110,7 @@ def test_sync_one_core_paths(
     no_flavor_fetched = tmp_path / "remote-no-flavor"
     _write_skill(no_flavor_fetched, "---\nname: plain-chef\n---\n\nremote new\n")
     no_flavor_calls: dict[str, int] = {"update": 0, "rebuild": 0, "cleanup": 0}
-    monkeypatch.setattr(sync_cmd.remote, "fetch", lambda _url: (no_flavor_fetched, "http"))
+    monkeypatch.setattr(sync_cmd.remote, "fetch", lambda _url, **_k: (no_flavor_fetched, "http"))
     monkeypatch.setattr(sync_cmd.store, "base_skill_text", lambda _n, scope="auto": "old base\n")
     monkeypatch.setattr(sync_cmd.store, "has_flavor", lambda _n, scope="auto": False)
     monkeypatch.setattr(
@@ -108,7 +151,7 @@ def test_sync_one_core_paths(
     ai_fetched = tmp_path / "remote-ai"
     _write_skill(ai_fetched, "new remote\n")
     ai_calls: dict[str, int] = {"update": 0, "cleanup": 0}
-    monkeypatch.setattr(sync_cmd.remote, "fetch", lambda _url: (ai_fetched, "http"))
+    monkeypatch.setattr(sync_cmd.remote, "fetch", lambda _url, **_k: (ai_fetched, "http"))
     monkeypatch.setattr(sync_cmd.store, "base_skill_text", lambda _n, scope="auto": "old base\n")
     monkeypatch.setattr(sync_cmd.store, "has_flavor", lambda _n, scope="auto": True)
     monkeypatch.setattr(sync_cmd.store, "flavor_path", lambda _n, scope="auto": ai_flavor_path)
@@ -153,7 +196,7 @@ def test_sync_one_core_paths(
     keep_calls: dict[str, int] = {"update": 0, "cleanup": 0}
     choices: list[list[str]] = []
     semantic_calls: dict[str, int] = {"count": 0}
-    monkeypatch.setattr(sync_cmd.remote, "fetch", lambda _url: (keep_fetched, "http"))
+    monkeypatch.setattr(sync_cmd.remote, "fetch", lambda _url, **_k: (keep_fetched, "http"))
     monkeypatch.setattr(sync_cmd.store, "base_skill_text", lambda _n, scope="auto": old_base)
     monkeypatch.setattr(sync_cmd.store, "has_flavor", lambda _n, scope="auto": True)
     monkeypatch.setattr(sync_cmd.store, "flavor_path", lambda _n, scope="auto": keep_flavor_path)
@@ -198,3 +241,502 @@ def test_sync_one_core_paths(
     assert "resolve with chat" not in choices[0]
     assert "Keep current live flavor" in (keep_live_dir / "SKILL.md").read_text()
     assert keep_flavor_path.read_text().strip() == "outdated flavor"
+
+
+def test_sync_one_merges_non_overlapping_local_edits_without_ai(
+    monkeypatch: pytest.MonkeyPatch, isolated_paths: dict[str, Path], tmp_path: Path
+) -> None:
+    name = "edited-chef"
+    live_dir = isolated_paths["store_dir"] / name / "live"
+    old_base = "# Skill\n\nIntro\n\nStep one\nStep two\n"
+    current_live = "# Skill\n\nLocal intro\n\nStep one\nStep two\n\n## Local Flavor\n\nMine\n"
+    _write_skill(live_dir, current_live)
+    _write_skill(isolated_paths["store_dir"] / name / "base", old_base)
+    flavor_path = isolated_paths["store_dir"] / name / "flavor.md"
+    flavor_path.write_text("Mine\n")
+    fetched = tmp_path / "remote-edited"
+    _write_skill(fetched, "# Skill\n\nIntro\n\nStep one\nStep two\nStep three\n")
+    choices: list[list[str]] = []
+    updates: list[str] = []
+
+    monkeypatch.setattr(sync_cmd.store, "hash_dir", lambda _p: "newhash")
+    monkeypatch.setattr(sync_cmd.ui, "show_diff", lambda _d: None)
+    monkeypatch.setattr(sync_cmd.ui, "info", lambda _m: None)
+    monkeypatch.setattr(sync_cmd.ui, "success", lambda _m: None)
+    monkeypatch.setattr(sync_cmd.remote, "fetch", lambda _url, **_k: (fetched, "http"))
+    monkeypatch.setattr(sync_cmd.store, "base_skill_text", lambda _n, scope="auto": old_base)
+    monkeypatch.setattr(sync_cmd.store, "has_flavor", lambda _n, scope="auto": True)
+    monkeypatch.setattr(sync_cmd.store, "flavor_path", lambda _n, scope="auto": flavor_path)
+    monkeypatch.setattr(sync_cmd.store, "live_skill_text", lambda _n, scope="auto": current_live)
+    monkeypatch.setattr(
+        sync_cmd.store, "skill_dir", lambda _n, scope="auto": isolated_paths["store_dir"] / name
+    )
+    monkeypatch.setattr(
+        sync_cmd.store, "update_base", lambda n, _d, scope="auto": updates.append(n)
+    )
+    monkeypatch.setattr(
+        sync_cmd.ui, "choose", lambda _p, opts: choices.append(list(opts)) or "accept update"
+    )
+    monkeypatch.setattr(sync_cmd, "cleanup_fetched", lambda _p: None)
+
+    def fail_semantic_merge(*_args, **_kwargs) -> str:
+        raise AssertionError("clean merges must not call the LLM")
+
+    monkeypatch.setattr(sync_cmd, "semantic_merge", fail_semantic_merge)
+
+    sync_cmd._sync_one(
+        {"name": name, "remote_url": "https://example.com/edited", "base_sha256": "oldhash"},
+        ai_available=True,
+    )
+
+    assert updates == [name]
+    assert choices == [["accept update", "keep current", "manual edit"]]
+    assert (live_dir / "SKILL.md").read_text() == (
+        "# Skill\n\nLocal intro\n\nStep one\nStep two\nStep three\n\n## Local Flavor\n\nMine\n"
+    )
+
+
+def test_run_fetches_concurrently_and_resolves_in_store_order(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_paths: dict[str, Path]
+) -> None:
+    import threading
+    import time
+
+    skills = [
+        {"name": "alpha", "remote_url": "https://example.com/alpha", "base_sha256": "same"},
+        {"name": "broken", "remote_url": "https://example.com/broken", "base_sha256": "x"},
+        {"name": "gamma", "remote_url": "https://example.com/gamma", "base_sha256": "old"},
+    ]
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_fetch(url: str, **_kwargs) -> tuple[Path, str]:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        try:
+            name = url.rsplit("/", 1)[-1]
+            # Later skills finish first to prove ordering does not follow completion.
+            time.sleep({"alpha": 0.15, "broken": 0.1, "gamma": 0.05}[name])
+            if name == "broken":
+                raise RuntimeError("network down")
+            fetched = tmp_path / name / "skill"
+            _write_skill(fetched, f"{name}\n")
+            return fetched, "http"
+        finally:
+            with lock:
+                active["now"] -= 1
+
+    events: list[str] = []
+    cleaned: list[str] = []
+    monkeypatch.setattr(sync_cmd, "ensure_config", lambda scope="auto": {})
+    monkeypatch.setattr(sync_cmd.config, "load", lambda scope="auto": {})
+    monkeypatch.setattr(sync_cmd, "selected_key", lambda _env: None)
+    monkeypatch.setattr(sync_cmd.ui, "banner", lambda: None)
+    monkeypatch.setattr(sync_cmd.ui, "info", lambda msg: events.append(f"info:{msg}"))
+    monkeypatch.setattr(sync_cmd.ui, "warn", lambda msg: events.append(f"warn:{msg}"))
+    monkeypatch.setattr(sync_cmd.ui, "success", lambda msg: events.append(f"ok:{msg}"))
+    monkeypatch.setattr(sync_cmd.store, "list_skills", lambda scope="auto": skills)
+    monkeypatch.setattr(sync_cmd.remote, "fetch", fake_fetch)
+    monkeypatch.setattr(
+        sync_cmd.store,
+        "hash_dir",
+        lambda p: "same" if p.parent.name == "alpha" else "new",
+    )
+    monkeypatch.setattr(sync_cmd, "cleanup_fetched", lambda p: cleaned.append(p.parent.name))
+    monkeypatch.setattr(
+        sync_cmd.ConflictResolver,
+        "resolve_without_flavor",
+        lambda _self, plan: events.append(f"resolve:{plan.name}"),
+    )
+    monkeypatch.setattr(sync_cmd.store, "base_skill_text", lambda _n, scope="auto": "old\n")
+    monkeypatch.setattr(sync_cmd.store, "has_flavor", lambda _n, scope="auto": False)
+    monkeypatch.setattr(sync_cmd.ui, "show_diff", lambda _d: None)
+    monkeypatch.setattr(sync_cmd.store, "record_upstream", lambda *_a, **_k: {})
+
+    sync_cmd.run(None, no_ai=True, jobs=3)
+
+    assert active["peak"] > 1
+    assert events == [
+        "info:Syncing [bold]alpha[/bold]...",
+        "ok:  alpha: up to date",
+        "info:Syncing [bold]broken[/bold]...",
+        "warn:  Could not fetch broken: network down",
+        "info:Syncing [bold]gamma[/bold]...",
+        "resolve:gamma",
+    ]
+    assert sorted(cleaned) == ["alpha", "gamma"]
+
+
+def test_run_starts_ai_merges_for_later_skills_before_earlier_ones_are_resolved(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import threading
+
+    skills = [
+        {"name": name, "remote_url": f"https://example.com/{name}", "base_sha256": "old"}
+        for name in ("first", "second")
+    ]
+    merges: list[str] = []
+    second_started = threading.Event()
+    waited: list[bool] = []
+
+    def fake_fetch(url: str, **_kwargs) -> tuple[Path, str]:
+        name = url.rsplit("/", 1)[-1]
+        fetched = tmp_path / name / "skill"
+        _write_skill(fetched, f"{name} remote\n")
+        return fetched, "http"
+
+    def fake_semantic_merge(_base, _remote, _flavor, _model, current_live, *_a, **_k) -> str:
+        name = current_live.split()[0]
+        merges.append(name)
+        if name == "second":
+            second_started.set()
+        return f"{name} merged\n"
+
+    def fake_choose(_prompt: str, choices: list[str]) -> str:
+        if not waited:
+            waited.append(second_started.wait(timeout=5))
+        return "keep current"
+
+    monkeypatch.setattr(sync_cmd, "ensure_config", lambda scope="auto": {})
+    monkeypatch.setattr(sync_cmd.config, "load", lambda scope="auto": {})
+    monkeypatch.setattr(sync_cmd, "selected_key", lambda _env: ("OPENAI_API_KEY", "OpenAI"))
+    monkeypatch.setattr(sync_cmd.ui, "banner", lambda: None)
+    for name in ("info", "warn", "success", "show_diff"):
+        monkeypatch.setattr(sync_cmd.ui, name, lambda _m: None)
+    monkeypatch.setattr(sync_cmd.ui, "poll_delete_key", lambda: False)
+    monkeypatch.setattr(sync_cmd.ui, "choose", fake_choose)
+    monkeypatch.setattr(sync_cmd.store, "list_skills", lambda scope="auto": skills)
+    monkeypatch.setattr(sync_cmd.remote, "fetch", fake_fetch)
+    monkeypatch.setattr(sync_cmd.store, "hash_dir", lambda _p: "new")
+    monkeypatch.setattr(sync_cmd, "cleanup_fetched", lambda _p: None)
+    monkeypatch.setattr(sync_cmd.store, "base_skill_text", lambda _n, scope="auto": "old\n")
+    monkeypatch.setattr(sync_cmd.store, "has_flavor", lambda _n, scope="auto": True)
+    monkeypatch.setattr(
+        sync_cmd.store,
+        "live_skill_text",
+        lambda n, scope="auto": f"{n} live\n\n## Local Flavor\n\nmine\n",
+    )
+    monkeypatch.setattr(sync_cmd, "semantic_merge", fake_semantic_merge)
+
+    sync_cmd.run(None, no_ai=False, jobs=2, ai_jobs=2)
+
+    assert waited == [True]
+    assert sorted(merges) == ["first", "second"]
+
+
+def test_run_batch_applies_safe_updates_and_reports_pending_conflicts(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_paths: dict[str, Path]
+) -> None:
+    def skill_source(name: str, body: str) -> Path:
+        source = tmp_path / "sources" / name / body.replace(" ", "-")
+        _write_skill(source, f"# {name}\n\n{body}\n")
+        return source
+
+    for name in ("plain", "edited", "same"):
+        store.cook(name, skill_source(name, "v1"), f"https://example.com/{name}", "http", [])
+    store.flavor_path("edited").write_text("Be brief\n")
+    live_md = store.skill_dir("edited") / "live" / "SKILL.md"
+    live_md.write_text("# edited\n\nlocal tweak\n\n## Local Flavor\n\nBe brief\n")
+    remotes = {
+        "plain": skill_source("plain", "v2"),
+        "edited": skill_source("edited", "v2"),
+        "same": skill_source("same", "v1"),
+    }
+
+    monkeypatch.setattr(sync_cmd, "ensure_config", lambda scope="auto": {})
+    monkeypatch.setattr(sync_cmd.ui, "info", lambda _m: None)
+    monkeypatch.setattr(sync_cmd, "cleanup_fetched", lambda _p: None)
+    monkeypatch.setattr(
+        sync_cmd.remote, "fetch", lambda url, **_k: (remotes[url.rsplit("/", 1)[-1]], "http")
+    )
+    monkeypatch.setattr(
+        sync_cmd.ui, "choose", lambda *_a: (_ for _ in ()).throw(AssertionError("prompted"))
+    )
+    before = {name: store.load_meta(name)["base_sha256"] for name in remotes}
+    report = tmp_path / "report.ndjson"
+
+    sync_cmd.run_batch(None, policy="auto-safe", report=str(report))
+
+    records = [json.loads(line) for line in report.read_text().splitlines()]
+    by_name = {r["name"]: r for r in records if "name" in r}
+    assert [by_name[n]["status"] for n in ("edited", "plain", "same")] == [
+        "conflict",
+        "updated",
+        "up-to-date",
+    ]
+    assert by_name["plain"]["base_sha256_before"] == before["plain"]
+    assert by_name["plain"]["base_sha256_after"] == store.load_meta("plain")["base_sha256"]
+    assert by_name["plain"]["base_sha256_after"] == by_name["plain"]["remote_sha256"]
+    assert by_name["plain"]["base_sha256_after"] != before["plain"]
+    assert by_name["edited"]["base_sha256_after"] == before["edited"]
+    assert "local tweak" in live_md.read_text()
+    assert records[-1] == {
+        "summary": {"conflict": 1, "updated": 1, "up-to-date": 1},
+        "policy": "auto-safe",
+    }
+
+
+def test_run_batch_shares_commit_lookups_between_precheck_and_metadata(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_paths: dict[str, Path]
+) -> None:
+    old_sha, new_sha = "a" * 40, "b" * 40
+    for name in ("alpha", "beta"):
+        source = tmp_path / "sources" / name
+        _write_skill(source, f"# {name}\n\nv1\n")
+        store.cook(
+            name,
+            source,
+            f"https://github.com/acme/repo/tree/main/skills/{name}",
+            "github",
+            [],
+            commit_sha=old_sha,
+        )
+    lookups: list[str] = []
+
+    def fake_fetch_repo_paths(sources: list[str]) -> list[Path]:
+        fetched = []
+        for source in sources:
+            path = tmp_path / "fetched" / source.rsplit("/", 1)[-1] / "skill"
+            _write_skill(path, "# upstream\n\nv2\n")
+            fetched.append(path)
+        return fetched
+
+    monkeypatch.setattr(sync_cmd, "ensure_config", lambda scope="auto": {})
+    monkeypatch.setattr(sync_cmd.ui, "info", lambda _m: None)
+    monkeypatch.setattr(sync_cmd, "cleanup_fetched", lambda _p: None)
+    monkeypatch.setattr(sync_cmd.remote, "fetch_repo_paths", fake_fetch_repo_paths)
+    monkeypatch.setattr(
+        sync_cmd.remote, "_lookup_commit", lambda _o, _r, ref: lookups.append(ref) or new_sha
+    )
+    monkeypatch.setattr(
+        sync_cmd.remote,
+        "_resolve_github_commit",
+        lambda *_a: (_ for _ in ()).throw(AssertionError("REST lookup repeated")),
+    )
+
+    sync_cmd.run_batch(None, policy="auto-safe", report=str(tmp_path / "report.ndjson"))
+
+    assert lookups == ["main"]
+    assert [store.load_meta(n)["source_commit_sha"] for n in ("alpha", "beta")] == [
+        new_sha,
+        new_sha,
+    ]
+
+
+def test_sync_one_skips_fetch_when_upstream_commit_unchanged(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    messages: list[str] = []
+    monkeypatch.setattr(sync_cmd.ui, "info", lambda _m: None)
+    monkeypatch.setattr(sync_cmd.ui, "success", lambda msg: messages.append(msg))
+    monkeypatch.setattr(sync_cmd.remote, "current_commit_sha", lambda _url: "abc123")
+    monkeypatch.setattr(
+        sync_cmd.remote,
+        "fetch",
+        lambda _url, **_k: (_ for _ in ()).throw(AssertionError("fetch should be skipped")),
+    )
+
+    sync_cmd._sync_one(
+        {
+            "name": "pinned",
+            "remote_url": "https://github.com/acme/repo/tree/main/skills/pinned",
+            "base_sha256": "hash",
+            "source_commit_sha": "abc123",
+        }
+    )
+
+    assert messages == ["  pinned: up to date"]
+
+    fetched: list[str] = []
+    monkeypatch.setattr(sync_cmd.remote, "current_commit_sha", lambda _url: "def456")
+    monkeypatch.setattr(
+        sync_cmd.remote,
+        "fetch",
+        lambda url, **_k: fetched.append(url) or (_ for _ in ()).throw(RuntimeError("offline")),
+    )
+    monkeypatch.setattr(sync_cmd.ui, "warn", lambda _m: None)
+
+    sync_cmd._sync_one(
+        {
+            "name": "moved",
+            "remote_url": "https://github.com/acme/repo/tree/main/skills/moved",
+            "base_sha256": "hash",
+            "source_commit_sha": "abc123",
+        }
+    )
+
+    assert fetched == ["https://github.com/acme/repo/tree/main/skills/moved"]
+
+
+def test_iter_fetch_outcomes_groups_skills_by_repository_ref(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def tree(ref: str, name: str) -> str:
+        return f"https://github.com/acme/repo/tree/{ref}/skills/{name}"
+
+    skills = [
+        {"name": "alpha", "remote_url": tree("main", "alpha"), "base_sha256": "old"},
+        {"name": "beta", "remote_url": tree("dev", "beta"), "base_sha256": "old"},
+        {"name": "gamma", "remote_url": tree("main", "gamma"), "base_sha256": "old"},
+        {"name": "delta", "remote_url": tree("main", "delta"), "base_sha256": "old"},
+    ]
+    group_calls: list[list[str]] = []
+    single_calls: list[str] = []
+
+    def fake_fetch_repo_paths(sources: list[str]) -> list[object]:
+        group_calls.append(list(sources))
+        results: list[object] = []
+        for source in sources:
+            name = source.rsplit("/", 1)[-1]
+            if name == "delta":
+                results.append(sync_cmd.remote.FetchError("missing upstream"))
+                continue
+            fetched = tmp_path / name / "skill"
+            _write_skill(fetched, f"{name}\n")
+            results.append(fetched)
+        return results
+
+    def fake_fetch(url: str, **_kwargs) -> tuple[Path, str]:
+        single_calls.append(url)
+        fetched = tmp_path / "beta" / "skill"
+        _write_skill(fetched, "beta\n")
+        return fetched, "github"
+
+    monkeypatch.setattr(sync_cmd.remote, "fetch_repo_paths", fake_fetch_repo_paths)
+    monkeypatch.setattr(sync_cmd.remote, "fetch", fake_fetch)
+    monkeypatch.setattr(sync_cmd.store, "hash_dir", lambda _p: "new")
+
+    outcomes = list(sync_cmd._iter_fetch_outcomes(skills, jobs=4))
+
+    assert [o.meta["name"] for o in outcomes] == ["alpha", "beta", "gamma", "delta"]
+    assert group_calls == [[tree("main", "alpha"), tree("main", "gamma"), tree("main", "delta")]]
+    assert single_calls == [tree("dev", "beta")]
+    assert [o.fetched_dir.parent.name for o in outcomes[:3] if o.fetched_dir] == [
+        "alpha",
+        "beta",
+        "gamma",
+    ]
+    assert isinstance(outcomes[3].error, sync_cmd.remote.FetchError)
+
+
+def test_sync_records_new_commit_when_upstream_content_is_unchanged(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_paths: dict[str, Path]
+) -> None:
+    source = tmp_path / "source"
+    _write_skill(source, "# pinned\n\nsame\n")
+    url = "https://github.com/acme/repo/tree/main/skills/pinned"
+    store.cook("pinned", source, url, "github", [], commit_sha="a" * 40)
+    fetched: list[str] = []
+
+    def fake_fetch(url: str, **_kwargs) -> tuple[Path, str]:
+        fetched.append(url)
+        copy = tmp_path / f"fetch-{len(fetched)}" / "skill"
+        _write_skill(copy, "# pinned\n\nsame\n")
+        return copy, "github"
+
+    monkeypatch.setattr(sync_cmd.ui, "info", lambda _m: None)
+    monkeypatch.setattr(sync_cmd.ui, "success", lambda _m: None)
+    monkeypatch.setattr(sync_cmd.remote, "current_commit_sha", lambda _url: "b" * 40)
+    monkeypatch.setattr(sync_cmd.remote, "fetch", fake_fetch)
+
+    sync_cmd._sync_one(store.load_meta("pinned"))
+    assert store.load_meta("pinned")["source_commit_sha"] == "b" * 40
+    sync_cmd._sync_one(store.load_meta("pinned"))
+
+    assert fetched == [url]
+
+
+def test_sync_records_new_validators_when_content_is_unchanged(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, isolated_paths: dict[str, Path]
+) -> None:
+    source = tmp_path / "source"
+    _write_skill(source, "# cached\n\nsame\n")
+    url = "https://example.com/cached/SKILL.md"
+    store.cook("cached", source, url, "http", [])
+    meta = store.load_meta("cached")
+    meta["source_etag"] = '"v1"'
+    store.save_meta("cached", meta)
+    sent: list[str] = []
+
+    def fake_fetch(_url: str, *, validators: dict[str, str]) -> tuple[Path, str]:
+        sent.append(validators["source_etag"])
+        if validators["source_etag"] == '"v2"':
+            raise sync_cmd.remote.NotModifiedError("unchanged")
+        fetched = tmp_path / "fetch" / "skill"
+        _write_skill(fetched, "# cached\n\nsame\n")
+        (fetched.parent / sync_cmd.remote.VALIDATORS_FILENAME).write_text(
+            json.dumps({"source_etag": '"v2"'})
+        )
+        return fetched, "http"
+
+    monkeypatch.setattr(sync_cmd.ui, "info", lambda _m: None)
+    monkeypatch.setattr(sync_cmd.ui, "success", lambda _m: None)
+    monkeypatch.setattr(sync_cmd.remote, "fetch", fake_fetch)
+
+    sync_cmd._sync_one(store.load_meta("cached"))
+    sync_cmd._sync_one(store.load_meta("cached"))
+
+    assert sent == ['"v1"', '"v2"']
+    assert store.load_meta("cached")["source_etag"] == '"v2"'
+
+
+def test_sync_one_treats_not_modified_as_up_to_date(monkeypatch: pytest.MonkeyPatch) -> None:
+    messages: list[str] = []
+    sent: list[dict[str, str] | None] = []
+
+    def fake_fetch(_url: str, *, validators: dict[str, str] | None = None):
+        sent.append(validators)
+        raise sync_cmd.remote.NotModifiedError("unchanged")
+
+    monkeypatch.setattr(sync_cmd.ui, "info", lambda _m: None)
+    monkeypatch.setattr(sync_cmd.ui, "success", lambda msg: messages.append(msg))
+    monkeypatch.setattr(sync_cmd.remote, "fetch", fake_fetch)
+    monkeypatch.setattr(
+        sync_cmd,
+        "cleanup_fetched",
+        lambda _p: (_ for _ in ()).throw(AssertionError("nothing to clean up")),
+    )
+
+    sync_cmd._sync_one(
+        {
+            "name": "cached",
+            "remote_url": "https://example.com/SKILL.md",
+            "base_sha256": "hash",
+            "source_etag": '"abc"',
+            "source_last_modified": "",
+        }
+    )
+
+    assert messages == ["  cached: up to date"]
+    assert sent == [{"source_etag": '"abc"', "source_last_modified": ""}]
+
+
+def test_merge_scheduler_close_stops_running_merges(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+    import time
+
+    started = threading.Event()
+
+    def slow_merge(*_args, on_token, **_kwargs) -> str:
+        started.set()
+        for _ in range(500):
+            on_token("")
+            time.sleep(0.01)
+        return "finished"
+
+    monkeypatch.setattr(sync_cmd, "semantic_merge", slow_merge)
+    scheduler = sync_cmd.MergeScheduler(scope="global", jobs=1)
+    scheduler.submit("running", ("base", "remote", "flavor", "live"))
+    scheduler.submit("queued", ("base", "remote", "flavor", "live"))
+    assert started.wait(1)
+    running, _ = scheduler._pending["running"][1:]
+    queued, _ = scheduler._pending["queued"][1:]
+
+    began = time.perf_counter()
+    scheduler.close()
+
+    assert time.perf_counter() - began < 1
+    assert running.done() and isinstance(running.exception(), sync_cmd.MergeCancelled)
+    assert queued.cancelled()